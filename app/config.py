@@ -16,6 +16,28 @@ DEBUG = os.getenv("DEBUG", "true").lower() in ("true", "1", "yes")
 # Database
 DATABASE_URL = os.getenv("DATABASE_URL", f"sqlite:///{DATA_DIR / 'acchelper.db'}")
 
+# 스키마 지문이 같아도 부팅 시 migration/create_all/RLS/seed 를 강제로 다시 실행
+FORCE_DB_INIT = os.getenv("FORCE_DB_INIT", "false").lower() in ("true", "1", "yes")
+
+# Optional read replica for analytics/listing endpoints (get_read_db)
+DATABASE_READ_URL = os.getenv("DATABASE_READ_URL", "")
+READ_REPLICA_MAX_LAG_SECONDS = float(os.getenv("READ_REPLICA_MAX_LAG_SECONDS", "30"))
+READ_REPLICA_CHECK_INTERVAL = float(os.getenv("READ_REPLICA_CHECK_INTERVAL", "10"))
+
+# Connection pool (PostgreSQL)
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "10"))
+DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", "20"))
+DB_POOL_TIMEOUT = float(os.getenv("DB_POOL_TIMEOUT", "10"))
+DB_POOL_PRE_PING = os.getenv("DB_POOL_PRE_PING", "true").lower() in ("true", "1", "yes")
+DB_POOL_RECYCLE = int(os.getenv("DB_POOL_RECYCLE", "1800"))
+
+# SQLite connect-time PRAGMAs
+SQLITE_WAL = os.getenv("SQLITE_WAL", "true").lower() in ("true", "1", "yes")
+SQLITE_SYNCHRONOUS = os.getenv("SQLITE_SYNCHRONOUS", "NORMAL")
+SQLITE_BUSY_TIMEOUT_MS = int(os.getenv("SQLITE_BUSY_TIMEOUT_MS", "5000"))
+SQLITE_CACHE_SIZE_KB = int(os.getenv("SQLITE_CACHE_SIZE_KB", "20000"))
+SQLITE_MMAP_SIZE = int(os.getenv("SQLITE_MMAP_SIZE", str(128 * 1024 * 1024)))
+
 # Security
 SECRET_KEY = os.getenv("SECRET_KEY", "acc-helper-secret-key-change-in-production")
 SESSION_EXPIRE_HOURS = int(os.getenv("SESSION_EXPIRE_HOURS", "24"))
@@ -33,6 +55,16 @@ RATE_LIMIT_AUTH = os.getenv("RATE_LIMIT_AUTH", "30/minute")
 # Logging
 LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO")
 
+# Metrics (/api/metrics) — Prometheus 스크레이프용 Bearer 토큰 (미설정 시 최고 관리자만)
+METRICS_TOKEN = os.getenv("METRICS_TOKEN", "")
+
+# Profiling — Server-Timing 은 항상, 샘플링 프로파일은 최고 관리자가 X-Profile: 1 로 요청 시
+PROFILING_ENABLED = os.getenv("PROFILING_ENABLED", "true").lower() in ("true", "1", "yes")
+PROFILE_SAMPLE_INTERVAL_MS = float(os.getenv("PROFILE_SAMPLE_INTERVAL_MS", "1"))
+# 캡처한 프로파일 저장 위치 — 모든 uvicorn 워커가 공유해야 /api/profiles/{id} 가 어느 워커에서든 열린다
+PROFILE_DIR = Path(os.getenv("PROFILE_DIR", str(DATA_DIR / "profiles")))
+PROFILE_DIR.mkdir(parents=True, exist_ok=True)
+
 # SMTP (Naver)
 SMTP_USER = os.getenv("SMTP_USER", "")
 SMTP_PASSWORD = os.getenv("SMTP_PASSWORD", "")
@@ -45,6 +77,9 @@ RATE_LIMIT_PASSWORD_RESET = os.getenv("RATE_LIMIT_PASSWORD_RESET", "5/minute")
 # Toss Payments
 TOSS_CLIENT_KEY = os.getenv("TOSS_CLIENT_KEY", "")
 TOSS_SECRET_KEY = os.getenv("TOSS_SECRET_KEY", "")
+BILLING_RENEW_CONCURRENCY = int(os.getenv("BILLING_RENEW_CONCURRENCY", "8"))  # 자동갱신 동시 결제 수
+# 응답을 못 받은 pending 결제를 같은 Idempotency-Key 로 재확인하기까지 기다리는 시간
+BILLING_RENEW_PENDING_STALE_MINUTES = int(os.getenv("BILLING_RENEW_PENDING_STALE_MINUTES", "30"))
 
 # OpenAI / RAG
 OPENAI_API_KEY = os.getenv("OPENAI_API_KEY", "").strip()
@@ -53,6 +88,10 @@ CHAT_MODEL = os.getenv("OPENAI_CHAT_MODEL", os.getenv("CHAT_MODEL", "gpt-4o-mini
 RAG_TOP_K = int(os.getenv("RAG_TOP_K", "6"))
 RAG_MIN_SCORE = float(os.getenv("RAG_MIN_SCORE", "0.25"))
 
+# QA 중복 질문 경고 — 문자 bigram Dice 유사도 임계값, 다른 워커 변경 반영 주기(초)
+QA_DUPLICATE_THRESHOLD = float(os.getenv("QA_DUPLICATE_THRESHOLD", "0.6"))
+QA_DUPLICATE_INDEX_TTL = float(os.getenv("QA_DUPLICATE_INDEX_TTL", "300"))
+
 # JWT — no default; must be set via env in production
 _jwt_secret_raw = os.getenv("JWT_SECRET_KEY", "").strip()
 if not _jwt_secret_raw and APP_ENV != "development":
@@ -63,6 +102,12 @@ if not _jwt_secret_raw and APP_ENV != "development":
 JWT_SECRET_KEY = _jwt_secret_raw or SECRET_KEY  # dev-only fallback
 JWT_ALGORITHM = os.getenv("JWT_ALGORITHM", "HS256")
 JWT_EXPIRE_HOURS = int(os.getenv("JWT_EXPIRE_HOURS", "24"))
+JWT_CACHE_SIZE = int(os.getenv("JWT_CACHE_SIZE", "2048"))  # 검증된 토큰 LRU 크기 (0=비활성)
+
+# Password hashing (bcrypt) — 비용을 바꾸면 다음 로그인 때 자동으로 재해싱된다
+BCRYPT_ROUNDS = int(os.getenv("BCRYPT_ROUNDS", "12"))
+PASSWORD_HASH_WORKERS = int(os.getenv("PASSWORD_HASH_WORKERS", "2"))
+PASSWORD_HASH_MAX_PENDING = int(os.getenv("PASSWORD_HASH_MAX_PENDING", "16"))  # 실행+대기 합계 상한
 
 # Solapi (카카오 알림톡)
 SOLAPI_API_KEY = os.getenv("SOLAPI_API_KEY", "")
@@ -79,6 +124,20 @@ SOLAPI_MARKET_COMMENT_TEMPLATE_ID = os.getenv("SOLAPI_MARKET_COMMENT_TEMPLATE_ID
 SOLAPI_OTP_TEMPLATE_ID = os.getenv("SOLAPI_OTP_TEMPLATE_ID", "")
 SOLAPI_SENDER_NUMBER = os.getenv("SOLAPI_SENDER_NUMBER", "01035254754")
 
+# 솔라피 발송 — 공유 HTTP 커넥션 풀 + alimtalk_outbox 재시도 큐
+SOLAPI_TIMEOUT = float(os.getenv("SOLAPI_TIMEOUT", "10"))
+SOLAPI_OTP_TIMEOUT = float(os.getenv("SOLAPI_OTP_TIMEOUT", "3"))  # 인증번호는 짧게 한 번 시도 후 큐로
+SOLAPI_SEND_CONCURRENCY = int(os.getenv("SOLAPI_SEND_CONCURRENCY", "8"))
+SOLAPI_RETRY_BACKOFF = float(os.getenv("SOLAPI_RETRY_BACKOFF", "0.5"))
+SOLAPI_OUTBOX_MAX_ATTEMPTS = int(os.getenv("SOLAPI_OUTBOX_MAX_ATTEMPTS", "8"))
+SOLAPI_OUTBOX_POLL_SECONDS = float(os.getenv("SOLAPI_OUTBOX_POLL_SECONDS", "5"))
+# sending 상태로 이 시간(초) 넘게 결과가 없으면 유실로 보고 재발송 (중복 발송 가능)
+SOLAPI_OUTBOX_STALE_SECONDS = float(os.getenv("SOLAPI_OUTBOX_STALE_SECONDS", str(SOLAPI_TIMEOUT * 12)))
+# outbox 보존 — 발송이 끝난(sent/failed) 행의 payload(전화번호·본문)는 이 시간 뒤 비우고
+# (인증번호는 발송이 끝나는 즉시), 행 자체는 RETENTION_DAYS 일 뒤 삭제
+SOLAPI_OUTBOX_PAYLOAD_RETENTION_HOURS = float(os.getenv("SOLAPI_OUTBOX_PAYLOAD_RETENTION_HOURS", "24"))
+SOLAPI_OUTBOX_RETENTION_DAYS = float(os.getenv("SOLAPI_OUTBOX_RETENTION_DAYS", "30"))
+
 # 관리비 조회 — SMS(알림톡) 인증
 FEE_OTP_TTL_MINUTES = int(os.getenv("FEE_OTP_TTL_MINUTES", "5"))
 FEE_TOKEN_TTL_MINUTES = int(os.getenv("FEE_TOKEN_TTL_MINUTES", "30"))
@@ -101,10 +160,32 @@ COLLECTOR_API_KEY = os.getenv("COLLECTOR_API_KEY", "")
 # Upload
 UPLOAD_DIR = Path(os.getenv("UPLOAD_DIR", str(DATA_DIR / "uploads")))
 UPLOAD_DIR.mkdir(parents=True, exist_ok=True)
+IMAGE_PROCESS_WORKERS = int(os.getenv("IMAGE_PROCESS_WORKERS", "2"))
 
 # Static files
 STATIC_CACHE_MAX_AGE = int(os.getenv("STATIC_CACHE_MAX_AGE", "86400"))
 
+# CTA 퍼널 이벤트 버퍼 (메모리 → multi-row INSERT)
+CTA_BUFFER_MAX = int(os.getenv("CTA_BUFFER_MAX", "20000"))
+CTA_FLUSH_BATCH = int(os.getenv("CTA_FLUSH_BATCH", "500"))
+CTA_FLUSH_INTERVAL = float(os.getenv("CTA_FLUSH_INTERVAL", "2"))
+CTA_BATCH_MAX_EVENTS = int(os.getenv("CTA_BATCH_MAX_EVENTS", "100"))  # 요청 1건당 최대 이벤트 수
+
+# 공개 회사 카탈로그 캐시 — 다른 워커의 변경이 반영되기까지 최대 지연(초)
+COMPANY_CATALOG_TTL = float(os.getenv("COMPANY_CATALOG_TTL", "30"))
+
 # 1:1 톡 — 영업시간 판정용 공공데이터포털(특일 정보) API
 HOLIDAY_API_SERVICE_KEY = os.getenv("HOLIDAY_API_SERVICE_KEY", "")
+HOLIDAY_REFRESH_INTERVAL_SEC = int(os.getenv("HOLIDAY_REFRESH_INTERVAL_SEC", str(24 * 3600)))
 RATE_LIMIT_CHAT_TALK_SEND = os.getenv("RATE_LIMIT_CHAT_TALK_SEND", "20/minute")
+
+# 데이터 내보내기 — xlsx 요청 1건당 최대 행 수 (시트 한도 1,048,575 로도 제한). csv/ndjson 은 제한 없음
+EXPORT_MAX_ROWS = int(os.getenv("EXPORT_MAX_ROWS", "500000"))
+
+# Q&A 엑셀 일괄 등록 (백그라운드 작업) — 청크 크기 / 임베딩 배치 / 동시 임베딩 호출 수
+QA_IMPORT_BATCH = int(os.getenv("QA_IMPORT_BATCH", "500"))
+QA_IMPORT_EMBED_BATCH = int(os.getenv("QA_IMPORT_EMBED_BATCH", "100"))
+QA_IMPORT_EMBED_CONCURRENCY = int(os.getenv("QA_IMPORT_EMBED_CONCURRENCY", "4"))
+
+# 회사별 시스템 프롬프트 캐시 — 다른 워커의 변경을 확인(companies.prompt_version)하는 주기(초)
+PROMPT_CACHE_CHECK_INTERVAL = float(os.getenv("PROMPT_CACHE_CHECK_INTERVAL", "5"))
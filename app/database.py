@@ -1,10 +1,91 @@
-from sqlalchemy import create_engine
+import logging
+import threading
+import time
+
+from sqlalchemy import create_engine, event, text
+from sqlalchemy.exc import OperationalError
 from sqlalchemy.orm import DeclarativeBase, sessionmaker
 
-from app.config import DATABASE_URL
+from app.config import (
+    DATABASE_READ_URL,
+    DATABASE_URL,
+    DB_MAX_OVERFLOW,
+    DB_POOL_PRE_PING,
+    DB_POOL_RECYCLE,
+    DB_POOL_SIZE,
+    DB_POOL_TIMEOUT,
+    READ_REPLICA_CHECK_INTERVAL,
+    READ_REPLICA_MAX_LAG_SECONDS,
+    SQLITE_BUSY_TIMEOUT_MS,
+    SQLITE_CACHE_SIZE_KB,
+    SQLITE_MMAP_SIZE,
+    SQLITE_SYNCHRONOUS,
+    SQLITE_WAL,
+)
+
+logger = logging.getLogger("acchelper")
+
+
+def _is_memory_sqlite(url: str) -> bool:
+    return url in ("sqlite://", "sqlite:///:memory:") or "mode=memory" in url
+
+
+def _sqlite_pragmas(url: str) -> list[str]:
+    pragmas = [
+        f"PRAGMA busy_timeout={SQLITE_BUSY_TIMEOUT_MS}",
+        f"PRAGMA synchronous={SQLITE_SYNCHRONOUS}",
+        # negative cache_size = KiB
+        f"PRAGMA cache_size=-{SQLITE_CACHE_SIZE_KB}",
+        "PRAGMA temp_store=MEMORY",
+    ]
+    if not _is_memory_sqlite(url):
+        if SQLITE_WAL:
+            pragmas.insert(0, "PRAGMA journal_mode=WAL")
+        if SQLITE_MMAP_SIZE:
+            pragmas.append(f"PRAGMA mmap_size={SQLITE_MMAP_SIZE}")
+    return pragmas
+
+
+def build_engine(url: str, **overrides):
+    """Create an engine with the env-driven pool / PRAGMA profile.
 
-_connect_args = {"check_same_thread": False} if DATABASE_URL.startswith("sqlite") else {}
-engine = create_engine(DATABASE_URL, connect_args=_connect_args)
+    PostgreSQL: pool_size / max_overflow / pool_timeout / pool_pre_ping / pool_recycle
+    SQLite: connect-time PRAGMAs (WAL, synchronous, cache_size, mmap_size, busy_timeout)
+    """
+    if url.startswith("sqlite"):
+        kwargs = {
+            "connect_args": {
+                "check_same_thread": False,
+                "timeout": SQLITE_BUSY_TIMEOUT_MS / 1000,
+            },
+        }
+        kwargs.update(overrides)
+        eng = create_engine(url, **kwargs)
+        pragmas = _sqlite_pragmas(url)
+
+        @event.listens_for(eng, "connect")
+        def _set_sqlite_pragmas(dbapi_conn, connection_record):
+            cursor = dbapi_conn.cursor()
+            try:
+                for stmt in pragmas:
+                    cursor.execute(stmt)
+            finally:
+                cursor.close()
+
+        return eng
+
+    kwargs = {
+        "pool_size": DB_POOL_SIZE,
+        "max_overflow": DB_MAX_OVERFLOW,
+        "pool_timeout": DB_POOL_TIMEOUT,
+        "pool_pre_ping": DB_POOL_PRE_PING,
+        "pool_recycle": DB_POOL_RECYCLE,
+    }
+    kwargs.update(overrides)
+    return create_engine(url, **kwargs)
+
+
+engine = build_engine(DATABASE_URL)
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
 
@@ -18,3 +99,96 @@ def get_db():
         yield db
     finally:
         db.close()
+
+
+# ── Read replica (optional) ──
+# DATABASE_READ_URL 이 설정되면 통계/목록 같은 읽기 전용 엔드포인트가 get_read_db 로
+# 복제본을 사용한다. 복제본이 응답하지 않거나 복제 지연이 READ_REPLICA_MAX_LAG_SECONDS 를
+# 넘으면 (검사 결과를 READ_REPLICA_CHECK_INTERVAL 초 동안 캐시) primary 로 폴백한다.
+
+read_engine = build_engine(DATABASE_READ_URL) if DATABASE_READ_URL else None
+ReadSessionLocal = (
+    sessionmaker(autocommit=False, autoflush=False, bind=read_engine) if read_engine else None
+)
+
+
+class _ReplicaHealth:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._checked_at = 0.0
+        self._healthy = False
+        self.lag_seconds: float | None = None
+
+    def _probe(self) -> bool:
+        with read_engine.connect() as conn:
+            if read_engine.dialect.name != "postgresql":
+                conn.execute(text("SELECT 1"))
+                self.lag_seconds = None
+                return True
+            lag = conn.execute(text(
+                "SELECT CASE WHEN pg_is_in_recovery() "
+                "THEN EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()) "
+                "ELSE 0 END"
+            )).scalar()
+        self.lag_seconds = float(lag) if lag is not None else None
+        return self.lag_seconds is None or self.lag_seconds <= READ_REPLICA_MAX_LAG_SECONDS
+
+    def is_healthy(self) -> bool:
+        now = time.monotonic()
+        if now - self._checked_at < READ_REPLICA_CHECK_INTERVAL:
+            return self._healthy
+        with self._lock:
+            if now - self._checked_at < READ_REPLICA_CHECK_INTERVAL:
+                return self._healthy
+            try:
+                healthy = self._probe()
+            except Exception as exc:
+                logger.warning("Read replica unavailable, using primary: %s", exc)
+                healthy = False
+            if healthy != self._healthy:
+                logger.info("Read replica healthy=%s lag=%s", healthy, self.lag_seconds)
+            self._healthy = healthy
+            self._checked_at = time.monotonic()
+            return healthy
+
+    def mark_unhealthy(self) -> None:
+        with self._lock:
+            self._healthy = False
+            self._checked_at = time.monotonic()
+
+
+replica_health = _ReplicaHealth()
+
+
+def get_read_db():
+    """Read-only session: replica when configured and healthy, else primary."""
+    if ReadSessionLocal is None or not replica_health.is_healthy():
+        yield from get_db()
+        return
+    db = ReadSessionLocal()
+    try:
+        yield db
+    except OperationalError:
+        replica_health.mark_unhealthy()
+        raise
+    finally:
+        db.close()
+
+
+def pool_status(eng=None) -> dict:
+    """Snapshot of connection pool usage for monitoring."""
+    pool = (eng or engine).pool
+    status = {"class": type(pool).__name__}
+    for key, attr in (
+        ("size", "size"),
+        ("checked_out", "checkedout"),
+        ("checked_in", "checkedin"),
+        ("overflow", "overflow"),
+    ):
+        fn = getattr(pool, attr, None)
+        if callable(fn):
+            status[key] = max(fn(), 0)
+    if "size" in status:
+        status["max_overflow"] = getattr(pool, "_max_overflow", None)
+        status["timeout"] = getattr(pool, "_timeout", None)
+    return status
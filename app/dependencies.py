@@ -3,7 +3,7 @@ from sqlalchemy import text
 from sqlalchemy.orm import Session
 
 from app.database import get_db
-from app.services.jwt_service import decode_token
+from app.services.jwt_service import decode_token_cached
 
 
 def _extract_token(request: Request, session_token: str | None = Cookie(None)) -> str | None:
@@ -14,12 +14,28 @@ def _extract_token(request: Request, session_token: str | None = Cookie(None)) -
     return session_token
 
 
+def get_auth_payload(request: Request) -> dict | None:
+    """Resolve the request's JWT once and memoise it on request.state.
+
+    All auth dependencies read from here, so a token is verified at most once per
+    request (and usually not at all, thanks to the verified-token LRU).
+    """
+    try:
+        return request.state.auth_payload
+    except AttributeError:
+        pass
+    token = _extract_token(request, request.cookies.get("session_token"))
+    payload = decode_token_cached(token) if token else None
+    request.state.auth_token_present = bool(token)
+    request.state.auth_payload = payload
+    return payload
+
+
 def require_auth(request: Request, session_token: str | None = Cookie(None)) -> dict:
     """Require any authenticated user via JWT."""
-    token = _extract_token(request, session_token)
-    if not token:
+    payload = get_auth_payload(request)
+    if not request.state.auth_token_present:
         raise HTTPException(status_code=401, detail="로그인이 필요합니다.")
-    payload = decode_token(token)
     if not payload:
         raise HTTPException(status_code=401, detail="인증이 만료되었습니다. 다시 로그인해 주세요.")
     return payload
@@ -36,10 +52,7 @@ def require_admin(request: Request, session_token: str | None = Cookie(None)) ->
 
 def optional_admin(request: Request, session_token: str | None = Cookie(None)) -> dict | None:
     """Return admin payload if valid admin JWT present, else None (no error)."""
-    token = _extract_token(request, session_token)
-    if not token:
-        return None
-    payload = decode_token(token)
+    payload = get_auth_payload(request)
     if not payload:
         return None
     if payload.get("role") not in ("admin", "super_admin"):
@@ -58,10 +71,10 @@ def require_super_admin(request: Request, session_token: str | None = Cookie(Non
 
 def require_fee_token(request: Request, dong: str, ho: str, company_id: int = 1) -> dict:
     """관리비 조회용 JWT 검증. scope='fee'이며 토큰의 company_id/dong/ho가 쿼리 파라미터와 일치해야 함."""
-    token = _extract_token(request, None)
-    if not token:
+    # 관리비 토큰은 Authorization 헤더로만 받는다 (쿠키 세션 토큰 무시)
+    if not request.headers.get("authorization", "").startswith("Bearer "):
         raise HTTPException(status_code=401, detail="인증이 필요합니다. 인증번호를 다시 확인해 주세요.")
-    payload = decode_token(token)
+    payload = get_auth_payload(request)
     if not payload or payload.get("scope") != "fee":
         raise HTTPException(status_code=401, detail="인증이 만료되었습니다. 다시 인증해 주세요.")
     norm_dong = dong.strip().lstrip("0") or dong.strip()
@@ -87,13 +100,11 @@ def get_tenant_db(
     db: Session = Depends(get_db),
 ) -> Session:
     """Get a DB session with RLS tenant_id set (PostgreSQL only)."""
-    token = _extract_token(request, session_token)
-    if token:
-        payload = decode_token(token)
-        if payload:
-            company_id = payload.get("company_id", 0)
-            try:
-                db.execute(text(f"SET LOCAL app.tenant_id = '{company_id}'"))
-            except Exception:
-                pass  # SQLite — no RLS
+    payload = get_auth_payload(request)
+    if payload:
+        company_id = payload.get("company_id", 0)
+        try:
+            db.execute(text(f"SET LOCAL app.tenant_id = '{company_id}'"))
+        except Exception:
+            pass  # SQLite — no RLS
     return db
@@ -7,15 +7,18 @@ from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.middleware.gzip import GZipMiddleware
 from fastapi.middleware.trustedhost import TrustedHostMiddleware
-from fastapi.responses import FileResponse, HTMLResponse
+from fastapi.responses import HTMLResponse, JSONResponse
 from fastapi.staticfiles import StaticFiles
 from slowapi import _rate_limit_exceeded_handler
 from slowapi.errors import RateLimitExceeded
 from sqlalchemy import text
 
-from app.config import APP_ENV, CORS_ORIGINS, DATABASE_URL, LOG_LEVEL, TRUSTED_HOSTS
-from app.database import Base, SessionLocal, engine
-from app.middleware import RequestLoggingMiddleware, SecurityHeadersMiddleware, setup_logging
+from app.config import APP_ENV, CORS_ORIGINS, DATABASE_URL, FORCE_DB_INIT, LOG_LEVEL, TRUSTED_HOSTS
+from app.database import Base, SessionLocal, engine, read_engine, replica_health
+from app import metrics
+from app.middleware import (
+    MetricsMiddleware, RequestLoggingMiddleware, SecurityHeadersMiddleware, setup_logging,
+)
 from app.migrate import run_migration
 from app.models import (
     AdminActivityLog, AdminUser, BillingKey, ChatLog, Company,
@@ -23,6 +26,7 @@ from app.models import (
     TenantQuota, TenantUsageMonthly, UnansweredQuestion,
 )
 from app.models.cta_click_log import CtaClickLog
+from app.profiling import ServerTimingMiddleware, instrument_engine
 from app.rate_limit import limiter
 from app.routers import (
     activity_logs, admin_dashboard, admins, auth, billing, chat,
@@ -34,13 +38,24 @@ from app.routers import super_admin as super_admin_router
 from app.routers import unanswered_questions as unanswered_questions_router
 from app.routers import upload as upload_router
 from app.routers import cta_logs as cta_logs_router
+from app.routers import funnel as funnel_router
 from app.routers import market as market_router
 from app.routers import complaints as complaints_router
 from app.routers import collector as collector_router
 from app.routers import fee as fee_router
 from app.routers import chat_talk as chat_talk_router
+from app.routers import metrics as metrics_router
+from app.routers import profiles as profiles_router
+from app.routers import exports as exports_router
 from app.rls import setup_rls
+from app.schema_version import compute_fingerprint, get_applied_fingerprint, mark_applied, startup_lock
 from app.seed import seed_data
+from app.static_assets import StaticAssetStore
+from app.services.auth_service import PasswordHasherBusy, shutdown_password_pool
+from app.services.image_upload import shutdown_image_pool
+from app.services import qa_search, solapi_service
+from app.services.business_hours import holiday_calendar
+from app.services.cta_ingest import buffer as cta_buffer
 
 logger = logging.getLogger("acchelper")
 
@@ -48,6 +63,8 @@ STATIC_DIR = Path(__file__).resolve().parent.parent / "static"
 
 _start_time: float = 0.0
 
+static_assets = StaticAssetStore(STATIC_DIR)
+
 INDEX_STATEMENTS = [
     "CREATE INDEX IF NOT EXISTS ix_qa_knowledge_category ON qa_knowledge (category)",
     "CREATE INDEX IF NOT EXISTS ix_qa_knowledge_is_active ON qa_knowledge (is_active)",
@@ -66,6 +83,21 @@ INDEX_STATEMENTS = [
 ]
 
 
+def _ensure_sqlite_indexes():
+    with engine.connect() as conn:
+        for stmt in INDEX_STATEMENTS:
+            conn.execute(text(stmt))
+        conn.commit()
+
+
+def _seed():
+    db = SessionLocal()
+    try:
+        seed_data(db)
+    finally:
+        db.close()
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     global _start_time
@@ -76,35 +108,70 @@ async def lifespan(app: FastAPI):
     masked_url = DATABASE_URL[:30] + "..." if len(DATABASE_URL) > 30 else DATABASE_URL
     logger.info("Starting AccHelper (env=%s, db_type=%s, url=%s)", APP_ENV, db_type, masked_url)
 
-    try:
-        # Run migration before create_all
-        run_migration(engine)
-
-        Base.metadata.create_all(bind=engine)
+    steps: dict[str, float] = {}
 
-        # Manual index creation only needed for SQLite migration path.
-        # PostgreSQL gets indexes from model index=True via create_all.
-        if DATABASE_URL.startswith("sqlite"):
-            with engine.connect() as conn:
-                for stmt in INDEX_STATEMENTS:
-                    conn.execute(text(stmt))
-                conn.commit()
-            logger.info("SQLite indexes ensured")
+    def _timed(name: str, fn, *args):
+        t0 = time.perf_counter()
+        fn(*args)
+        steps[name] = (time.perf_counter() - t0) * 1000
 
-        # Setup RLS for PostgreSQL
-        setup_rls(engine)
-
-        db = SessionLocal()
-        try:
-            seed_data(db)
-        finally:
-            db.close()
+    try:
+        fingerprint = compute_fingerprint(
+            Base.metadata, (*INDEX_STATEMENTS, *qa_search.SQLITE_STATEMENTS, *qa_search.PG_STATEMENTS)
+        )
+        with startup_lock(engine):
+            t0 = time.perf_counter()
+            applied = None if FORCE_DB_INIT else get_applied_fingerprint(engine)
+            steps["version_check"] = (time.perf_counter() - t0) * 1000
+
+            if applied == fingerprint:
+                logger.info("Schema up to date (%s) — skipping migration/RLS/seed", fingerprint[:8])
+            else:
+                # Run migration before create_all
+                _timed("migrate", run_migration, engine)
+                _timed("create_all", Base.metadata.create_all, engine)
+
+                # Manual index creation only needed for SQLite migration path.
+                # PostgreSQL gets indexes from model index=True via create_all.
+                if DATABASE_URL.startswith("sqlite"):
+                    _timed("sqlite_indexes", _ensure_sqlite_indexes)
+                    logger.info("SQLite indexes ensured")
+
+                # Full-text search index (FTS5 / pg_trgm) for the QA admin list
+                _timed("qa_search", qa_search.setup, engine)
+
+                # Setup RLS for PostgreSQL
+                _timed("rls", setup_rls, engine)
+                _timed("seed", _seed)
+
+                mark_applied(engine, fingerprint)
+                logger.info("Schema version %s applied (was %s)", fingerprint[:8], (applied or "none")[:8])
 
         logger.info("Database ready")
     except Exception as exc:
         logger.error("Database init failed: %s", exc)
 
+    _timed("static_assets", static_assets.load)
+    static_assets.start_precompress()
+    try:
+        _timed("holidays", holiday_calendar.load_from_db)
+    except Exception as exc:
+        logger.error("Holiday calendar preload failed: %s", exc)
+    holiday_calendar.start()
+    cta_buffer.start()
+    solapi_service.dispatcher.start()
+    logger.info(
+        "Startup timings: %s total=%.0fms",
+        " ".join(f"{k}={v:.0f}ms" for k, v in steps.items()),
+        (time.time() - _start_time) * 1000,
+    )
+
     yield
+    shutdown_image_pool()
+    shutdown_password_pool()
+    solapi_service.shutdown()
+    cta_buffer.stop()
+    await holiday_calendar.stop()
     logger.info("Shutting down AccHelper")
 
 
@@ -113,7 +180,18 @@ app = FastAPI(title="경리 도우미 (Accounting Helper)", lifespan=lifespan)
 app.state.limiter = limiter
 app.add_exception_handler(RateLimitExceeded, _rate_limit_exceeded_handler)
 
+
+@app.exception_handler(PasswordHasherBusy)
+async def _password_hasher_busy_handler(request: Request, exc: PasswordHasherBusy):
+    return JSONResponse(
+        status_code=503,
+        content={"detail": "요청이 많아 처리할 수 없습니다. 잠시 후 다시 시도해 주세요."},
+        headers={"Retry-After": "2"},
+    )
+
 # Middleware (order matters: last added = first executed)
+app.add_middleware(ServerTimingMiddleware)
+app.add_middleware(MetricsMiddleware)
 app.add_middleware(RequestLoggingMiddleware)
 app.add_middleware(SecurityHeadersMiddleware)
 app.add_middleware(GZipMiddleware, minimum_size=500)
@@ -142,19 +220,30 @@ app.include_router(super_admin_router.router)
 app.include_router(unanswered_questions_router.router)
 app.include_router(upload_router.router)
 app.include_router(cta_logs_router.router)
+app.include_router(funnel_router.router)
 app.include_router(market_router.router)
 app.include_router(complaints_router.router)
 app.include_router(collector_router.router)
 app.include_router(fee_router.router)
 app.include_router(chat_talk_router.router)
+app.include_router(metrics_router.router)
+app.include_router(profiles_router.router)
+app.include_router(exports_router.router)
+
+metrics.register_engine_pool(engine)
+instrument_engine(engine)
+if read_engine is not None:
+    metrics.register_engine_pool(read_engine, "replica")
+    metrics.register_replica_health(replica_health)
+    instrument_engine(read_engine)
 
 from app.config import UPLOAD_DIR
 app.mount("/uploads", StaticFiles(directory=str(UPLOAD_DIR)), name="uploads")
 
 if (STATIC_DIR / "css").exists():
-    app.mount("/css", StaticFiles(directory=str(STATIC_DIR / "css")), name="css")
+    app.mount("/css", static_assets.mount("/css"), name="css")
 if (STATIC_DIR / "js").exists():
-    app.mount("/js", StaticFiles(directory=str(STATIC_DIR / "js")), name="js")
+    app.mount("/js", static_assets.mount("/js"), name="js")
 
 
 @app.get("/api/health")
@@ -177,52 +266,40 @@ def health_check():
     }
 
 
-_NO_CACHE = "no-cache, no-store, must-revalidate"
-
 if STATIC_DIR.exists():
 
     @app.get("/", response_class=HTMLResponse)
-    async def serve_index():
-        response = FileResponse(str(STATIC_DIR / "index.html"))
-        response.headers["Cache-Control"] = _NO_CACHE
-        return response
+    async def serve_index(request: Request):
+        return static_assets.page_response(request, "index.html")
 
     @app.get("/login.html", response_class=HTMLResponse)
-    async def serve_login():
-        response = FileResponse(str(STATIC_DIR / "login.html"))
-        response.headers["Cache-Control"] = _NO_CACHE
-        return response
+    async def serve_login(request: Request):
+        return static_assets.page_response(request, "login.html")
 
     @app.get("/register.html", response_class=HTMLResponse)
-    async def serve_register():
-        response = FileResponse(str(STATIC_DIR / "register.html"))
-        response.headers["Cache-Control"] = _NO_CACHE
-        return response
+    async def serve_register(request: Request):
+        return static_assets.page_response(request, "register.html")
 
     @app.get("/admin.html", response_class=HTMLResponse)
-    async def serve_admin():
-        response = FileResponse(str(STATIC_DIR / "admin.html"))
-        response.headers["Cache-Control"] = _NO_CACHE
-        return response
+    async def serve_admin(request: Request):
+        return static_assets.page_response(request, "admin.html")
 
     @app.get("/privacy.html", response_class=HTMLResponse)
-    async def serve_privacy():
-        return FileResponse(str(STATIC_DIR / "privacy.html"))
+    async def serve_privacy(request: Request):
+        return static_assets.page_response(request, "privacy.html")
 
     @app.get("/terms.html", response_class=HTMLResponse)
-    async def serve_terms():
-        return FileResponse(str(STATIC_DIR / "terms.html"))
+    async def serve_terms(request: Request):
+        return static_assets.page_response(request, "terms.html")
 
     @app.get("/copyright.html", response_class=HTMLResponse)
-    async def serve_copyright():
-        return FileResponse(str(STATIC_DIR / "copyright.html"))
+    async def serve_copyright(request: Request):
+        return static_assets.page_response(request, "copyright.html")
 
     @app.get("/contact.html", response_class=HTMLResponse)
-    async def serve_contact():
-        return FileResponse(str(STATIC_DIR / "contact.html"))
+    async def serve_contact(request: Request):
+        return static_assets.page_response(request, "contact.html")
 
     @app.get("/billing.html", response_class=HTMLResponse)
-    async def serve_billing():
-        response = FileResponse(str(STATIC_DIR / "billing.html"))
-        response.headers["Cache-Control"] = _NO_CACHE
-        return response
+    async def serve_billing(request: Request):
+        return static_assets.page_response(request, "billing.html")
@@ -0,0 +1,238 @@
+"""In-process metrics registry with Prometheus text exposition.
+
+외부 의존성 없이 Counter / Histogram 과 scrape 시점에 값을 읽는 Gauge 콜백을 제공한다.
+sync 엔드포인트는 threadpool 에서 돌기 때문에 모든 갱신은 lock 으로 보호한다.
+
+    from app import metrics
+    metrics.inc("cache_requests_total", cache="prompt", result="hit")
+    with metrics.timer("rag_stage_duration_seconds", stage="embed"):
+        ...
+"""
+
+import bisect
+import threading
+import time
+from contextlib import contextmanager
+from typing import Callable, Iterable
+
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+LabelKey = tuple[tuple[str, str], ...]
+
+
+class _Histogram:
+    __slots__ = ("buckets", "counts", "sum", "count")
+
+    def __init__(self, buckets: tuple[float, ...]):
+        self.buckets = buckets
+        self.counts = [0] * len(buckets)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        idx = bisect.bisect_left(self.buckets, value)
+        if idx < len(self.counts):
+            self.counts[idx] += 1
+        self.sum += value
+        self.count += 1
+
+
+class MetricsRegistry:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._help: dict[str, tuple[str, str]] = {}
+        self._counters: dict[str, dict[LabelKey, float]] = {}
+        self._histograms: dict[str, dict[LabelKey, _Histogram]] = {}
+        self._buckets: dict[str, tuple[float, ...]] = {}
+        self._gauge_callbacks: dict[str, list[Callable[[], Iterable[tuple[dict, float]]]]] = {}
+
+    # ── registration ──
+
+    def describe(self, name: str, kind: str, help_text: str, buckets: tuple[float, ...] | None = None) -> None:
+        self._help[name] = (kind, help_text)
+        if buckets:
+            self._buckets[name] = buckets
+
+    def register_gauge(self, name: str, help_text: str, callback: Callable[[], Iterable[tuple[dict, float]]]) -> None:
+        """callback() -> [(labels, value), ...] — evaluated at scrape time."""
+        self._help[name] = ("gauge", help_text)
+        self._gauge_callbacks.setdefault(name, []).append(callback)
+
+    # ── updates ──
+
+    def inc(self, name: str, amount: float = 1.0, **labels) -> None:
+        key = tuple(sorted(labels.items()))
+        with self._lock:
+            series = self._counters.setdefault(name, {})
+            series[key] = series.get(key, 0.0) + amount
+
+    def observe(self, name: str, value: float, **labels) -> None:
+        key = tuple(sorted(labels.items()))
+        with self._lock:
+            series = self._histograms.setdefault(name, {})
+            hist = series.get(key)
+            if hist is None:
+                hist = series[key] = _Histogram(self._buckets.get(name, DEFAULT_BUCKETS))
+            hist.observe(value)
+
+    @contextmanager
+    def timer(self, name: str, **labels):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(name, time.perf_counter() - start, **labels)
+
+    # ── exposition ──
+
+    def render(self) -> str:
+        lines: list[str] = []
+        with self._lock:
+            counters = {n: dict(s) for n, s in self._counters.items()}
+            histograms = {
+                n: {k: (h.buckets, list(h.counts), h.sum, h.count) for k, h in s.items()}
+                for n, s in self._histograms.items()
+            }
+
+        for name in sorted(counters):
+            self._header(lines, name, "counter")
+            for key, value in sorted(counters[name].items()):
+                lines.append(f"{name}{_fmt_labels(key)} {_fmt_value(value)}")
+
+        for name in sorted(histograms):
+            self._header(lines, name, "histogram")
+            for key, (buckets, counts, total, count) in sorted(histograms[name].items()):
+                cumulative = 0
+                for bound, c in zip(buckets, counts):
+                    cumulative += c
+                    lines.append(f"{name}_bucket{_fmt_labels(key, le=_fmt_value(bound))} {cumulative}")
+                lines.append(f"{name}_bucket{_fmt_labels(key, le='+Inf')} {count}")
+                lines.append(f"{name}_sum{_fmt_labels(key)} {_fmt_value(total)}")
+                lines.append(f"{name}_count{_fmt_labels(key)} {count}")
+
+        for name in sorted(self._gauge_callbacks):
+            samples = []
+            for callback in self._gauge_callbacks[name]:
+                try:
+                    samples.extend(callback())
+                except Exception:
+                    continue
+            self._header(lines, name, "gauge")
+            for labels, value in samples:
+                lines.append(f"{name}{_fmt_labels(tuple(sorted(labels.items())))} {_fmt_value(value)}")
+
+        # cache hit ratio is derived from cache_requests_total for convenience
+        cache = counters.get("cache_requests_total", {})
+        if cache:
+            per_cache: dict[str, list[float]] = {}
+            for key, value in cache.items():
+                labels = dict(key)
+                hit_total = per_cache.setdefault(labels.get("cache", ""), [0.0, 0.0])
+                if labels.get("result") == "hit":
+                    hit_total[0] += value
+                hit_total[1] += value
+            lines.append("# HELP cache_hit_ratio Cache hits / lookups since process start")
+            lines.append("# TYPE cache_hit_ratio gauge")
+            for cache_name, (hits, total) in sorted(per_cache.items()):
+                ratio = hits / total if total else 0.0
+                lines.append(f'cache_hit_ratio{{cache="{_escape(cache_name)}"}} {_fmt_value(round(ratio, 4))}')
+
+        return "\n".join(lines) + "\n"
+
+    def _header(self, lines: list[str], name: str, default_kind: str) -> None:
+        kind, help_text = self._help.get(name, (default_kind, name))
+        lines.append(f"# HELP {name} {help_text}")
+        lines.append(f"# TYPE {name} {kind}")
+
+    def reset(self) -> None:
+        with self._lock:
+            self._counters.clear()
+            self._histograms.clear()
+
+
+def _escape(value: str) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _fmt_labels(key: LabelKey, **extra) -> str:
+    items = list(key) + list(extra.items())
+    if not items:
+        return ""
+    return "{" + ",".join(f'{k}="{_escape(v)}"' for k, v in items) + "}"
+
+
+def _fmt_value(value: float) -> str:
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+registry = MetricsRegistry()
+
+registry.describe("http_request_duration_seconds", "histogram", "HTTP request latency by route template and status")
+registry.describe("rag_stage_duration_seconds", "histogram", "search_qa_rag per-stage latency")
+registry.describe("openai_request_duration_seconds", "histogram", "OpenAI API call latency by model and kind")
+registry.describe("openai_requests_total", "counter", "OpenAI API calls by model, kind and outcome")
+registry.describe("openai_tokens_total", "counter", "OpenAI tokens consumed by model and kind")
+registry.describe("cache_requests_total", "counter", "Cache lookups by cache name and result (hit/miss)")
+registry.describe("cta_events_total", "counter", "CTA funnel events by result (accepted/invalid/dropped/flush_failed)")
+registry.describe("cta_flush_duration_seconds", "histogram", "CTA buffer multi-row INSERT latency")
+registry.describe("solapi_request_duration_seconds", "histogram", "Solapi send API call latency")
+registry.describe("solapi_requests_total", "counter", "Solapi send API calls by outcome")
+registry.describe("password_hash_duration_seconds", "histogram", "bcrypt hash/verify latency including pool queueing")
+registry.describe("password_hash_rejected_total", "counter", "bcrypt jobs rejected because the hashing pool was saturated")
+registry.describe("password_rehash_total", "counter", "Password hashes upgraded to the current bcrypt cost on login")
+
+inc = registry.inc
+observe = registry.observe
+timer = registry.timer
+
+
+def record_cache(cache: str, hit: bool) -> None:
+    registry.inc("cache_requests_total", cache=cache, result="hit" if hit else "miss")
+
+
+def record_openai(model: str, kind: str, seconds: float, tokens: int = 0, ok: bool = True) -> None:
+    from app.profiling import add_external
+
+    add_external(seconds)
+    registry.observe("openai_request_duration_seconds", seconds, model=model, kind=kind)
+    registry.inc("openai_requests_total", model=model, kind=kind, outcome="ok" if ok else "error")
+    if tokens:
+        registry.inc("openai_tokens_total", tokens, model=model, kind=kind)
+
+
+def register_engine_pool(engine, name: str = "primary") -> None:
+    """Expose SQLAlchemy QueuePool utilization as gauges."""
+
+    def _samples():
+        pool = engine.pool
+        labels = {"engine": name}
+        out = []
+        for metric, attr in (
+            ("size", "size"),
+            ("checked_out", "checkedout"),
+            ("checked_in", "checkedin"),
+            ("overflow", "overflow"),
+        ):
+            fn = getattr(pool, attr, None)
+            if callable(fn):
+                # QueuePool.overflow() is negative until the pool is full
+                out.append(({**labels, "state": metric}, float(max(fn(), 0))))
+        return out
+
+    registry.register_gauge("db_pool_connections", "SQLAlchemy pool connections by engine and state", _samples)
+
+
+def register_replica_health(health) -> None:
+    """Expose read-replica health and replication lag as gauges."""
+    registry.register_gauge(
+        "db_replica_healthy",
+        "1 when reads are routed to the replica, 0 when falling back to primary",
+        lambda: [({}, 1.0 if health.is_healthy() else 0.0)],
+    )
+    registry.register_gauge(
+        "db_replica_lag_seconds",
+        "Replication lag measured by the last replica health probe",
+        lambda: [({}, float(health.lag_seconds))] if health.lag_seconds is not None else [],
+    )
@@ -1,58 +1,159 @@
+import json
 import logging
 import time
 import uuid
+from urllib.parse import parse_qsl, urlencode
 
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.requests import Request
-from starlette.responses import Response
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
-from app.config import APP_ENV, STATIC_CACHE_MAX_AGE
+from app import metrics
+from app.config import APP_ENV
 
 logger = logging.getLogger("acchelper")
-
-
-class SecurityHeadersMiddleware(BaseHTTPMiddleware):
-    async def dispatch(self, request: Request, call_next):
-        response: Response = await call_next(request)
-
-        response.headers["X-Content-Type-Options"] = "nosniff"
-        response.headers["X-Frame-Options"] = "DENY"
-        response.headers["X-XSS-Protection"] = "1; mode=block"
-        response.headers["Referrer-Policy"] = "strict-origin-when-cross-origin"
-        response.headers["Permissions-Policy"] = "camera=(), microphone=(), geolocation=()"
-
-        if APP_ENV == "production":
-            response.headers["Strict-Transport-Security"] = (
-                "max-age=63072000; includeSubDomains"
-            )
-
-        path = request.url.path
-        if path.startswith("/css/") or path.startswith("/js/"):
-            response.headers["Cache-Control"] = f"public, max-age={STATIC_CACHE_MAX_AGE}"
-
-        return response
-
-
-class RequestLoggingMiddleware(BaseHTTPMiddleware):
-    async def dispatch(self, request: Request, call_next):
-        request_id = str(uuid.uuid4())[:8]
+access_logger = logging.getLogger("acchelper.access")
+
+_SECURITY_HEADERS = [
+    (b"x-content-type-options", b"nosniff"),
+    (b"x-frame-options", b"DENY"),
+    (b"x-xss-protection", b"1; mode=block"),
+    (b"referrer-policy", b"strict-origin-when-cross-origin"),
+    (b"permissions-policy", b"camera=(), microphone=(), geolocation=()"),
+]
+if APP_ENV == "production":
+    _SECURITY_HEADERS.append(
+        (b"strict-transport-security", b"max-age=63072000; includeSubDomains")
+    )
+
+# 액세스 로그에 값을 남기지 않을 쿼리 파라미터 (이름에 포함되면 마스킹, 대소문자 무시)
+# 예: /api/billing/success?customerKey=…&authKey=… (토스 빌링 인증키)
+_REDACTED_QUERY_PARTS = ("key", "token", "secret", "password", "auth", "code", "otp", "phone", "email")
+
+
+def _redact_query(query_string: bytes) -> str:
+    params = parse_qsl(query_string.decode("utf-8", "replace"), keep_blank_values=True)
+    return urlencode(
+        [
+            (name, "***" if any(part in name.lower() for part in _REDACTED_QUERY_PARTS) else value)
+            for name, value in params
+        ],
+        safe="*",
+    )
+
+
+class SecurityHeadersMiddleware:
+    """Pure ASGI: set security headers on http.response.start (streaming-safe)."""
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        async def send_wrapper(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                headers = MutableHeaders(scope=message)
+                for name, value in _SECURITY_HEADERS:
+                    headers[name.decode("latin-1")] = value.decode("latin-1")
+            await send(message)
+
+        await self.app(scope, receive, send_wrapper)
+
+
+class RequestLoggingMiddleware:
+    """Pure ASGI: assign X-Request-ID and emit one JSON access log per request.
+
+    duration_ms 는 응답 헤더 전송까지(ttfb_ms)와 본문 전송 완료까지를 모두 기록한다.
+    request_id 는 scope["state"] 에 넣어 request.state.request_id 로 접근 가능.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        request_id = uuid.uuid4().hex[:8]
+        scope.setdefault("state", {})["request_id"] = request_id
         start = time.perf_counter()
+        status_code = 500
+        ttfb_ms = None
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code, ttfb_ms
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                ttfb_ms = (time.perf_counter() - start) * 1000
+                headers = MutableHeaders(scope=message)
+                headers["X-Request-ID"] = request_id
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            elapsed_ms = (time.perf_counter() - start) * 1000
+            record = {
+                "req_id": request_id,
+                "method": scope["method"],
+                "path": scope["path"],
+                "status": status_code,
+                "duration_ms": round(elapsed_ms, 1),
+                "ttfb_ms": round(ttfb_ms, 1) if ttfb_ms is not None else None,
+            }
+            if scope.get("query_string"):
+                record["query"] = _redact_query(scope["query_string"])
+            client = scope.get("client")
+            if client:
+                record["client"] = client[0]
+            access_logger.info(json.dumps(record, ensure_ascii=False))
+
+
+def _route_template(scope: Scope) -> str:
+    """Route template (e.g. /api/qa/{qa_id}) to keep label cardinality bounded."""
+    route = scope.get("route")
+    path = getattr(route, "path", None)
+    if path:
+        return path
+    root_path = scope.get("root_path") or ""
+    if root_path:
+        return root_path + "/{path}"  # mounted static apps
+    return "unmatched"
+
+
+class MetricsMiddleware:
+    """Pure ASGI: observe request latency per (method, route template, status)."""
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
 
-        response: Response = await call_next(request)
-
-        elapsed_ms = (time.perf_counter() - start) * 1000
-        response.headers["X-Request-ID"] = request_id
-
-        logger.info(
-            "req_id=%s method=%s path=%s status=%d duration=%.1fms",
-            request_id,
-            request.method,
-            request.url.path,
-            response.status_code,
-            elapsed_ms,
-        )
-
-        return response
+        start = time.perf_counter()
+        status_code = 500
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            metrics.observe(
+                "http_request_duration_seconds",
+                time.perf_counter() - start,
+                method=scope["method"],
+                route=_route_template(scope),
+                status=str(status_code),
+            )
 
 
 def setup_logging(level: str = "INFO"):
@@ -95,6 +95,7 @@ def _run_pg_migration(engine: Engine):
         _pg_add_column_if_missing(conn, "companies", "enable_fee", "BOOLEAN DEFAULT FALSE")
         _pg_add_column_if_missing(conn, "companies", "collector_api_key", "VARCHAR(64)")
         _pg_add_column_if_missing(conn, "companies", "single_building_dong", "VARCHAR(10)")
+        _pg_add_column_if_missing(conn, "companies", "prompt_version", "INTEGER DEFAULT 0")
         # Backfill: 세종푸르지오시티 2차(company_id=1)는 단일동 아파트이므로 기존 프론트 하드코딩과
         # 동일하게 동을 '1동'으로 고정 (market-login.html/complaint.js의 이름 매칭 로직 대체)
         conn.execute(text(
@@ -142,6 +143,10 @@ def _run_pg_migration(engine: Engine):
         if _pg_table_exists(conn, "chat_logs"):
             _pg_add_column_if_missing(conn, "chat_logs", "used_rag", "BOOLEAN DEFAULT FALSE")
             _pg_add_column_if_missing(conn, "chat_logs", "evidence_ids", "TEXT DEFAULT ''")
+            conn.execute(text(
+                "CREATE INDEX IF NOT EXISTS ix_chat_logs_company_timestamp "
+                "ON chat_logs (company_id, timestamp, log_id)"
+            ))
 
         # market_posts table — is_hidden, hidden_reason, company_id
         if _pg_table_exists(conn, "market_posts"):
@@ -529,6 +534,7 @@ def run_migration(engine: Engine):
             _add_column_if_missing(conn, "companies", "enable_fee", "BOOLEAN DEFAULT 0")
             _add_column_if_missing(conn, "companies", "collector_api_key", "VARCHAR(64)")
             _add_column_if_missing(conn, "companies", "single_building_dong", "VARCHAR(10)")
+            _add_column_if_missing(conn, "companies", "prompt_version", "INTEGER DEFAULT 0")
             # Backfill: mark existing companies as approved
             conn.execute(text(
                 "UPDATE companies SET approval_status = 'approved' WHERE approval_status IS NULL"
@@ -17,6 +17,9 @@ from app.models.complaint_person import ComplaintPerson
 from app.models.fee_data import FeeEntry
 from app.models.chat_thread import ChatThread, ChatMessage
 from app.models.public_holiday import PublicHoliday
+from app.models.alimtalk_outbox import AlimtalkOutbox
+from app.models.cta_funnel import CtaFunnelHourly, CtaFunnelSessionStep
+from app.models.qa_import_job import QaImportJob
 
 __all__ = [
     "Company",
@@ -44,4 +47,8 @@ __all__ = [
     "ChatThread",
     "ChatMessage",
     "PublicHoliday",
+    "AlimtalkOutbox",
+    "CtaFunnelHourly",
+    "CtaFunnelSessionStep",
+    "QaImportJob",
 ]
@@ -0,0 +1,35 @@
+from datetime import datetime
+
+from sqlalchemy import DateTime, Index, Integer, String, Text
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.database import Base
+from app.utils import now_kst
+
+
+class AlimtalkOutbox(Base):
+    """솔라피 알림톡 발송 큐 겸 발송 기록.
+
+    status: pending → sending → sent | failed. 알림은 pending 으로 들어와 디스패처가 보내고,
+    일시 오류(5xx/타임아웃)면 다시 pending 으로 두고 next_attempt_at 이후 재시도한다.
+    인증번호만 요청 스레드에서 sending 으로 먼저 한 번 시도한다. expires_at 이 지난
+    메시지(예: 인증번호)는 재발송하지 않는다. sending 상태의 next_attempt_at 은 점유(발송 시작)
+    시각으로, 오래 머문 행은 디스패처가 pending 으로 되돌린다.
+    payload 는 보존 기간이 지나면 "{}" 로 비워지고, 행은 SOLAPI_OUTBOX_RETENTION_DAYS 뒤 삭제된다.
+    """
+
+    __tablename__ = "alimtalk_outbox"
+    __table_args__ = (Index("ix_alimtalk_outbox_status_next", "status", "next_attempt_at"),)
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    kind: Mapped[str] = mapped_column(String(40), nullable=False)
+    recipient: Mapped[str] = mapped_column(String(20), nullable=False)
+    payload: Mapped[str] = mapped_column(Text, nullable=False)
+    status: Mapped[str] = mapped_column(String(10), nullable=False, default="pending")
+    attempts: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    last_error: Mapped[str | None] = mapped_column(String(500), nullable=True)
+    provider_message_id: Mapped[str | None] = mapped_column(String(100), nullable=True)
+    next_attempt_at: Mapped[datetime | None] = mapped_column(DateTime, nullable=True)
+    expires_at: Mapped[datetime | None] = mapped_column(DateTime, nullable=True)
+    created_at: Mapped[datetime] = mapped_column(DateTime, default=now_kst)
+    sent_at: Mapped[datetime | None] = mapped_column(DateTime, nullable=True)
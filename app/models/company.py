@@ -39,6 +39,7 @@ class Company(Base):
     enable_fee: Mapped[bool] = mapped_column(Boolean, default=False)
     collector_api_key: Mapped[str | None] = mapped_column(String(64), unique=True, nullable=True)
     single_building_dong: Mapped[str | None] = mapped_column(String(10), nullable=True)
+    prompt_version: Mapped[int] = mapped_column(Integer, default=0)  # 프롬프트 템플릿 변경 시 증가
     created_at: Mapped[datetime] = mapped_column(DateTime, default=now_kst)
     updated_at: Mapped[datetime] = mapped_column(
         DateTime, default=now_kst, onupdate=now_kst
@@ -0,0 +1,50 @@
+from datetime import datetime
+
+from sqlalchemy import DateTime, Integer, PrimaryKeyConstraint, String, UniqueConstraint
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.database import Base
+
+
+class CtaFunnelHourly(Base):
+    """cta_click_logs 시간 단위 롤업.
+
+    events: 해당 시간·차원 조합의 이벤트 수
+    sessions: 해당 퍼널 단계에 (session_id, cta_type) 기준으로 *처음* 도달한 세션 수.
+    처음 도달한 시점에만 세므로 임의 기간을 SUM 해도 중복 없는 세션 수가 된다.
+    utm_* 는 UNIQUE 비교를 위해 NULL 대신 빈 문자열로 저장한다.
+    """
+
+    __tablename__ = "cta_funnel_hourly"
+    __table_args__ = (
+        UniqueConstraint(
+            "bucket_start", "page_path", "cta_type", "visitor_type", "device_type",
+            "utm_source", "utm_medium", "utm_campaign", "funnel_step",
+            name="uq_cta_funnel_hourly_dims",
+        ),
+    )
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    bucket_start: Mapped[datetime] = mapped_column(DateTime, nullable=False, index=True)
+    page_path: Mapped[str] = mapped_column(String(200), nullable=False)
+    cta_type: Mapped[str] = mapped_column(String(50), nullable=False)
+    visitor_type: Mapped[str] = mapped_column(String(20), nullable=False)
+    device_type: Mapped[str] = mapped_column(String(20), nullable=False)
+    utm_source: Mapped[str] = mapped_column(String(100), nullable=False, default="")
+    utm_medium: Mapped[str] = mapped_column(String(100), nullable=False, default="")
+    utm_campaign: Mapped[str] = mapped_column(String(100), nullable=False, default="")
+    funnel_step: Mapped[str] = mapped_column(String(30), nullable=False)
+    events: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    sessions: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+
+
+class CtaFunnelSessionStep(Base):
+    """세션별 퍼널 단계 최초 도달 시각 — 롤업의 sessions 를 증분 계산하기 위한 상태."""
+
+    __tablename__ = "cta_funnel_session_steps"
+    __table_args__ = (PrimaryKeyConstraint("session_id", "cta_type", "funnel_step"),)
+
+    session_id: Mapped[str] = mapped_column(String(100), nullable=False)
+    cta_type: Mapped[str] = mapped_column(String(50), nullable=False)
+    funnel_step: Mapped[str] = mapped_column(String(30), nullable=False)
+    first_at: Mapped[datetime] = mapped_column(DateTime, nullable=False)
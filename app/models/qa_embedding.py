@@ -1,12 +1,37 @@
 from sqlalchemy import Index, Integer, Text
 from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy.types import TypeDecorator
 
 from app.database import Base
 
-try:
-    from pgvector.sqlalchemy import Vector
-except ImportError:
-    Vector = None
+
+class LazyVector(TypeDecorator):
+    """pgvector Vector column that imports pgvector (and numpy) only on first use.
+
+    PostgreSQL 에서는 pgvector 의 Vector 타입으로 동작하고, 그 외(SQLite) 또는
+    pgvector 미설치 시에는 '[x,y,...]' 텍스트로 저장한다.
+    """
+
+    impl = Text
+    cache_ok = True
+
+    def __init__(self, dim: int):
+        super().__init__()
+        self.dim = dim
+
+    def load_dialect_impl(self, dialect):
+        if dialect.name == "postgresql":
+            try:
+                from pgvector.sqlalchemy import Vector
+            except ImportError:
+                return dialect.type_descriptor(Text())
+            return dialect.type_descriptor(Vector(self.dim))
+        return dialect.type_descriptor(Text())
+
+    def process_bind_param(self, value, dialect):
+        if value is None or dialect.name == "postgresql" or isinstance(value, str):
+            return value
+        return "[" + ",".join(str(float(x)) for x in value) + "]"
 
 
 class QaEmbedding(Base):
@@ -19,4 +44,4 @@ class QaEmbedding(Base):
     qa_id: Mapped[int] = mapped_column(Integer, nullable=False, unique=True, index=True)
     company_id: Mapped[int] = mapped_column(Integer, nullable=False)
     embedding_text: Mapped[str] = mapped_column(Text, nullable=False)
-    embedding = mapped_column(Vector(1536), nullable=True) if Vector else mapped_column(Text, nullable=True)
+    embedding = mapped_column(LazyVector(1536), nullable=True)
@@ -0,0 +1,36 @@
+from datetime import datetime
+
+from sqlalchemy import DateTime, Integer, String, Text
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.database import Base
+from app.utils import now_kst
+
+
+class QaImportJob(Base):
+    """QA 엑셀 일괄 등록 작업의 진행 상황.
+
+    작업 스레드가 주기적으로 갱신하고, 진행률 조회는 어느 워커에서든 이 행을 읽는다.
+    errors 는 행별 오류 목록(JSON, 최대 qa_import.MAX_ERRORS 건).
+    """
+
+    __tablename__ = "qa_import_jobs"
+
+    job_id: Mapped[str] = mapped_column(String(32), primary_key=True)
+    company_id: Mapped[int] = mapped_column(Integer, nullable=False, index=True)
+    filename: Mapped[str] = mapped_column(String(255), nullable=False, default="")
+    status: Mapped[str] = mapped_column(String(10), nullable=False, default="queued")
+    estimated_rows: Mapped[int | None] = mapped_column(Integer, nullable=True)
+    rows_read: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    created: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    skipped: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    failed: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    embedded: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    embedding_failed: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    errors: Mapped[str] = mapped_column(Text, nullable=False, default="[]")
+    errors_truncated: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    error: Mapped[str | None] = mapped_column(Text, nullable=True)
+    created_at: Mapped[datetime] = mapped_column(DateTime, default=now_kst, index=True)
+    updated_at: Mapped[datetime] = mapped_column(DateTime, default=now_kst)
+    started_at: Mapped[datetime | None] = mapped_column(DateTime, nullable=True)
+    finished_at: Mapped[datetime | None] = mapped_column(DateTime, nullable=True)
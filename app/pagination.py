@@ -0,0 +1,47 @@
+"""Opaque keyset (cursor) pagination helpers.
+
+OFFSET 페이지네이션은 뒤 페이지로 갈수록 앞의 행을 모두 건너뛰어야 하므로 느려진다.
+키셋 방식은 마지막으로 본 행의 정렬 키를 커서로 돌려주고, 다음 페이지는
+`WHERE (sort, id) < (:sort, :id)` 로 인덱스에서 바로 이어 읽는다.
+
+- QA 목록 (routers/qa.py): 관련도순 (score, qa_id), 기본순 (qa_id)
+- 상담 로그 (routers/feedback.py, chat.py): (timestamp, log_id)
+
+커서는 정렬 키 값을 '|' 로 이은 문자열을 URL-safe base64 로 감싼 것 — 클라이언트는
+내용을 해석하지 않고 그대로 돌려보내기만 한다.
+"""
+
+import base64
+from datetime import datetime
+
+from sqlalchemy import and_, or_
+
+
+def encode_cursor(*values) -> str:
+    raw = "|".join(v.isoformat() if isinstance(v, datetime) else str(v) for v in values)
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, *types) -> list:
+    """Decode and convert each part with the matching type (float, int, datetime).
+
+    Raises ValueError on a malformed cursor.
+    """
+    padded = cursor + "=" * (-len(cursor) % 4)
+    try:
+        parts = base64.urlsafe_b64decode(padded.encode()).decode().split("|")
+        if len(parts) != len(types):
+            raise ValueError("cursor arity")
+        return [
+            datetime.fromisoformat(p) if t is datetime else t(p)
+            for p, t in zip(parts, types)
+        ]
+    except Exception as exc:
+        raise ValueError("invalid cursor") from exc
+
+
+def after(sort_col, id_col, sort_value, id_value, descending: bool = True):
+    """Row-value comparison `(sort_col, id_col) </> (sort_value, id_value)` portable to SQLite."""
+    if descending:
+        return or_(sort_col < sort_value, and_(sort_col == sort_value, id_col < id_value))
+    return or_(sort_col > sort_value, and_(sort_col == sort_value, id_col > id_value))
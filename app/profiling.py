@@ -0,0 +1,279 @@
+"""Per-request Server-Timing and opt-in sampling profiler.
+
+모든 응답에 Server-Timing 헤더를 붙인다:
+    db;dur=12.3;desc="7 queries", ext;dur=210.0;desc="2 calls", app;dur=250.1
+
+최고 관리자가 `X-Profile: 1` 헤더 또는 `?__profile=1` 쿼리로 요청하면 해당 요청 동안
+스택 샘플링(기본 1ms 간격)을 수행해 결과를 PROFILE_DIR 에 파일로 저장하고(워커 간 공유,
+최근 MAX_STORED_PROFILES 개만 유지), 응답 헤더 X-Profile-Id 로 /api/profiles/{id}
+다운로드 경로를 알려준다.
+
+샘플 대상 스레드: 이벤트 루프 스레드 + 이 요청의 DB 쿼리를 실행한 threadpool 스레드.
+(sync 엔드포인트는 threadpool 에서 돌기 때문에 첫 쿼리 시점에 스레드가 등록된다.)
+"""
+
+import asyncio
+import contextvars
+import logging
+import os
+import re
+import sys
+import threading
+import time
+import uuid
+from collections import Counter
+from dataclasses import dataclass, field
+from urllib.parse import parse_qs
+
+from sqlalchemy import event
+from starlette.datastructures import MutableHeaders
+from starlette.requests import Request
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.config import PROFILE_DIR, PROFILE_SAMPLE_INTERVAL_MS, PROFILING_ENABLED
+from app.services.jwt_service import decode_token_cached
+
+logger = logging.getLogger("acchelper")
+
+MAX_STORED_PROFILES = 20
+MAX_PROFILE_SECONDS = 30.0
+
+
+@dataclass
+class RequestTimings:
+    start: float = field(default_factory=time.perf_counter)
+    db_count: int = 0
+    db_time: float = 0.0
+    ext_count: int = 0
+    ext_time: float = 0.0
+    thread_ids: set[int] = field(default_factory=set)
+
+    def server_timing(self) -> str:
+        total_ms = (time.perf_counter() - self.start) * 1000
+        return (
+            f'db;dur={self.db_time * 1000:.1f};desc="{self.db_count} queries", '
+            f'ext;dur={self.ext_time * 1000:.1f};desc="{self.ext_count} calls", '
+            f"app;dur={total_ms:.1f}"
+        )
+
+
+_current: contextvars.ContextVar[RequestTimings | None] = contextvars.ContextVar(
+    "request_timings", default=None
+)
+
+
+def current_timings() -> RequestTimings | None:
+    return _current.get()
+
+
+def add_external(seconds: float) -> None:
+    """Record time spent in an outbound HTTP call for the current request."""
+    timings = _current.get()
+    if timings is not None:
+        timings.ext_count += 1
+        timings.ext_time += seconds
+
+
+# ── SQLAlchemy hooks ──
+
+def instrument_engine(engine) -> None:
+    @event.listens_for(engine, "before_cursor_execute")
+    def _before(conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault("_query_start", []).append(time.perf_counter())
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def _after(conn, cursor, statement, parameters, context, executemany):
+        starts = conn.info.get("_query_start")
+        if not starts:
+            return
+        elapsed = time.perf_counter() - starts.pop()
+        timings = _current.get()
+        if timings is not None:
+            timings.db_count += 1
+            timings.db_time += elapsed
+            timings.thread_ids.add(threading.get_ident())
+
+
+# ── httpx hooks ──
+
+def _on_request(request) -> None:
+    request.extensions["_timing_start"] = time.perf_counter()
+
+
+def _on_response(response) -> None:
+    start = response.request.extensions.get("_timing_start")
+    if start is not None:
+        add_external(time.perf_counter() - start)
+
+
+async def _on_request_async(request) -> None:
+    _on_request(request)
+
+
+async def _on_response_async(response) -> None:
+    _on_response(response)
+
+
+HTTPX_EVENT_HOOKS = {"request": [_on_request], "response": [_on_response]}
+HTTPX_ASYNC_EVENT_HOOKS = {"request": [_on_request_async], "response": [_on_response_async]}
+
+
+# ── sampling profiler ──
+
+class SamplingProfiler:
+    """Samples stacks of the tracked threads into collapsed (flamegraph) format."""
+
+    def __init__(self, timings: RequestTimings, interval: float):
+        self.timings = timings
+        self.interval = interval
+        self.stacks: Counter[str] = Counter()
+        self.samples = 0
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="request-profiler", daemon=True)
+
+    def start(self) -> None:
+        self.timings.thread_ids.add(threading.get_ident())
+        self._started = time.perf_counter()
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        self._thread.join(timeout=1.0)
+
+    def _run(self) -> None:
+        own = threading.get_ident()
+        deadline = time.perf_counter() + MAX_PROFILE_SECONDS
+        while not self._stop.wait(self.interval) and time.perf_counter() < deadline:
+            frames = sys._current_frames()
+            for tid in list(self.timings.thread_ids):
+                frame = frames.get(tid)
+                if frame is None or tid == own:
+                    continue
+                stack = []
+                while frame is not None:
+                    code = frame.f_code
+                    stack.append(f"{code.co_name} ({code.co_filename}:{frame.f_lineno})")
+                    frame = frame.f_back
+                self.stacks[";".join(reversed(stack))] += 1
+            self.samples += 1
+
+    def report(self, method: str, path: str) -> str:
+        elapsed = time.perf_counter() - self._started
+        self_counts: Counter[str] = Counter()
+        total_counts: Counter[str] = Counter()
+        for stack, count in self.stacks.items():
+            frames = stack.split(";")
+            self_counts[frames[-1]] += count
+            for name in set(frames):
+                total_counts[name] += count
+
+        lines = [
+            f"# {method} {path}",
+            f"# duration={elapsed * 1000:.1f}ms samples={self.samples} "
+            f"interval={self.interval * 1000:.1f}ms",
+            f"# {self.timings.server_timing()}",
+            "#",
+            "# top self time (samples)",
+        ]
+        lines += [f"#  {c:6d}  {name}" for name, c in self_counts.most_common(25)]
+        lines.append("#")
+        lines.append("# top cumulative (samples)")
+        lines += [f"#  {c:6d}  {name}" for name, c in total_counts.most_common(25)]
+        lines.append("#")
+        lines.append("# collapsed stacks (flamegraph.pl / speedscope compatible)")
+        lines += [f"{stack} {count}" for stack, count in self.stacks.most_common()]
+        return "\n".join(lines) + "\n"
+
+
+_PROFILE_ID_RE = re.compile(r"[0-9a-f]{12}")
+
+
+def _profile_mtime(path) -> float:
+    try:
+        return path.stat().st_mtime
+    except FileNotFoundError:  # pruned by another worker
+        return 0.0
+
+
+def _store_profile(profile_id: str, report: str) -> None:
+    """Write the report to PROFILE_DIR and keep only the newest MAX_STORED_PROFILES."""
+    path = PROFILE_DIR / f"{profile_id}.txt"
+    tmp = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    tmp.write_text(report, encoding="utf-8")
+    os.replace(tmp, path)
+    stored = sorted(PROFILE_DIR.glob("*.txt"), key=_profile_mtime)
+    for old in stored[:-MAX_STORED_PROFILES]:
+        old.unlink(missing_ok=True)
+
+
+def get_profile(profile_id: str) -> str | None:
+    if not _PROFILE_ID_RE.fullmatch(profile_id):
+        return None
+    try:
+        return (PROFILE_DIR / f"{profile_id}.txt").read_text(encoding="utf-8")
+    except FileNotFoundError:
+        return None
+
+
+def _wants_profile(scope: Scope) -> bool:
+    if not PROFILING_ENABLED:
+        return False
+    for name, value in scope.get("headers", []):
+        if name == b"x-profile" and value in (b"1", b"true"):
+            break
+    else:
+        query = parse_qs(scope.get("query_string", b"").decode("latin-1"))
+        if query.get("__profile") not in (["1"], ["true"]):
+            return False
+    return _is_super_admin(scope)
+
+
+def _is_super_admin(scope: Scope) -> bool:
+    request = Request(scope)
+    auth_header = request.headers.get("authorization", "")
+    token = auth_header[7:] if auth_header.startswith("Bearer ") else request.cookies.get("session_token")
+    payload = decode_token_cached(token) if token else None
+    return bool(payload and payload.get("role") == "super_admin")
+
+
+class ServerTimingMiddleware:
+    """Pure ASGI: Server-Timing on every response, sampling profile on request."""
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        timings = RequestTimings()
+        token = _current.set(timings)
+        profiler = None
+        if _wants_profile(scope):
+            profiler = SamplingProfiler(timings, PROFILE_SAMPLE_INTERVAL_MS / 1000)
+            profiler.start()
+        profile_id = uuid.uuid4().hex[:12] if profiler else None
+
+        async def send_wrapper(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                headers = MutableHeaders(scope=message)
+                headers.append("Server-Timing", timings.server_timing())
+                if profile_id:
+                    headers["X-Profile-Id"] = profile_id
+                    headers["X-Profile-URL"] = f"/api/profiles/{profile_id}"
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            _current.reset(token)
+            if profiler is not None:
+                profiler.stop()
+                report = profiler.report(scope["method"], scope["path"])
+                try:
+                    await asyncio.to_thread(_store_profile, profile_id, report)
+                except OSError as exc:
+                    logger.warning("Profile store failed: id=%s | %s", profile_id, exc)
+                else:
+                    logger.info("Profile captured: id=%s path=%s samples=%d", profile_id, scope["path"], profiler.samples)
@@ -2,10 +2,10 @@ import re
 from datetime import datetime
 
 from fastapi import APIRouter, Depends, HTTPException, Query
-from sqlalchemy import func
+from sqlalchemy import func, or_
 from sqlalchemy.orm import Session
 
-from app.database import get_db
+from app.database import get_db, get_read_db
 from app.dependencies import require_super_admin
 from app.models.admin_user import AdminUser
 from app.models.billing import BillingKey, PaymentHistory
@@ -30,7 +30,7 @@ router = APIRouter(prefix="/api/admin-dashboard", tags=["admin-dashboard"])
 
 @router.get("/overview", response_model=DashboardOverview)
 def dashboard_overview(
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     user: dict = Depends(require_super_admin),
 ):
     """전체 현황 요약 (super_admin 전용)"""
@@ -72,54 +72,105 @@ def dashboard_overview(
     )
 
 
+SUBSCRIBER_SORT_KEYS = (
+    "company_id", "company_name", "created_at", "admin_count",
+    "total_paid", "payment_count", "last_paid_at",
+)
+
+
 @router.get("/subscribers", response_model=SubscriberListResponse)
 def list_subscribers(
-    db: Session = Depends(get_db),
+    page: int = Query(1, ge=1),
+    size: int = Query(50, ge=1, le=500),
+    plan: str | None = Query(None),
+    approval_status: str | None = Query(None),
+    q: str | None = Query(None),
+    sort: str = Query("company_id"),
+    order: str = Query("asc", regex="^(asc|desc)$"),
+    db: Session = Depends(get_read_db),
     user: dict = Depends(require_super_admin),
 ):
-    """전체 회사 구독 현황 (super_admin 전용)"""
-    companies = (
-        db.query(Company)
-        .filter(Company.deleted_at == None)
-        .order_by(Company.company_id)
-        .all()
+    """전체 회사 구독 현황 (super_admin 전용)
+
+    빌링키·관리자 수·결제 합계를 회사별 GROUP BY 서브쿼리로 한 번에 조인하므로
+    회사 수와 무관하게 쿼리 2개(COUNT + 페이지)로 끝난다.
+    plan / approval_status / q(회사명) 로 필터, sort + order 로 정렬.
+    """
+    if sort not in SUBSCRIBER_SORT_KEYS:
+        raise HTTPException(status_code=400, detail=f"sort must be one of {', '.join(SUBSCRIBER_SORT_KEYS)}")
+
+    active_bk = (
+        db.query(BillingKey.company_id, func.min(BillingKey.id).label("bk_id"))
+        .filter(BillingKey.is_active == True)
+        .group_by(BillingKey.company_id)
+        .subquery()
     )
-    now = datetime.utcnow()
-    items = []
-
-    for c in companies:
-        # 빌링키
-        bk = (
-            db.query(BillingKey)
-            .filter(BillingKey.company_id == c.company_id, BillingKey.is_active == True)
-            .first()
-        )
-
-        # 관리자 수
-        admin_count = (
-            db.query(func.count(AdminUser.user_id))
-            .filter(AdminUser.company_id == c.company_id)
-            .scalar()
+    admins = (
+        db.query(AdminUser.company_id, func.count(AdminUser.user_id).label("admin_count"))
+        .group_by(AdminUser.company_id)
+        .subquery()
+    )
+    payments = (
+        db.query(
+            PaymentHistory.company_id,
+            func.sum(PaymentHistory.amount).label("total_paid"),
+            func.count(PaymentHistory.id).label("payment_count"),
+            func.max(PaymentHistory.paid_at).label("last_paid_at"),
         )
+        .filter(PaymentHistory.status == "success")
+        .group_by(PaymentHistory.company_id)
+        .subquery()
+    )
 
-        # 결제 합계
-        pay_stats = (
-            db.query(
-                func.coalesce(func.sum(PaymentHistory.amount), 0),
-                func.count(PaymentHistory.id),
-                func.max(PaymentHistory.paid_at),
-            )
-            .filter(
-                PaymentHistory.company_id == c.company_id,
-                PaymentHistory.status == "success",
-            )
-            .first()
+    base = db.query(Company).filter(Company.deleted_at == None)
+    if plan:
+        cond = Company.subscription_plan == plan
+        base = base.filter(or_(cond, Company.subscription_plan == None) if plan == "free" else cond)
+    if approval_status:
+        cond = Company.approval_status == approval_status
+        base = base.filter(or_(cond, Company.approval_status == None) if approval_status == "pending" else cond)
+    if q:
+        base = base.filter(Company.company_name.contains(q))
+    total = base.count()
+
+    admin_count = func.coalesce(admins.c.admin_count, 0)
+    total_paid = func.coalesce(payments.c.total_paid, 0)
+    payment_count = func.coalesce(payments.c.payment_count, 0)
+    sort_col = {
+        "company_id": Company.company_id,
+        "company_name": Company.company_name,
+        "created_at": Company.created_at,
+        "admin_count": admin_count,
+        "total_paid": total_paid,
+        "payment_count": payment_count,
+        "last_paid_at": payments.c.last_paid_at,
+    }[sort]
+    sort_col = sort_col.desc() if order == "desc" else sort_col.asc()
+
+    rows = (
+        base.with_entities(
+            Company,
+            BillingKey.card_company,
+            BillingKey.card_number,
+            BillingKey.id,
+            admin_count,
+            total_paid,
+            payment_count,
+            payments.c.last_paid_at,
         )
+        .outerjoin(active_bk, active_bk.c.company_id == Company.company_id)
+        .outerjoin(BillingKey, BillingKey.id == active_bk.c.bk_id)
+        .outerjoin(admins, admins.c.company_id == Company.company_id)
+        .outerjoin(payments, payments.c.company_id == Company.company_id)
+        .order_by(sort_col, Company.company_id)
+        .offset((page - 1) * size)
+        .limit(size)
+        .all()
+    )
 
-        total_paid = pay_stats[0] if pay_stats else 0
-        payment_count = pay_stats[1] if pay_stats else 0
-        last_paid_at = pay_stats[2] if pay_stats else None
-
+    now = datetime.utcnow()
+    items = []
+    for c, card_company, card_number, bk_id, n_admins, paid, n_payments, last_paid_at in rows:
         # 구독 활성 여부
         billing_active = False
         if c.subscription_plan == "enterprise":
@@ -135,25 +186,31 @@ def list_subscribers(
             subscription_plan=c.subscription_plan or "free",
             approval_status=c.approval_status or "pending",
             billing_active=billing_active,
-            has_billing_key=bk is not None,
-            card_company=bk.card_company if bk else None,
-            card_number=bk.card_number if bk else None,
-            admin_count=admin_count,
-            total_paid=total_paid,
-            payment_count=payment_count,
+            has_billing_key=bk_id is not None,
+            card_company=card_company,
+            card_number=card_number,
+            admin_count=n_admins,
+            total_paid=paid,
+            payment_count=n_payments,
             last_paid_at=last_paid_at.isoformat() if last_paid_at else None,
             trial_ends_at=c.trial_ends_at.isoformat() + "Z" if c.trial_ends_at else None,
             created_at=c.created_at.isoformat(),
         ))
 
-    return SubscriberListResponse(success=True, items=items, total=len(items))
+    return SubscriberListResponse(
+        success=True,
+        items=items,
+        total=total,
+        page=page,
+        pages=max(1, (total + size - 1) // size),
+    )
 
 
 @router.get("/payments", response_model=PaymentListResponse)
 def list_all_payments(
     status: str | None = Query(None),
     company_id: int | None = Query(None),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     user: dict = Depends(require_super_admin),
 ):
     """전체 결제 내역 (super_admin 전용). status/company_id로 필터 가능."""
@@ -203,7 +260,7 @@ def list_all_payments(
 @router.get("/companies/{company_id}/admins", response_model=AdminListResponse)
 def list_company_admins(
     company_id: int,
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     user: dict = Depends(require_super_admin),
 ):
     """특정 회사의 관리자 목록 (super_admin 전용)"""
@@ -280,7 +337,7 @@ def update_subscription(
 @router.get("/companies/{company_id}/validate-data", response_model=ValidateDataResponse)
 def validate_company_data(
     company_id: int,
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     user: dict = Depends(require_super_admin),
 ):
     """회사 Q&A 데이터에 타 업체 정보가 잔존하는지 검증 (super_admin 전용)"""
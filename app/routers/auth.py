@@ -25,7 +25,7 @@ from app.services.auth_service import (
     generate_temp_password,
     hash_password,
     mask_email,
-    verify_password,
+    verify_and_upgrade,
 )
 from app.services.email_service import send_temp_password_email
 from app.services.jwt_service import create_access_token
@@ -69,7 +69,7 @@ def login(req: LoginRequest, request: Request, response: Response, db: Session =
         )
         if not user or not user.is_active:
             return LoginResponse(success=False, message="사용자를 찾을 수 없습니다.")
-        if not verify_password(req.password, user.password_hash):
+        if not verify_and_upgrade(user, req.password):
             return LoginResponse(success=False, message="비밀번호가 올바르지 않습니다.")
 
         user.last_login = now
@@ -129,7 +129,7 @@ def login(req: LoginRequest, request: Request, response: Response, db: Session =
     if not user or not user.is_active:
         return LoginResponse(success=False, message="사용자를 찾을 수 없습니다.")
 
-    if not verify_password(req.password, user.password_hash):
+    if not verify_and_upgrade(user, req.password):
         return LoginResponse(success=False, message="비밀번호가 올바르지 않습니다.")
 
     user.last_login = now
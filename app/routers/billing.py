@@ -1,20 +1,31 @@
+import asyncio
 import logging
 import os
+import threading
 import time
 from base64 import b64encode
+from collections import Counter
+from contextlib import contextmanager
+from dataclasses import dataclass
 from datetime import datetime, timedelta
 
-import httpx
 from fastapi import APIRouter, Depends, Header, HTTPException, Query, Request
 from fastapi.responses import RedirectResponse
-from sqlalchemy import func
+from sqlalchemy import func, text
 from sqlalchemy.orm import Session
 
-from app.config import SITE_URL, TOSS_CLIENT_KEY, TOSS_SECRET_KEY
-from app.database import get_db
+from app.config import (
+    BILLING_RENEW_CONCURRENCY,
+    BILLING_RENEW_PENDING_STALE_MINUTES,
+    SITE_URL,
+    TOSS_CLIENT_KEY,
+    TOSS_SECRET_KEY,
+)
+from app.database import SessionLocal, engine, get_db
 from app.dependencies import require_admin, require_auth
 from app.models.billing import BillingKey, PaymentHistory
 from app.models.company import Company
+from app.profiling import HTTPX_ASYNC_EVENT_HOOKS
 from app.schemas.billing import (
     BillingCancelResponse,
     BillingKeyDeactivateResponse,
@@ -34,6 +45,12 @@ router = APIRouter(prefix="/api/billing", tags=["billing"])
 TOSS_API_BASE = "https://api.tosspayments.com/v1"
 
 
+def _toss_client():
+    import httpx  # lazy: keeps worker import time down
+
+    return httpx.AsyncClient(event_hooks=HTTPX_ASYNC_EVENT_HOOKS)
+
+
 @router.get("/client-key")
 def get_toss_client_key():
     """프론트엔드에 토스 Client Key 전달"""
@@ -72,7 +89,7 @@ async def billing_success(
     """토스 카드 등록 성공 콜백 → billingKey 발급/저장 → 첫 결제 실행 → 리다이렉트"""
     try:
         # 1) billingKey 발급
-        async with httpx.AsyncClient() as client:
+        async with _toss_client() as client:
             resp = await client.post(
                 f"{TOSS_API_BASE}/billing/authorizations/issue",
                 json={"customerKey": customerKey, "authKey": authKey},
@@ -125,7 +142,7 @@ async def billing_success(
         company = db.query(Company).filter(Company.company_id == company_id).first()
         customer_name = company.company_name if company else f"company_{company_id}"
 
-        async with httpx.AsyncClient() as client:
+        async with _toss_client() as client:
             pay_resp = await client.post(
                 f"{TOSS_API_BASE}/billing/{billing_key}",
                 json={
@@ -237,7 +254,7 @@ async def billing_pay(
     customer_name = company.company_name if company else f"company_{req.company_id}"
 
     try:
-        async with httpx.AsyncClient() as client:
+        async with _toss_client() as client:
             resp = await client.post(
                 f"{TOSS_API_BASE}/billing/{bk.billing_key}",
                 json={
@@ -497,17 +514,96 @@ def _verify_cron_secret(x_cron_secret: str = Header(...)):
         raise HTTPException(status_code=403, detail="Invalid cron secret")
 
 
-@router.post("/auto-renew", dependencies=[Depends(_verify_cron_secret)])
-async def billing_auto_renew(db: Session = Depends(get_db)):
-    """매월 자동 갱신 결제.
+RENEW_PERIOD_DAYS = 30
+RENEW_ORDER_NAME = "보듬누리 구독 자동갱신"
+_RENEW_LOCK_KEY = 7_310_245_134
+_renew_local_lock = threading.Lock()
 
-    각 enterprise 회사의 마지막 성공 결제일 기준 30일이 지나면 자동 결제 실행.
-    Cron에서 매일 호출 → 해당일 대상 회사만 결제.
+
+@contextmanager
+def _renew_run_lock():
+    """Non-blocking run-level lock so overlapping cron calls don't both renew.
+
+    PostgreSQL: pg_try_advisory_lock (held on a dedicated connection for the run)
+    SQLite: flock on <db>.auto-renew.lock next to the DB file
+    Yields True when acquired, False when another run holds it.
     """
-    # enterprise + 활성 빌링키가 있는 회사 목록
-    active_companies = (
-        db.query(BillingKey.company_id, BillingKey.billing_key, BillingKey.customer_key, BillingKey.id)
+    if not _renew_local_lock.acquire(blocking=False):
+        yield False
+        return
+    try:
+        if engine.dialect.name == "postgresql":
+            with engine.connect() as conn:
+                got = conn.execute(text("SELECT pg_try_advisory_lock(:k)"), {"k": _RENEW_LOCK_KEY}).scalar()
+                conn.commit()
+                try:
+                    yield bool(got)
+                finally:
+                    if got:
+                        conn.execute(text("SELECT pg_advisory_unlock(:k)"), {"k": _RENEW_LOCK_KEY})
+                        conn.commit()
+            return
+
+        db_path = engine.url.database
+        try:
+            import fcntl
+        except ImportError:
+            fcntl = None
+        if not db_path or db_path == ":memory:" or fcntl is None:
+            yield True
+            return
+        with open(f"{db_path}.auto-renew.lock", "w") as fh:
+            try:
+                fcntl.flock(fh, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except OSError:
+                yield False
+                return
+            try:
+                yield True
+            finally:
+                fcntl.flock(fh, fcntl.LOCK_UN)
+    finally:
+        _renew_local_lock.release()
+
+
+@dataclass
+class _RenewTarget:
+    company_id: int
+    company_name: str
+    billing_key_id: int
+    billing_key: str
+    customer_key: str
+    last_paid_at: datetime | None
+    order_id: str | None = None
+    amount: int = 0
+    outcome: str = ""
+    detail: str | None = None
+
+
+def _period_order_id(company_id: int, last_paid_at: datetime) -> str:
+    """결제 주기별 결정적 주문번호 — 같은 주기는 몇 번을 실행해도 같은 키."""
+    due = last_paid_at + timedelta(days=RENEW_PERIOD_DAYS)
+    return f"auto_{company_id}_{due:%Y%m%d}"
+
+
+def _select_renew_targets(db: Session, now: datetime) -> list[_RenewTarget]:
+    """enterprise + 활성 빌링키 회사와 마지막 성공 결제일을 한 번의 쿼리로 조회."""
+    last_paid = (
+        db.query(
+            PaymentHistory.company_id.label("company_id"),
+            func.max(PaymentHistory.paid_at).label("last_paid_at"),
+        )
+        .filter(PaymentHistory.status == "success")
+        .group_by(PaymentHistory.company_id)
+        .subquery()
+    )
+    rows = (
+        db.query(
+            BillingKey.company_id, Company.company_name, BillingKey.id,
+            BillingKey.billing_key, BillingKey.customer_key, last_paid.c.last_paid_at,
+        )
         .join(Company, Company.company_id == BillingKey.company_id)
+        .outerjoin(last_paid, last_paid.c.company_id == BillingKey.company_id)
         .filter(
             BillingKey.is_active == True,
             Company.subscription_plan == "enterprise",
@@ -515,89 +611,206 @@ async def billing_auto_renew(db: Session = Depends(get_db)):
         )
         .all()
     )
+    return [_RenewTarget(*row) for row in rows]
 
-    results = {}
-    now = datetime.utcnow()
 
-    for bk_company_id, bk_billing_key, bk_customer_key, bk_id in active_companies:
-        # 마지막 성공 결제일 조회
-        last_payment = (
-            db.query(func.max(PaymentHistory.paid_at))
-            .filter(
-                PaymentHistory.company_id == bk_company_id,
-                PaymentHistory.status == "success",
-            )
-            .scalar()
-        )
+def _claim_renewals(db: Session, targets: list[_RenewTarget], now: datetime, amount: int) -> list[_RenewTarget]:
+    """Reserve one payment attempt per due company by inserting a 'pending' row.
 
-        if not last_payment:
-            results[bk_company_id] = "no_previous_payment"
+    order_id 가 UNIQUE 이므로 동시에 두 실행이 같은 주기를 잡을 수 없다.
+    - 성공 기록이 있으면 already_paid
+    - pending 이 남아 있으면(이전 실행이 Toss 응답을 못 받음) 오래된 경우 같은
+      order_id/Idempotency-Key 로 재요청해 결과만 확정, 최근이면 in_progress
+    - 실패 기록이 있으면 하루 한 번 -r{n} 접미사로 재시도
+    Returns the targets that should be charged now.
+    """
+    due_targets = []
+    for t in targets:
+        if t.last_paid_at is None:
+            t.outcome = "no_previous_payment"
             continue
+        days_since = (now - t.last_paid_at).days
+        if days_since < RENEW_PERIOD_DAYS:
+            t.outcome, t.detail = "not_due", f"last: {days_since} days ago"
+        else:
+            t.order_id = _period_order_id(t.company_id, t.last_paid_at)
+            due_targets.append(t)
+    if not due_targets:
+        return []
 
-        # 마지막 결제일로부터 30일 경과 체크
-        days_since = (now - last_payment).days
-        if days_since < 30:
-            results[bk_company_id] = f"not_due (last: {days_since} days ago)"
-            continue
+    attempts: dict[str, list[PaymentHistory]] = {}
+    existing = (
+        db.query(PaymentHistory)
+        .filter(
+            PaymentHistory.company_id.in_([t.company_id for t in due_targets]),
+            PaymentHistory.order_id.like("auto\\_%", escape="\\"),
+            PaymentHistory.paid_at >= min(t.last_paid_at for t in due_targets),
+        )
+        .all()
+    )
+    for p in existing:
+        attempts.setdefault(p.order_id.split("-r")[0], []).append(p)
+
+    stale_before = now - timedelta(minutes=BILLING_RENEW_PENDING_STALE_MINUTES)
+    to_charge = []
+    for t in due_targets:
+        history = sorted(attempts.get(t.order_id, []), key=lambda p: p.paid_at)
+        pending = next((p for p in history if p.status == "pending"), None)
+        if any(p.status == "success" for p in history):
+            t.outcome = "already_paid"
+        elif pending is not None:
+            if pending.paid_at > stale_before:
+                t.outcome = "in_progress"
+            else:
+                t.order_id, t.amount = pending.order_id, pending.amount
+                to_charge.append(t)
+        elif history and history[-1].paid_at.date() == now.date():
+            t.outcome, t.detail = "retry_tomorrow", history[-1].failure_reason
+        else:
+            if history:
+                t.order_id = f"{t.order_id}-r{len(history)}"
+            t.amount = amount
+            claimed = db.execute(
+                _dialect_insert(db)(PaymentHistory)
+                .values(
+                    company_id=t.company_id,
+                    billing_key_id=t.billing_key_id,
+                    order_id=t.order_id,
+                    order_name=RENEW_ORDER_NAME,
+                    amount=amount,
+                    status="pending",
+                    paid_at=now,
+                )
+                .on_conflict_do_nothing(index_elements=["order_id"])
+            ).rowcount
+            if claimed:
+                to_charge.append(t)
+            else:
+                t.outcome = "in_progress"
+    db.commit()
+    return to_charge
 
-        # 결제 실행
-        order_id = f"auto_{bk_company_id}_{int(time.time())}"
-        pay_amount = _calculate_amount(db)
 
-        company = db.query(Company).filter(Company.company_id == bk_company_id).first()
-        customer_name = company.company_name if company else f"company_{bk_company_id}"
+def _dialect_insert(db: Session):
+    if db.get_bind().dialect.name == "postgresql":
+        from sqlalchemy.dialects.postgresql import insert
+    else:
+        from sqlalchemy.dialects.sqlite import insert
+    return insert
 
-        try:
-            async with httpx.AsyncClient() as client:
-                resp = await client.post(
-                    f"{TOSS_API_BASE}/billing/{bk_billing_key}",
-                    json={
-                        "customerKey": bk_customer_key,
-                        "amount": pay_amount,
-                        "orderId": order_id,
-                        "orderName": "보듬누리 구독 자동갱신",
-                        "customerName": customer_name,
-                    },
-                    headers=_toss_auth_header(),
-                    timeout=30.0,
-                )
 
+async def _charge_renewal(client, slots: asyncio.Semaphore, t: _RenewTarget) -> None:
+    async with slots:
+        try:
+            resp = await client.post(
+                f"{TOSS_API_BASE}/billing/{t.billing_key}",
+                json={
+                    "customerKey": t.customer_key,
+                    "amount": t.amount,
+                    "orderId": t.order_id,
+                    "orderName": RENEW_ORDER_NAME,
+                    "customerName": t.company_name or f"company_{t.company_id}",
+                },
+                headers={**_toss_auth_header(), "Idempotency-Key": t.order_id},
+            )
             result = resp.json()
-
-            if resp.status_code == 200:
-                history = PaymentHistory(
-                    company_id=bk_company_id,
-                    billing_key_id=bk_id,
-                    order_id=order_id,
-                    order_name="보듬누리 구독 자동갱신",
-                    amount=pay_amount,
-                    status="success",
-                    payment_key=result.get("paymentKey"),
-                )
-                db.add(history)
-                db.commit()
-                results[bk_company_id] = f"success ({pay_amount}원)"
-                logger.info("Auto-renew success: company_id=%d, amount=%d", bk_company_id, pay_amount)
-            else:
-                failure_msg = result.get("message", "결제 실패")
-                history = PaymentHistory(
-                    company_id=bk_company_id,
-                    billing_key_id=bk_id,
-                    order_id=order_id,
-                    order_name="보듬누리 구독 자동갱신",
-                    amount=pay_amount,
-                    status="failed",
-                    failure_reason=failure_msg,
-                )
-                db.add(history)
-                db.commit()
-                results[bk_company_id] = f"failed: {failure_msg}"
-                logger.warning("Auto-renew failed: company_id=%d, reason=%s", bk_company_id, failure_msg)
         except Exception as exc:
-            results[bk_company_id] = f"error: {exc}"
-            logger.error("Auto-renew error: company_id=%d, %s", bk_company_id, exc)
+            # 승인 여부를 알 수 없음 → pending 유지, 다음 실행이 같은 키로 재확인
+            t.outcome, t.detail = "unknown", str(exc)
+            return
+
+    if resp.status_code == 200:
+        t.outcome, t.detail = "success", result.get("paymentKey")
+    elif resp.status_code >= 500:
+        t.outcome, t.detail = "unknown", result.get("message")
+    else:
+        t.outcome, t.detail = "failed", result.get("message", "결제 실패")
+
+
+def _record_renewals(targets: list[_RenewTarget]) -> None:
+    """Settle the pending rows with the Toss results (one bulk UPDATE per outcome)."""
+    settled = [t for t in targets if t.outcome in ("success", "failed")]
+    if not settled:
+        return
+    db = SessionLocal()
+    try:
+        now = now_kst()
+        for t in settled:
+            db.query(PaymentHistory).filter(
+                PaymentHistory.order_id == t.order_id,
+                PaymentHistory.status == "pending",
+            ).update(
+                {
+                    "status": t.outcome,
+                    "payment_key": t.detail if t.outcome == "success" else None,
+                    "failure_reason": t.detail if t.outcome == "failed" else None,
+                    "paid_at": now,
+                },
+                synchronize_session=False,
+            )
+        db.commit()
+    finally:
+        db.close()
 
-    logger.info("Auto-renew complete: %s", results)
-    return {"status": "ok", "results": results}
 
+@router.post("/auto-renew", dependencies=[Depends(_verify_cron_secret)])
+async def billing_auto_renew(db: Session = Depends(get_db)):
+    """매월 자동 갱신 결제.
+
+    각 enterprise 회사의 마지막 성공 결제일 기준 30일이 지나면 자동 결제 실행.
+    Cron에서 매일 호출 → 해당일 대상 회사만 결제.
 
+    대상 회사는 한 번의 쿼리로 고르고, 결제 주기마다 결정적인 order_id
+    (auto_{company_id}_{만기일}) 를 pending 으로 먼저 기록한 뒤 하나의 커넥션 풀로
+    BILLING_RENEW_CONCURRENCY 건씩 동시에 결제한다. order_id 는 Toss Idempotency-Key 로도
+    전달되므로 재실행·중복 호출이 이중 결제로 이어지지 않는다.
+    """
+    import httpx  # lazy: keeps worker import time down
+
+    with _renew_run_lock() as acquired:
+        if not acquired:
+            raise HTTPException(status_code=409, detail="auto-renew already running")
+
+        started = time.perf_counter()
+        started_at = now_kst()
+        targets = _select_renew_targets(db, started_at)
+        to_charge = _claim_renewals(db, targets, started_at, _calculate_amount(db))
+        db.close()  # 결제 동안 커넥션을 잡고 있지 않는다
+
+        if to_charge:
+            slots = asyncio.Semaphore(BILLING_RENEW_CONCURRENCY)
+            limits = httpx.Limits(max_connections=BILLING_RENEW_CONCURRENCY)
+            async with httpx.AsyncClient(
+                limits=limits, timeout=30.0, event_hooks=HTTPX_ASYNC_EVENT_HOOKS,
+            ) as client:
+                await asyncio.gather(*(_charge_renewal(client, slots, t) for t in to_charge))
+            await asyncio.to_thread(_record_renewals, to_charge)
+
+    counts = Counter(t.outcome for t in targets)
+    results = {
+        t.company_id: {
+            "status": t.outcome,
+            "order_id": t.order_id,
+            "amount": t.amount or None,
+            "detail": t.detail,
+        }
+        for t in targets
+    }
+    for t in to_charge:
+        if t.outcome == "success":
+            logger.info("Auto-renew success: company_id=%d, order_id=%s, amount=%d", t.company_id, t.order_id, t.amount)
+        elif t.outcome == "failed":
+            logger.warning("Auto-renew failed: company_id=%d, reason=%s", t.company_id, t.detail)
+        else:
+            logger.error("Auto-renew unknown result: company_id=%d, order_id=%s, %s", t.company_id, t.order_id, t.detail)
+    report = {
+        "status": "ok",
+        "started_at": started_at.isoformat(),
+        "duration_ms": round((time.perf_counter() - started) * 1000, 1),
+        "companies": len(targets),
+        "charged": len(to_charge),
+        "counts": dict(counts),
+        "results": results,
+    }
+    logger.info("Auto-renew complete: %s", dict(counts))
+    return report
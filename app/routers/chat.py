@@ -1,13 +1,15 @@
 import json
 import time
+from datetime import datetime
 
-from fastapi import APIRouter, Depends, Query, Request
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
 from sqlalchemy.orm import Session
 
 from app.config import RATE_LIMIT_CHAT
 from app.database import get_db
 from app.models.chat_log import ChatLog
 from app.models.qa_knowledge import QaKnowledge
+from app.pagination import after, decode_cursor, encode_cursor
 from app.quota import increment_usage
 from app.rate_limit import limiter
 from app.schemas.chat import ChatHistoryItem, ChatRequest, ChatResponse
@@ -81,13 +83,35 @@ def chat(req: ChatRequest, request: Request, db: Session = Depends(get_db)):
 @router.get("/history/{session_id}", response_model=list[ChatHistoryItem])
 def get_history(
     session_id: str,
+    response: Response,
     company_id: int | None = Query(None),
+    limit: int | None = Query(None, ge=1, le=200),
+    before: str | None = Query(None),
     db: Session = Depends(get_db),
 ):
+    """Chat history of a session, oldest first.
+
+    limit 을 주면 최근 limit 건만 돌려주고, 더 오래된 기록이 있으면 X-Next-Cursor
+    헤더에 커서를 싣는다. 그 값을 before 로 넘기면 이전 구간을 이어서 읽는다.
+    limit 이 없으면 전체 (기존 동작).
+    """
     query = db.query(ChatLog).filter(ChatLog.session_id == session_id)
 
     if company_id:
         query = query.filter(ChatLog.company_id == company_id)
 
-    logs = query.order_by(ChatLog.timestamp.asc()).all()
+    if limit is None:
+        return query.order_by(ChatLog.timestamp.asc(), ChatLog.log_id.asc()).all()
+
+    if before:
+        try:
+            ts, log_id = decode_cursor(before, datetime, int)
+        except ValueError:
+            raise HTTPException(status_code=400, detail="잘못된 cursor 입니다.")
+        query = query.filter(after(ChatLog.timestamp, ChatLog.log_id, ts, log_id))
+    logs = query.order_by(ChatLog.timestamp.desc(), ChatLog.log_id.desc()).limit(limit + 1).all()
+    if len(logs) > limit:
+        logs = logs[:limit]
+        response.headers["X-Next-Cursor"] = encode_cursor(logs[-1].timestamp, logs[-1].log_id)
+    logs.reverse()
     return logs
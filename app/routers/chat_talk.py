@@ -87,9 +87,9 @@ def _admin_name_map(db: Session, admin_ids: set[int]) -> dict[int, str]:
 # ── Endpoints ─────────────────────────────────────────────────────────────────
 
 @router.get("/availability", response_model=AvailabilityResponse)
-def availability(db: Session = Depends(get_db)):
+async def availability():
     """1:1 톡 / 관리실 문자 링크가 공유하는 가용성(영업시간) 조회 — 인증 불필요."""
-    return get_availability(db)
+    return get_availability()
 
 
 @router.get("/thread", response_model=ChatThreadOut)
@@ -154,7 +154,7 @@ def send_resident_message(
     if not company_id or not dong or not ho:
         raise HTTPException(status_code=401, detail="입주민 인증이 필요합니다.")
 
-    available, _reason = is_business_hours(db)
+    available, _reason = is_business_hours()
     if not available:
         from app.services.business_hours import UNAVAILABLE_MESSAGE
         raise HTTPException(status_code=403, detail=UNAVAILABLE_MESSAGE)
@@ -3,7 +3,6 @@ import logging
 import re
 from pathlib import Path
 
-import openpyxl
 from fastapi import APIRouter, Depends, Header, HTTPException, Query, Request
 from pydantic import BaseModel
 from sqlalchemy.orm import Session
@@ -100,6 +99,8 @@ def _store_rows(rows: list[dict], year_month: str, company_id: int, db: Session)
 
 def _parse_and_store(file_path: Path, year_month: str, company_id: int, db: Session):
     try:
+        import openpyxl  # lazy: only needed for rare Excel uploads
+
         wb = openpyxl.load_workbook(file_path, read_only=True, data_only=True)
         ws = wb.active
         rows = list(ws.iter_rows(values_only=True))
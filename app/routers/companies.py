@@ -2,13 +2,13 @@ import json
 import secrets
 from datetime import datetime
 
-from fastapi import APIRouter, Cookie, Depends, HTTPException, Request
+from fastapi import APIRouter, Cookie, Depends, HTTPException, Request, Response
 from sqlalchemy.orm import Session
 
 from sqlalchemy import func, text
 
 from app.database import get_db
-from app.dependencies import require_admin, require_super_admin
+from app.dependencies import get_auth_payload, require_admin, require_super_admin
 from app.models.admin_user import AdminUser
 from app.models.qa_knowledge import QaKnowledge
 from app.models.company import Company
@@ -31,8 +31,9 @@ from app.schemas.company import (
     CompanyResponse,
     CompanyUpdate,
 )
+from app.services import company_catalog
 from app.services.auth_service import hash_password
-from app.services.jwt_service import decode_token
+from app.static_assets import etag_matches
 
 router = APIRouter(prefix="/api/companies", tags=["companies"])
 
@@ -60,47 +61,38 @@ def get_next_company_id(db: Session = Depends(get_db)):
     return {"next_id": max_id + 1}
 
 
+def _catalog_response(request: Request, body: bytes, etag: str) -> Response:
+    headers = {"ETag": etag, "Cache-Control": "no-cache"}
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
+
+
 @router.get("/public", response_model=list[CompanyPublicResponse])
-def list_public_companies(db: Session = Depends(get_db)):
+def list_public_companies(request: Request):
     """List companies for public display (chatbot company selection). Only approved companies."""
-    companies = (
-        db.query(Company)
-        .filter(Company.deleted_at == None, Company.approval_status == "approved")
-        .order_by(Company.company_id)
-        .all()
-    )
-    return companies
+    body, etag = company_catalog.catalog.public_list()
+    return _catalog_response(request, body, etag)
 
 
 @router.get("/public/{company_id}", response_model=CompanyPublicResponse)
 def get_public_company(
     company_id: int,
     request: Request,
-    db: Session = Depends(get_db),
     session_token: str | None = Cookie(None),
 ):
     """Get public company info by ID. Unapproved companies return 403 unless super_admin."""
-    company = (
-        db.query(Company)
-        .filter(Company.company_id == company_id, Company.is_active == True, Company.deleted_at == None)
-        .first()
-    )
-    if not company:
+    entry = company_catalog.catalog.get(company_id)
+    if entry is None or not entry.is_active:
         raise HTTPException(status_code=404, detail="회사를 찾을 수 없습니다.")
 
     # 미승인 업체 접근 차단 (super_admin은 허용)
-    if company.approval_status != "approved":
-        is_super = False
-        auth_header = request.headers.get("authorization", "")
-        token = auth_header[7:] if auth_header.startswith("Bearer ") else session_token
-        if token:
-            payload = decode_token(token)
-            if payload and payload.get("role") == "super_admin":
-                is_super = True
-        if not is_super:
+    if not entry.approved:
+        payload = get_auth_payload(request)
+        if not (payload and payload.get("role") == "super_admin"):
             raise HTTPException(status_code=403, detail="승인되지 않은 업체입니다.")
 
-    return company
+    return _catalog_response(request, entry.body, entry.etag)
 
 
 @router.post("/register", response_model=CompanyRegisterResponse)
@@ -396,6 +388,7 @@ def cleanup_companies(
         {"kid": keep_id},
     )
     deleted["companies"] = result.rowcount
+    company_catalog.mark_dirty(db)
 
     # auto-increment 시퀀스 리셋 (PostgreSQL)
     max_id = db.execute(text("SELECT COALESCE(MAX(company_id), 0) FROM companies")).scalar()
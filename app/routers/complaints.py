@@ -16,6 +16,7 @@ from app.dependencies import require_admin, optional_admin
 from app.models.complaint import Complaint
 from app.models.complaint_person import ComplaintPerson
 from app.services.alert_service import trigger_complaint_alert, trigger_complaint_reply_alert
+from app.services.image_upload import process_upload, variant_url
 from app.utils import now_kst
 
 MARKET_JWT_SECRET = SECRET_KEY + "_market"
@@ -85,12 +86,15 @@ async def upload_complaint_image(
         raise HTTPException(status_code=400, detail="파일이 없습니다.")
     file_bytes = await file.read()
     try:
-        from app.services.image_upload import save_image
-        filename = save_image(file_bytes, file.filename)
+        saved = await process_upload(file_bytes, file.filename)
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
     base_url = str(request.base_url).rstrip("/")
-    return {"url": f"{base_url}/uploads/{filename}"}
+    return {
+        key: f"{base_url}{value}"
+        for key, value in saved.items()
+        if key.endswith("url")
+    }
 
 
 @router.get("/debug/{complaint_id}")
@@ -368,6 +372,8 @@ def get_complaint(
         "content": c.content,
         "image1_url": c.image1_url,
         "image2_url": c.image2_url,
+        "image1_md_url": variant_url(c.image1_url, "md"),
+        "image2_md_url": variant_url(c.image2_url, "md"),
         "time_ago": _time_ago(c.created_at),
         "reply": {
             "content": c.reply_content,
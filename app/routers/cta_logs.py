@@ -1,12 +1,13 @@
+import json
 import logging
 from typing import Optional
 
-from fastapi import APIRouter, Depends
-from pydantic import BaseModel, Field
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Request
+from pydantic import BaseModel, Field, ValidationError
 
-from app.database import get_db
-from app.models.cta_click_log import CtaClickLog
+from app import metrics
+from app.config import CTA_BATCH_MAX_EVENTS
+from app.services.cta_ingest import buffer
 
 logger = logging.getLogger("acchelper")
 
@@ -48,45 +49,99 @@ class CtaClickLogCreate(BaseModel):
     funnel_step: str = Field(..., max_length=30)
 
 
+MAX_BATCH_BODY_BYTES = 256 * 1024
+
+
+def _normalize(data: CtaClickLogCreate) -> tuple[dict | None, str | None]:
+    """Validate against the ALLOWED_* sets. Returns (row, warning)."""
+    if data.cta_type not in ALLOWED_CTA_TYPES:
+        return None, "unknown cta_type"
+    if data.funnel_step not in ALLOWED_FUNNEL_STEPS:
+        return None, "unknown funnel_step"
+
+    # Normalize visitor_type / device_type with fallback
+    row = data.model_dump()
+    if row["visitor_type"] not in ALLOWED_VISITOR_TYPES:
+        row["visitor_type"] = "unknown"
+    if row["device_type"] not in ALLOWED_DEVICE_TYPES:
+        row["device_type"] = "desktop"
+    return row, None
+
+
+async def _read_capped(request: Request, limit: int) -> bytes | None:
+    """Read the request body, or return None as soon as it exceeds `limit` bytes.
+
+    Content-Length is checked first; chunked or mislabelled bodies are cut off
+    while streaming, so an oversized body is never buffered in full.
+    """
+    try:
+        declared = int(request.headers.get("content-length", "0"))
+    except ValueError:
+        declared = 0
+    if declared > limit:
+        return None
+    chunks = []
+    total = 0
+    async for chunk in request.stream():
+        total += len(chunk)
+        if total > limit:
+            return None
+        chunks.append(chunk)
+    return b"".join(chunks)
+
+
 @router.post("/api/cta-logs", status_code=201)
-def create_cta_click_log(
-    data: CtaClickLogCreate,
-    db: Session = Depends(get_db),
-):
+async def create_cta_click_log(data: CtaClickLogCreate):
     """Log a CTA click event. No auth required (public pages).
 
+    The event is buffered and written in batches (see cta_ingest).
     Failures are swallowed so the user is never blocked from navigating to Kakao.
     """
-    try:
-        # Validate cta_type
-        if data.cta_type not in ALLOWED_CTA_TYPES:
-            return {"detail": "logged", "warning": "unknown cta_type"}
-
-        # Validate funnel_step
-        if data.funnel_step not in ALLOWED_FUNNEL_STEPS:
-            return {"detail": "logged", "warning": "unknown funnel_step"}
-
-        # Normalize visitor_type / device_type with fallback
-        visitor_type = data.visitor_type if data.visitor_type in ALLOWED_VISITOR_TYPES else "unknown"
-        device_type = data.device_type if data.device_type in ALLOWED_DEVICE_TYPES else "desktop"
-
-        log = CtaClickLog(
-            page_path=data.page_path,
-            cta_type=data.cta_type,
-            visitor_type=visitor_type,
-            referrer=data.referrer,
-            utm_source=data.utm_source,
-            utm_medium=data.utm_medium,
-            utm_campaign=data.utm_campaign,
-            device_type=device_type,
-            session_id=data.session_id,
-            funnel_step=data.funnel_step,
-        )
-        db.add(log)
-        db.commit()
-
-        return {"detail": "logged", "id": log.id}
-    except Exception as exc:
-        logger.warning("CTA click log failed: %s", exc)
-        # Never block the user — return 200 on failure
+    row, warning = _normalize(data)
+    if row is None:
+        metrics.inc("cta_events_total", result="invalid")
+        return {"detail": "logged", "warning": warning}
+
+    event_id = buffer.add(row)
+    if event_id is None:
         return {"detail": "logged"}
+    return {"detail": "logged", "id": event_id}
+
+
+@router.post("/api/cta-logs/batch", status_code=202)
+async def create_cta_click_logs_batch(request: Request):
+    """Log several CTA events at once. No auth required (public pages).
+
+    Body: a JSON array of events or {"events": [...]}. Any content type is accepted so
+    navigator.sendBeacon (text/plain Blob) works without a CORS preflight.
+    Invalid events are skipped; the request itself never fails.
+    """
+    raw = await _read_capped(request, MAX_BATCH_BODY_BYTES)
+    if raw is None:
+        return {"detail": "logged", "accepted": 0, "dropped": 0, "warning": "payload too large"}
+    try:
+        payload = json.loads(raw or b"[]")
+    except ValueError:
+        return {"detail": "logged", "accepted": 0, "dropped": 0, "warning": "invalid json"}
+    events = payload.get("events") if isinstance(payload, dict) else payload
+    if not isinstance(events, list):
+        return {"detail": "logged", "accepted": 0, "dropped": 0, "warning": "invalid payload"}
+
+    accepted = invalid = dropped = 0
+    for item in events[:CTA_BATCH_MAX_EVENTS]:
+        try:
+            row, _warning = _normalize(CtaClickLogCreate.model_validate(item))
+        except ValidationError:
+            row = None
+        if row is None:
+            invalid += 1
+            continue
+        if buffer.add(row) is None:
+            dropped += 1
+        else:
+            accepted += 1
+
+    skipped = max(len(events) - CTA_BATCH_MAX_EVENTS, 0)
+    if invalid + skipped:
+        metrics.inc("cta_events_total", invalid + skipped, result="invalid")
+    return {"detail": "logged", "accepted": accepted, "dropped": dropped + invalid + skipped}
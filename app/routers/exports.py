@@ -0,0 +1,77 @@
+import asyncio
+import os
+
+from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.responses import FileResponse, StreamingResponse
+from sqlalchemy.orm import Session
+from starlette.background import BackgroundTask
+
+from app.database import get_read_db
+from app.dependencies import require_admin
+from app.services import export_service
+
+router = APIRouter(prefix="/api/exports", tags=["exports"])
+
+XLSX_MEDIA_TYPE = "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
+STREAM_MEDIA_TYPES = {
+    "csv": "text/csv; charset=utf-8",
+    "ndjson": "application/x-ndjson; charset=utf-8",
+}
+
+
+async def export_response(db: Session, dataset: str, filters: list, format: str, label: int | str):
+    """Stream `dataset` rows matching `filters` as xlsx / csv / ndjson.
+
+    모든 내보내기 엔드포인트가 공유하는 응답 경로. csv/ndjson 은 행 수 제한 없이 배치 단위로
+    바로 스트리밍한다. xlsx 는 행 수를 먼저 확인(초과 시 413)한 뒤 write-only 워크북을
+    스레드풀에서 임시 파일로 만들어 스트리밍하고 삭제한다.
+    """
+    spec = export_service.DATASETS[dataset]
+    filename = export_service.export_filename(dataset, label, format)
+    if format in STREAM_MEDIA_TYPES:
+        db.close()
+        stream = export_service.iter_csv if format == "csv" else export_service.iter_ndjson
+        return StreamingResponse(
+            stream(spec, filters),
+            media_type=STREAM_MEDIA_TYPES[format],
+            headers={"Content-Disposition": f"attachment; filename={filename}"},
+        )
+
+    try:
+        await asyncio.to_thread(export_service.check_xlsx_size, db, spec, filters)
+    except export_service.ExportTooLarge as exc:
+        raise HTTPException(status_code=413, detail=str(exc))
+    finally:
+        db.close()
+
+    path, _ = await asyncio.to_thread(export_service.build_xlsx, spec, filters, f"{spec.title} ({label})")
+    return FileResponse(
+        path,
+        media_type=XLSX_MEDIA_TYPE,
+        filename=filename,
+        background=BackgroundTask(os.unlink, path),
+    )
+
+
+@router.get("/{dataset}")
+async def export_dataset(
+    dataset: str,
+    format: str = Query("xlsx", regex="^(xlsx|csv|ndjson)$"),
+    company_id: int | None = Query(None),
+    db: Session = Depends(get_read_db),
+    user: dict = Depends(require_admin),
+):
+    """Download a tenant dataset (qa | fee_roster | complaints | chat_logs) as xlsx, csv or ndjson.
+
+    관리자는 자기 회사만, super_admin 은 company_id 로 회사를 지정한다.
+    상담 로그를 기간/조건으로 거르려면 /admin/chat-logs/export 를 쓴다 (같은 export_response 경로).
+    """
+    spec = export_service.DATASETS.get(dataset)
+    if spec is None:
+        raise HTTPException(status_code=404, detail="알 수 없는 데이터셋입니다.")
+    cid = user["company_id"]
+    if cid == 0:
+        if company_id is None:
+            raise HTTPException(status_code=400, detail="company_id 를 지정해주세요.")
+        cid = company_id
+    return await export_response(db, dataset, [spec.company_col == cid], format, cid)
@@ -19,7 +19,7 @@ from app.config import (
     RATE_LIMIT_FEE_SMS,
     RATE_LIMIT_FEE_VERIFY,
 )
-from app.database import get_db
+from app.database import get_db, get_read_db
 from app.dependencies import require_admin, require_fee_token
 from app.models.access_log import AccessLog
 from app.models.chat_thread import ChatThread
@@ -205,13 +205,14 @@ def send_sms(req: SendSmsRequest, request: Request, db: Session = Depends(get_db
     else:
         db.add(FeeOtp(company_id=company_id, dong=dong, ho=ho, code=code, expires_at=expires_at))
 
+    # 발송 전에 커밋 — 짧은 타임아웃 후 outbox 재시도로 늦게 도착해도 코드가 유효하다
+    db.commit()
     try:
         sent = send_fee_otp_alimtalk(entry.phone, code, FEE_OTP_TTL_MINUTES)
     except Exception:
         logger.exception("관리비 인증번호 알림톡 발송 실패")
         sent = False
 
-    db.commit()
     if not sent:
         _log_access(db, company_id, dong, ho, request, "send_sms", False)
         return {"success": False, "message": "인증번호 발송에 실패했습니다. 잠시 후 다시 시도해 주세요."}
@@ -269,7 +270,7 @@ def verify_otp(req: VerifyOtpRequest, request: Request, db: Session = Depends(ge
 
 @router.get("/admin-stats")
 def admin_fee_stats(
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     admin: dict = Depends(require_admin),
 ):
     """관리자 전용 관리비 조회 통계 (일별/월별/년도별) — 관리자 자체 조회(admin_query)는 입주민 사용 통계가 아니므로 제외"""
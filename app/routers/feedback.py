@@ -1,12 +1,14 @@
-from datetime import datetime
+from datetime import datetime, timedelta
 
 from fastapi import APIRouter, Cookie, Depends, HTTPException, Query, Request
 from sqlalchemy.orm import Session
 
-from app.database import get_db
-from app.dependencies import require_admin, require_auth
+from app.database import get_db, get_read_db
+from app.dependencies import get_auth_payload, require_admin, require_auth
 from app.models.chat_log import ChatLog
 from app.models.feedback import Feedback
+from app.pagination import after, decode_cursor, encode_cursor
+from app.routers.exports import export_response
 from app.schemas.feedback import (
     ChatLogItem,
     ChatLogListResponse,
@@ -19,18 +21,13 @@ from app.schemas.feedback import (
     UnmatchedItem,
     UnmatchedListResponse,
 )
-from app.services.jwt_service import decode_token
 
 router = APIRouter(tags=["feedback"])
 
 
 def _optional_user(request: Request, session_token: str | None = Cookie(None)) -> dict | None:
     """Extract user from JWT if present, return None otherwise."""
-    auth_header = request.headers.get("authorization", "")
-    token = auth_header[7:] if auth_header.startswith("Bearer ") else session_token
-    if not token:
-        return None
-    return decode_token(token)
+    return get_auth_payload(request)
 
 
 @router.post("/api/feedback", response_model=FeedbackResponse, status_code=201)
@@ -166,14 +163,46 @@ def update_feedback_status(
     return FeedbackStatusResponse(id=fb.id, status=fb.status)
 
 
+def _chat_log_page(query, size: int, cursor: str | None, page: int):
+    """(items, total, pages, next_cursor) ordered by (timestamp, log_id) desc.
+
+    cursor 가 None 이면 기존 OFFSET + COUNT, 주어지면(첫 페이지는 빈 값) 키셋으로
+    읽고 COUNT 는 생략한다 (total/pages 는 None).
+    """
+    order = (ChatLog.timestamp.desc(), ChatLog.log_id.desc())
+    if cursor is None:
+        total = query.count()
+        pages = max(1, (total + size - 1) // size)
+        items = query.order_by(*order).offset((page - 1) * size).limit(size).all()
+        return items, total, pages, None
+
+    if cursor:
+        try:
+            ts, log_id = decode_cursor(cursor, datetime, int)
+        except ValueError:
+            raise HTTPException(status_code=400, detail="잘못된 cursor 입니다.")
+        query = query.filter(after(ChatLog.timestamp, ChatLog.log_id, ts, log_id))
+    items = query.order_by(*order).limit(size + 1).all()
+    next_cursor = None
+    if len(items) > size:
+        items = items[:size]
+        next_cursor = encode_cursor(items[-1].timestamp, items[-1].log_id)
+    return items, None, None, next_cursor
+
+
 @router.get("/admin/unmatched", response_model=UnmatchedListResponse)
 def list_unmatched(
     page: int = 1,
-    size: int = 20,
+    size: int = Query(20, ge=1, le=200),
+    cursor: str | None = Query(None),
     db: Session = Depends(get_db),
     user: dict = Depends(require_admin),
 ):
-    """List unmatched questions (used_rag=false and no qa_id)."""
+    """List unmatched questions (used_rag=false and no qa_id).
+
+    cursor: keyset pagination on (timestamp, log_id) — empty for the first page,
+    then next_cursor. Without it, page-based OFFSET pagination.
+    """
     company_id = user["company_id"]
     query = db.query(ChatLog).filter(
         ChatLog.used_rag == False,
@@ -182,14 +211,7 @@ def list_unmatched(
     if company_id != 0:
         query = query.filter(ChatLog.company_id == company_id)
 
-    total = query.count()
-    pages = max(1, (total + size - 1) // size)
-    items = (
-        query.order_by(ChatLog.timestamp.desc())
-        .offset((page - 1) * size)
-        .limit(size)
-        .all()
-    )
+    items, total, pages, next_cursor = _chat_log_page(query, size, cursor, page)
 
     result = [
         UnmatchedItem(
@@ -202,29 +224,60 @@ def list_unmatched(
         for item in items
     ]
 
-    return UnmatchedListResponse(items=result, total=total, page=page, pages=pages)
+    return UnmatchedListResponse(items=result, total=total, page=page, pages=pages, next_cursor=next_cursor)
 
 
 @router.get("/admin/chat-logs", response_model=ChatLogListResponse)
 def list_chat_logs(
     page: int = 1,
-    size: int = 20,
-    db: Session = Depends(get_db),
+    size: int = Query(20, ge=1, le=200),
+    cursor: str | None = Query(None),
+    db: Session = Depends(get_read_db),
     user: dict = Depends(require_admin),
 ):
-    """List all chat logs (admin)."""
+    """List all chat logs (admin). cursor: keyset pagination as in list_unmatched."""
     company_id = user["company_id"]
     query = db.query(ChatLog)
     if company_id != 0:
         query = query.filter(ChatLog.company_id == company_id)
 
-    total = query.count()
-    pages = max(1, (total + size - 1) // size)
-    items = (
-        query.order_by(ChatLog.timestamp.desc())
-        .offset((page - 1) * size)
-        .limit(size)
-        .all()
-    )
+    items, total, pages, next_cursor = _chat_log_page(query, size, cursor, page)
+    return ChatLogListResponse(items=items, total=total, page=page, pages=pages, next_cursor=next_cursor)
+
 
-    return ChatLogListResponse(items=items, total=total, page=page, pages=pages)
+@router.get("/admin/chat-logs/export")
+async def export_chat_logs(
+    format: str = Query("ndjson", regex="^(ndjson|csv|xlsx)$"),
+    date_from: str | None = Query(None, alias="from"),
+    date_to: str | None = Query(None, alias="to"),
+    used_rag: bool | None = Query(None),
+    unmatched: bool = Query(False),
+    company_id: int | None = Query(None),
+    db: Session = Depends(get_read_db),
+    user: dict = Depends(require_admin),
+):
+    """Stream a tenant's chat logs as NDJSON, CSV or XLSX (oldest first).
+
+    from/to: YYYY-MM-DD (inclusive). unmatched=true: used_rag=false and no qa_id.
+    super_admin 은 company_id 로 회사를 지정할 수 있고, 생략하면 전체.
+    내보내기 자체는 export_service 의 chat_logs 데이터셋 경로를 그대로 쓴다.
+    """
+    filters = []
+    cid = user["company_id"]
+    if cid == 0:
+        cid = company_id
+    if cid is not None:
+        filters.append(ChatLog.company_id == cid)
+    try:
+        if date_from:
+            filters.append(ChatLog.timestamp >= datetime.strptime(date_from, "%Y-%m-%d"))
+        if date_to:
+            filters.append(ChatLog.timestamp < datetime.strptime(date_to, "%Y-%m-%d") + timedelta(days=1))
+    except ValueError:
+        raise HTTPException(status_code=400, detail="날짜 형식은 YYYY-MM-DD 입니다.")
+    if used_rag is not None:
+        filters.append(ChatLog.used_rag == used_rag)
+    if unmatched:
+        filters.extend([ChatLog.used_rag == False, ChatLog.qa_id == None])
+
+    return await export_response(db, "chat_logs", filters, format, cid or "all")
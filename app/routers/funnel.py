@@ -0,0 +1,73 @@
+from datetime import datetime, timedelta
+from typing import Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy.orm import Session
+
+from app.database import get_db, get_read_db
+from app.dependencies import require_super_admin
+from app.services import funnel_analytics
+
+router = APIRouter(prefix="/api/funnel", tags=["funnel"])
+
+
+@router.get("/conversion")
+def get_funnel_conversion(
+    date_from: str = Query(..., alias="from"),
+    date_to: str = Query(..., alias="to"),
+    cta_type: Optional[str] = Query(None),
+    page_path: Optional[str] = Query(None),
+    visitor_type: Optional[str] = Query(None),
+    device_type: Optional[str] = Query(None),
+    utm_source: Optional[str] = Query(None),
+    utm_medium: Optional[str] = Query(None),
+    utm_campaign: Optional[str] = Query(None),
+    group_by: Optional[str] = Query(None),
+    db: Session = Depends(get_read_db),
+    user: dict = Depends(require_super_admin),
+):
+    """
+    CTA funnel (impression → click → modal_open → kakao_redirect) for [from, to].
+    Served from the hourly rollups (cta_funnel_hourly), not the raw click log.
+    """
+    try:
+        dt_from = datetime.strptime(date_from, "%Y-%m-%d")
+        dt_to = datetime.strptime(date_to, "%Y-%m-%d") + timedelta(days=1)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="날짜 형식은 YYYY-MM-DD 입니다.")
+
+    filters = {
+        name: value
+        for name, value in (
+            ("cta_type", cta_type),
+            ("page_path", page_path),
+            ("visitor_type", visitor_type),
+            ("device_type", device_type),
+            ("utm_source", utm_source),
+            ("utm_medium", utm_medium),
+            ("utm_campaign", utm_campaign),
+        )
+        if value is not None
+    }
+    try:
+        groups = funnel_analytics.conversion(db, dt_from, dt_to, filters, group_by)
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc))
+
+    return {
+        "from": date_from,
+        "to": date_to,
+        "group_by": group_by,
+        "steps": list(funnel_analytics.FUNNEL_STEPS),
+        "items": groups,
+    }
+
+
+@router.post("/rebuild")
+def rebuild_funnel(
+    db: Session = Depends(get_db),
+    user: dict = Depends(require_super_admin),
+):
+    """Recompute the rollups from cta_click_logs (backfill after deploy / repair)."""
+    events = funnel_analytics.rebuild(db)
+    return {"detail": "rebuilt", "events": events}
@@ -19,7 +19,7 @@ from app.dependencies import require_admin
 from app.models.market import (
     ApartmentResident, MarketPost, MarketImage, MarketComment, MarketReport
 )
-from app.services.image_upload import save_image
+from app.services.image_upload import process_upload, variant_url
 
 logger = logging.getLogger("acchelper")
 router = APIRouter(prefix="/api/market", tags=["market"])
@@ -95,7 +95,7 @@ def _time_ago(dt: datetime) -> str:
 
 
 def _post_to_dict(post: MarketPost, images: list, comment_count: int = 0) -> dict:
-    thumbnail = images[0].image_url if images else None
+    thumbnail = variant_url(images[0].image_url, "thumb") if images else None
     return {
         "id": post.id,
         "category": post.category,
@@ -108,6 +108,7 @@ def _post_to_dict(post: MarketPost, images: list, comment_count: int = 0) -> dic
         "created_at": post.created_at.isoformat(),
         "thumbnail": thumbnail,
         "images": [img.image_url for img in images],
+        "images_md": [variant_url(img.image_url, "md") for img in images],
         "comment_count": comment_count,
     }
 
@@ -331,8 +332,8 @@ async def create_post(
         if not file_bytes:
             continue
         try:
-            filename = save_image(file_bytes, img.filename)
-            url = f"/uploads/{filename}"
+            saved = await process_upload(file_bytes, img.filename)
+            url = saved["url"]
             db.add(MarketImage(post_id=post.id, image_url=url))
             saved_images.append(url)
         except ValueError as e:
@@ -0,0 +1,30 @@
+import hmac
+
+from fastapi import APIRouter, Cookie, Request
+from fastapi.responses import PlainTextResponse
+
+from app import metrics
+from app.config import METRICS_TOKEN
+from app.dependencies import require_super_admin
+
+router = APIRouter(prefix="/api/metrics", tags=["metrics"])
+
+
+@router.get("", response_class=PlainTextResponse)
+def get_metrics(request: Request, session_token: str | None = Cookie(None)):
+    """Prometheus 텍스트 포맷 메트릭.
+
+    METRICS_TOKEN 이 설정되어 있으면 `Authorization: Bearer <token>` 으로 스크레이프,
+    아니면 최고 관리자 로그인이 필요하다.
+    """
+    auth_header = request.headers.get("authorization", "")
+    if not (
+        METRICS_TOKEN
+        and auth_header.startswith("Bearer ")
+        and hmac.compare_digest(auth_header[7:], METRICS_TOKEN)
+    ):
+        require_super_admin(request, session_token)
+    return PlainTextResponse(
+        metrics.registry.render(),
+        media_type="text/plain; version=0.0.4; charset=utf-8",
+    )
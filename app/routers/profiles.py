@@ -0,0 +1,19 @@
+from fastapi import APIRouter, Depends, HTTPException
+from fastapi.responses import PlainTextResponse
+
+from app.dependencies import require_super_admin
+from app.profiling import get_profile
+
+router = APIRouter(prefix="/api/profiles", tags=["profiles"])
+
+
+@router.get("/{profile_id}", response_class=PlainTextResponse)
+def download_profile(profile_id: str, user: dict = Depends(require_super_admin)):
+    """X-Profile 요청으로 수집된 샘플링 프로파일 다운로드 (최고 관리자 전용)"""
+    report = get_profile(profile_id)
+    if report is None:
+        raise HTTPException(status_code=404, detail="프로파일을 찾을 수 없습니다.")
+    return PlainTextResponse(
+        report,
+        headers={"Content-Disposition": f'attachment; filename="profile-{profile_id}.txt"'},
+    )
@@ -9,7 +9,7 @@ from sqlalchemy.orm import Session
 from app.database import get_db
 from app.dependencies import require_admin
 from app.models.prompt_template import PromptTemplate
-from app.services.chat_service import DEFAULT_SYSTEM_PROMPT
+from app.services.prompt_cache import DEFAULT_SYSTEM_PROMPT
 from app.utils import now_kst
 
 router = APIRouter(prefix="/api/prompts", tags=["prompts"])
@@ -3,18 +3,24 @@ from datetime import datetime
 from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy.orm import Session
 
+from app.config import QA_DUPLICATE_THRESHOLD
 from app.database import get_db
 from app.dependencies import require_admin, require_auth
 from app.models.chat_log import ChatLog
 from app.models.company import Company
 from app.models.qa_knowledge import QaKnowledge
+from app.pagination import after, decode_cursor, encode_cursor
 from app.quota import increment_usage
 from app.schemas.qa import QaCreate, QaListResponse, QaMoveCategory, QaResponse, QaUpdate
+from app.services import qa_search
 from app.services.embedding_service import delete_qa_embedding, upsert_qa_embedding
+from app.services.qa_duplicate_index import duplicate_index, rerank_by_embedding
 from app.utils import now_kst
 
 router = APIRouter(prefix="/api/qa", tags=["qa"])
 
+DUPLICATE_RERANK_POOL = 20  # rerank=true 일 때 임베딩으로 다시 정렬할 후보 수
+
 
 @router.get("", response_model=QaListResponse)
 def list_qa(
@@ -25,9 +31,17 @@ def list_qa(
     status: str = "",
     created_by: str | None = Query(None),
     company_id: int | None = Query(None, alias="company_id"),
+    sort: str = Query("recent", regex="^(recent|relevance)$"),
+    cursor: str | None = Query(None),
     db: Session = Depends(get_db),
     user: dict = Depends(require_auth),
 ):
+    """QA 목록. search 는 전문 검색 인덱스(qa_search)로 처리한다.
+
+    sort=relevance: 검색어 관련도순 (검색어가 있을 때). 항목마다 highlight 포함.
+    cursor: 키셋 페이지네이션 — 첫 페이지는 빈 값(cursor=), 이후 응답의 next_cursor.
+    cursor 를 주지 않으면 기존 page 기반 OFFSET 페이지네이션.
+    """
     user_company_id = user["company_id"]
     query = db.query(QaKnowledge)
     if user_company_id != 0:
@@ -37,12 +51,9 @@ def list_qa(
         # super_admin with company filter
         query = query.filter(QaKnowledge.company_id == company_id)
 
+    score = None
     if search:
-        query = query.filter(
-            QaKnowledge.question.contains(search)
-            | QaKnowledge.answer.contains(search)
-            | QaKnowledge.keywords.contains(search)
-        )
+        query, score = qa_search.apply_search(db, query, search)
     if category:
         query = query.filter(QaKnowledge.category == category)
     if status == "active":
@@ -54,12 +65,36 @@ def list_qa(
 
     total = query.count()
     pages = max(1, (total + size - 1) // size)
-    items = (
-        query.order_by(QaKnowledge.qa_id.desc())
-        .offset((page - 1) * size)
-        .limit(size)
-        .all()
-    )
+
+    by_relevance = sort == "relevance" and score is not None
+    if by_relevance:
+        query = query.add_columns(score.label("score"))
+        order = (score.desc(), QaKnowledge.qa_id.desc())
+    else:
+        order = (QaKnowledge.qa_id.desc(),)
+
+    next_cursor = None
+    if cursor is not None:
+        if cursor:
+            try:
+                if by_relevance:
+                    last_score, last_id = decode_cursor(cursor, float, int)
+                    query = query.filter(after(score, QaKnowledge.qa_id, last_score, last_id))
+                else:
+                    (last_id,) = decode_cursor(cursor, int)
+                    query = query.filter(QaKnowledge.qa_id < last_id)
+            except ValueError:
+                raise HTTPException(status_code=400, detail="잘못된 cursor 입니다.")
+        rows = query.order_by(*order).limit(size + 1).all()
+        if len(rows) > size:
+            rows = rows[:size]
+            last = rows[-1]
+            next_cursor = (
+                encode_cursor(float(last.score), last[0].qa_id) if by_relevance
+                else encode_cursor(last.qa_id)
+            )
+    else:
+        rows = query.order_by(*order).offset((page - 1) * size).limit(size).all()
 
     # Build company_id → company_name map
     company_map = {}
@@ -68,49 +103,56 @@ def list_qa(
         company_map = {c.company_id: c.company_name for c in companies}
 
     result_items = []
-    for item in items:
+    for row in rows:
+        item, item_score = (row[0], row[1]) if by_relevance else (row, None)
         resp = QaResponse.model_validate(item)
         resp.company_name = company_map.get(item.company_id)
+        if search:
+            marks = {
+                "question": qa_search.highlight(item.question, search),
+                "answer": qa_search.highlight(item.answer, search, snippet=True),
+                "keywords": qa_search.highlight(item.keywords, search),
+            }
+            resp.highlight = {k: v for k, v in marks.items() if v is not None}
+            resp.score = float(item_score) if item_score is not None else None
         result_items.append(resp)
 
-    return QaListResponse(items=result_items, total=total, page=page, pages=pages)
+    return QaListResponse(items=result_items, total=total, page=page, pages=pages, next_cursor=next_cursor)
 
 
 @router.get("/check-duplicate")
 def check_duplicate(
     question: str = Query(..., min_length=1),
     exclude_id: int | None = Query(None),
+    rerank: bool = Query(False),
     db: Session = Depends(get_db),
     user: dict = Depends(require_auth),
 ):
-    """Return similar questions for duplicate warning."""
+    """Return similar questions for duplicate warning.
+
+    Served from the per-tenant bigram index (qa_duplicate_index); `rerank=true`
+    additionally blends in embedding similarity when pgvector is available.
+    """
     company_id = user["company_id"]
     q = question.strip().lower()
     if len(q) < 5:
         return {"duplicates": []}
 
-    qa_query = db.query(QaKnowledge)
-    if company_id != 0:
-        qa_query = qa_query.filter(QaKnowledge.company_id == company_id)
-    all_qa = qa_query.all()
-    results = []
-    for qa in all_qa:
-        if exclude_id and qa.qa_id == exclude_id:
-            continue
-        existing = qa.question.strip().lower()
-        if len(q) == 0 or len(existing) == 0:
-            continue
-        common = sum(1 for c in q if c in existing)
-        similarity = (2.0 * common) / (len(q) + len(existing))
-        if similarity >= 0.8:
-            results.append({
-                "qa_id": qa.qa_id,
-                "question": qa.question,
-                "similarity": round(similarity * 100),
-            })
-
-    results.sort(key=lambda x: x["similarity"], reverse=True)
-    return {"duplicates": results[:5]}
+    results = duplicate_index.search(
+        company_id,
+        q,
+        QA_DUPLICATE_THRESHOLD,
+        limit=DUPLICATE_RERANK_POOL if rerank else 5,
+        exclude_id=exclude_id,
+    )
+    if rerank:
+        results = rerank_by_embedding(db, q, results)
+    return {
+        "duplicates": [
+            {"qa_id": r["qa_id"], "question": r["question"], "similarity": round(r["similarity"] * 100)}
+            for r in results[:5]
+        ]
+    }
 
 
 @router.patch("/move-category")
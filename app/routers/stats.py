@@ -5,7 +5,7 @@ from fastapi import APIRouter, Depends, Query
 from sqlalchemy import Integer as SAInteger, String, case, cast, func, literal_column
 from sqlalchemy.orm import Session
 
-from app.database import get_db
+from app.database import get_read_db
 from app.dependencies import require_auth, require_super_admin
 from app.models.access_log import AccessLog
 from app.models.admin_user import AdminUser
@@ -28,7 +28,7 @@ def _current_yyyymm() -> str:
 
 @router.get("")
 def get_stats(
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     user: dict = Depends(require_auth),
 ):
     company_id = user["company_id"]
@@ -123,7 +123,7 @@ def get_stats(
 
 @router.get("/overview")
 def get_overview(
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     user: dict = Depends(require_super_admin),
 ):
     """Super admin: overview stats across all companies."""
@@ -197,7 +197,7 @@ def get_overview(
 @router.get("/trends")
 def get_trends(
     days: int = Query(30, ge=1, le=90),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     user: dict = Depends(require_auth),
 ):
     """Daily chat/RAG usage trends."""
@@ -233,7 +233,7 @@ def get_usage_stats(
     date_from: str = Query(..., alias="from"),
     date_to: str = Query(..., alias="to"),
     company_id: Optional[int] = Query(None),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     user: dict = Depends(require_auth),
 ):
     """
@@ -346,7 +346,7 @@ def get_question_views(
     date_from: str = Query(..., alias="from"),
     date_to: str = Query(..., alias="to"),
     company_id: Optional[int] = Query(None),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     user: dict = Depends(require_auth),
 ):
     """
@@ -410,7 +410,7 @@ def get_question_views_detail(
     page: int = Query(1, ge=1),
     size: int = Query(20, ge=1, le=100),
     company_id: Optional[int] = Query(None),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     user: dict = Depends(require_auth),
 ):
     """
@@ -475,7 +475,7 @@ def get_complaint_stats(
     date_from: str = Query(..., alias="from"),
     date_to: str = Query(..., alias="to"),
     period: str = Query("monthly", regex="^(daily|monthly|quarterly|yearly)$"),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     user: dict = Depends(require_auth),
 ):
     """민원 통계 — 기간별 접수·답변 현황."""
@@ -529,7 +529,7 @@ def get_market_stats(
     date_from: str = Query(..., alias="from"),
     date_to: str = Query(..., alias="to"),
     period: str = Query("monthly", regex="^(daily|monthly|quarterly|yearly)$"),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     user: dict = Depends(require_auth),
 ):
     """당근마켓 통계 — 기간별 게시글·댓글 현황."""
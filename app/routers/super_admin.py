@@ -3,6 +3,8 @@
 import io
 import logging
 import os
+import shutil
+import tempfile
 from pathlib import Path
 
 from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Query, UploadFile, File
@@ -15,9 +17,9 @@ from app.config import DATA_DIR
 from app.database import SessionLocal, get_db
 from app.dependencies import require_super_admin
 from app.models.company import Company
-from app.models.qa_knowledge import QaKnowledge
 from app.models.tenant_quota import TenantQuota
-from app.services.embedding_service import bulk_rebuild_embeddings, upsert_qa_embedding
+from app.services import qa_import
+from app.services.embedding_service import bulk_rebuild_embeddings
 
 logger = logging.getLogger("acchelper")
 
@@ -138,9 +140,6 @@ def rebuild_embeddings(
     return {"success": True, "message": "임베딩 재생성을 시작했습니다. 완료까지 QA 개수에 따라 몇 분 걸릴 수 있습니다."}
 
 
-VALID_CATEGORIES = {"세금", "급여", "비용처리", "회계처리", "기타"}
-
-
 @router.get("/qa/upload-template")
 def download_upload_template(user: dict = Depends(require_super_admin)):
     """Download empty Excel template for QA bulk upload."""
@@ -204,12 +203,17 @@ def download_upload_template(user: dict = Depends(require_super_admin)):
 
 @router.post("/qa/upload")
 def upload_qa_excel(
+    background_tasks: BackgroundTasks,
     company_id: int = Query(...),
     file: UploadFile = File(...),
     db: Session = Depends(get_db),
     user: dict = Depends(require_super_admin),
 ):
-    """Bulk-upload QA items from an Excel file."""
+    """Start a background bulk import of QA items from an Excel file.
+
+    파일을 임시 파일로 받아 형식만 확인한 뒤 바로 job_id 를 돌려준다.
+    진행률·행별 오류는 GET /api/super/qa/upload/{job_id} 로 조회한다.
+    """
     if not file.filename or not file.filename.endswith(".xlsx"):
         raise HTTPException(status_code=400, detail="xlsx 파일만 업로드 가능합니다.")
 
@@ -220,86 +224,30 @@ def upload_qa_excel(
 
     from openpyxl import load_workbook
 
+    fd, path = tempfile.mkstemp(prefix="qa_import_", suffix=".xlsx")
     try:
-        contents = file.file.read()
-        wb = load_workbook(filename=io.BytesIO(contents), read_only=True)
+        with os.fdopen(fd, "wb") as out:
+            shutil.copyfileobj(file.file, out)
+        load_workbook(filename=path, read_only=True).close()
     except Exception:
+        os.unlink(path)
         raise HTTPException(status_code=400, detail="엑셀 파일을 읽을 수 없습니다.")
 
-    ws = wb.active
-    rows = list(ws.iter_rows(min_row=2, values_only=True))
-
-    created = 0
-    skipped = 0
-    failed = 0
-    errors = []
-    user_id = user.get("user_id")
-
-    for idx, row in enumerate(rows, start=2):
-        # Skip empty rows
-        if not row or all(cell is None or str(cell).strip() == "" for cell in row):
-            skipped += 1
-            continue
-
-        # Extract columns (pad with None if row is shorter)
-        padded = list(row) + [None] * (7 - len(row)) if len(row) < 7 else list(row)
-        category = str(padded[0] or "").strip()
-        question = str(padded[1] or "").strip()
-        answer = str(padded[2] or "").strip()
-        keywords = str(padded[3] or "").strip()
-        aliases = str(padded[4] or "").strip()
-        tags = str(padded[5] or "").strip()
-        active_str = str(padded[6] or "활성").strip()
-
-        # Validation
-        row_errors = []
-        if category not in VALID_CATEGORIES:
-            row_errors.append(f"카테고리가 유효하지 않습니다 ('{category}')")
-        if len(question) < 5:
-            row_errors.append("질문이 5자 미만입니다")
-        if len(answer) < 10:
-            row_errors.append("답변이 10자 미만입니다")
-
-        if row_errors:
-            failed += 1
-            errors.append(f"{idx}행: {', '.join(row_errors)}")
-            continue
-
-        is_active = active_str != "비활성"
-
-        qa = QaKnowledge(
-            company_id=company_id,
-            category=category,
-            question=question,
-            answer=answer,
-            keywords=keywords,
-            aliases=aliases,
-            tags=tags,
-            is_active=is_active,
-            created_by=user_id,
-            updated_by=user_id,
-        )
-        db.add(qa)
-        db.flush()  # Get qa_id for embedding
-
-        try:
-            upsert_qa_embedding(db, qa)
-        except Exception as e:
-            logger.warning("Embedding failed for row %d: %s", idx, e)
-
-        created += 1
+    job = qa_import.create_job(company_id, file.filename)
+    background_tasks.add_task(qa_import.run_import, job, path, user.get("user_id"))
+    return {"success": True, **job.to_dict(), "status_url": f"/api/super/qa/upload/{job.job_id}"}
 
-    db.commit()
-    wb.close()
 
-    return {
-        "success": True,
-        "total_rows": len(rows),
-        "created": created,
-        "skipped": skipped,
-        "failed": failed,
-        "errors": errors,
-    }
+@router.get("/qa/upload/{job_id}")
+def get_qa_upload_job(
+    job_id: str,
+    user: dict = Depends(require_super_admin),
+):
+    """Progress and per-row errors of a QA bulk import job."""
+    job = qa_import.get_job(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="업로드 작업을 찾을 수 없습니다.")
+    return {"success": True, **job}
 
 
 # ── ERP Collector 배포 ───────────────────────────────────────────────────────
@@ -1,7 +1,7 @@
 from fastapi import APIRouter, Depends, HTTPException, Request, UploadFile, File
 
 from app.dependencies import require_admin
-from app.services.image_upload import save_image
+from app.services.image_upload import process_upload
 
 router = APIRouter(prefix="/api/upload", tags=["upload"])
 
@@ -19,12 +19,14 @@ async def upload_image_endpoint(
     file_bytes = await file.read()
 
     try:
-        filename = save_image(file_bytes, file.filename)
+        saved = await process_upload(file_bytes, file.filename)
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
 
-    # Build absolute public URL
+    # Build absolute public URLs (original + thumb/md variants)
     base_url = str(request.base_url).rstrip("/")
-    url = f"{base_url}/uploads/{filename}"
-
-    return {"url": url}
+    return {
+        key: f"{base_url}{value}"
+        for key, value in saved.items()
+        if key.endswith("url")
+    }
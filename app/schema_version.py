@@ -0,0 +1,108 @@
+"""Schema version gate for startup DB initialization.
+
+run_migration / create_all / 인덱스 / setup_rls / seed_data 는 스키마 지문(fingerprint)이
+바뀌었을 때만 한 번 실행한다. 지문은 SQLAlchemy 메타데이터(테이블·컬럼·타입)와
+migrate.py / rls.py / seed.py 소스, SCHEMA_VERSION 상수로 계산하므로
+모델이나 마이그레이션 코드를 수정하면 다음 부팅에서 자동으로 다시 실행된다.
+
+여러 워커가 동시에 부팅해도 한 워커만 초기화하도록 잠금을 건다.
+- PostgreSQL: pg_advisory_lock
+- SQLite: DB 파일 옆 .startup.lock 에 flock
+"""
+
+import hashlib
+import logging
+from contextlib import contextmanager
+from pathlib import Path
+
+from sqlalchemy import text
+from sqlalchemy.engine import Engine
+
+from app.utils import now_kst
+
+logger = logging.getLogger("acchelper")
+
+# 소스 지문으로 잡히지 않는 변경(예: 데이터 백필)을 강제로 재실행하려면 올린다.
+SCHEMA_VERSION = 1
+
+_ADVISORY_LOCK_KEY = 7_310_245_133
+_SOURCE_FILES = ("migrate.py", "rls.py", "seed.py")
+
+
+def compute_fingerprint(metadata, extra: tuple[str, ...] = ()) -> str:
+    h = hashlib.sha256(f"v{SCHEMA_VERSION}".encode())
+    for table in sorted(metadata.tables.values(), key=lambda t: t.name):
+        h.update(table.name.encode())
+        for col in table.columns:
+            h.update(f"{col.name}:{col.type!r}:{col.nullable}:{col.primary_key}".encode())
+        for idx in sorted(table.indexes, key=lambda i: i.name or ""):
+            h.update(f"idx:{idx.name}:{[c.name for c in idx.columns]}".encode())
+    base = Path(__file__).resolve().parent
+    for name in _SOURCE_FILES:
+        path = base / name
+        if path.exists():
+            h.update(path.read_bytes())
+    for item in extra:
+        h.update(item.encode())
+    return h.hexdigest()[:32]
+
+
+def _ensure_table(conn) -> None:
+    conn.execute(text(
+        "CREATE TABLE IF NOT EXISTS schema_version ("
+        " id INTEGER PRIMARY KEY,"
+        " fingerprint VARCHAR(64) NOT NULL,"
+        " applied_at TIMESTAMP"
+        ")"
+    ))
+
+
+def get_applied_fingerprint(engine: Engine) -> str | None:
+    with engine.connect() as conn:
+        _ensure_table(conn)
+        conn.commit()
+        row = conn.execute(text("SELECT fingerprint FROM schema_version WHERE id = 1")).fetchone()
+    return row[0] if row else None
+
+
+def mark_applied(engine: Engine, fingerprint: str) -> None:
+    with engine.begin() as conn:
+        _ensure_table(conn)
+        conn.execute(text("DELETE FROM schema_version WHERE id = 1"))
+        conn.execute(
+            text("INSERT INTO schema_version (id, fingerprint, applied_at) VALUES (1, :fp, :at)"),
+            {"fp": fingerprint, "at": now_kst()},
+        )
+
+
+@contextmanager
+def startup_lock(engine: Engine):
+    """Serialize schema initialization across workers/processes."""
+    backend = engine.url.get_backend_name()
+    if backend == "postgresql":
+        with engine.connect() as conn:
+            conn.execute(text("SELECT pg_advisory_lock(:k)"), {"k": _ADVISORY_LOCK_KEY})
+            conn.commit()
+            try:
+                yield
+            finally:
+                conn.execute(text("SELECT pg_advisory_unlock(:k)"), {"k": _ADVISORY_LOCK_KEY})
+                conn.commit()
+        return
+
+    db_path = engine.url.database if backend == "sqlite" else None
+    try:
+        import fcntl
+    except ImportError:
+        fcntl = None
+    if not db_path or db_path == ":memory:" or fcntl is None:
+        yield
+        return
+
+    lock_path = Path(db_path).with_name(Path(db_path).name + ".startup.lock")
+    with open(lock_path, "w") as fh:
+        fcntl.flock(fh, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(fh, fcntl.LOCK_UN)
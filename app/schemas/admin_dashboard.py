@@ -24,6 +24,8 @@ class SubscriberListResponse(BaseModel):
     success: bool
     items: list[SubscriberItem] = []
     total: int = 0
+    page: int = 1
+    pages: int = 1
 
 
 class PaymentItem(BaseModel):
@@ -71,9 +71,10 @@ class UnmatchedItem(BaseModel):
 
 class UnmatchedListResponse(BaseModel):
     items: list[UnmatchedItem]
-    total: int
+    total: int | None = None  # 키셋(cursor) 모드에서는 COUNT 생략 → None
     page: int
-    pages: int
+    pages: int | None = None
+    next_cursor: str | None = None
 
 
 class ChatLogItem(BaseModel):
@@ -94,6 +95,7 @@ class ChatLogItem(BaseModel):
 
 class ChatLogListResponse(BaseModel):
     items: list[ChatLogItem]
-    total: int
+    total: int | None = None  # 키셋(cursor) 모드에서는 COUNT 생략 → None
     page: int
-    pages: int
+    pages: int | None = None
+    next_cursor: str | None = None
@@ -49,6 +49,8 @@ class QaResponse(BaseModel):
     created_at: datetime
     updated_at: datetime
     company_name: str | None = None
+    highlight: dict[str, str] | None = None  # 검색 시 <mark> 로 강조한 HTML (escape 됨)
+    score: float | None = None  # sort=relevance 일 때 관련도
 
     model_config = {"from_attributes": True}
 
@@ -58,3 +60,4 @@ class QaListResponse(BaseModel):
     total: int
     page: int
     pages: int
+    next_cursor: str | None = None
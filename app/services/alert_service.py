@@ -3,6 +3,10 @@
 - 중복 발송 방지 (alert_count 체크)
 - 관리자 필터링 (receive_unanswered_alert=True, is_active=True)
 - 예외 처리 (관리자 없음, 전화번호 없음, 발송 실패)
+- 알림톡은 alimtalk_outbox 에 넣고 바로 반환한다 — 실제 발송과 재시도는
+  solapi_service 디스패처 스레드가 맡는다. 관리자 여러 명에게 보내는 알림은
+  send_many 로 한 번에 큐에 넣는다. 필요한 값만 읽고 DB 세션을 먼저 닫은 뒤 큐에 넣고,
+  결과 기록은 새 세션에서 한 번에 한다. (alert_count / alimtalk_sent 는 "큐 등록" 기준)
 """
 
 import logging
@@ -15,12 +19,13 @@ from app.models.admin_user import AdminUser
 from app.models.company import Company
 from app.models.unanswered_question import UnansweredQuestion
 from app.services.solapi_service import (
-    send_unanswered_alimtalk,
-    send_complaint_alimtalk,
+    chat_talk_admin_payload,
+    complaint_payload,
+    send_many,
     send_complaint_reply_alimtalk,
     send_market_comment_alimtalk,
-    send_chat_talk_admin_alimtalk,
     send_chat_talk_reply_alimtalk,
+    unanswered_payload,
 )
 from app.utils import now_kst
 
@@ -57,157 +62,166 @@ def _format_time(dt: datetime) -> str:
     return dt.strftime("%Y-%m-%d %H:%M")
 
 
+def _admin_recipients(admins: list[AdminUser], tag: str) -> list[tuple[str, str]]:
+    """[(표시 이름, 전화번호)] — 전화번호 없는 관리자는 건너뛴다."""
+    recipients = []
+    for admin in admins:
+        if not admin.phone:
+            logger.warning("%s 전화번호 없음 | admin_id=%s → skip", tag, admin.user_id)
+            continue
+        recipients.append((admin.full_name or admin.email, admin.phone))
+    return recipients
+
+
+def _fan_out(kind: str, tag: str, recipients: list[tuple[str, str]], build) -> int:
+    """build(phone) -> payload 로 전원 분을 큐에 넣고 등록된 건수를 돌려준다."""
+    payloads = []
+    for _, phone in recipients:
+        payload = build(phone)
+        if payload is None:  # 템플릿 미설정
+            return 0
+        payloads.append(payload)
+
+    results = send_many(kind, payloads)
+    for (label, phone), ok in zip(recipients, results):
+        if ok:
+            logger.info("%s 알림톡 발송 예약 | admin=%s | phone=%s", tag, label, phone)
+        else:
+            logger.error("%s 알림톡 큐 등록 실패 | admin=%s", tag, label)
+    return sum(results)
+
+
 def trigger_unanswered_alert(question_id: int) -> None:
     """
     미답변 질문 알림톡 트리거 (BackgroundTasks에서 호출)
     - 자체 DB 세션 생성 (백그라운드 태스크이므로)
     - 중복 방지: alert_count > 0이면 skip
     """
-    db = SessionLocal()
     try:
-        # 1. 질문 조회
-        question = db.query(UnansweredQuestion).get(question_id)
-        if not question or question.alert_count > 0:
-            return
-
-        # 2. 아파트(회사)명 조회
-        company = db.query(Company).filter(
-            Company.company_id == question.company_id
-        ).first()
-        apt_name = company.company_name if company else "관리자"
-
-        # 2-1. 시설관리 회사는 알림톡 발송 차단
-        if company and is_facility_management_company(company.company_name):
-            logger.info(
-                "[Alert] 시설관리 회사 알림톡 차단 | company_id=%s | name=%s",
-                question.company_id, company.company_name,
-            )
-            return
-
-        # 3. 알림 수신 관리자 목록 조회
-        admins = db.query(AdminUser).filter(
-            AdminUser.company_id == question.company_id,
-            AdminUser.receive_unanswered_alert == True,
-            AdminUser.is_active == True,
-        ).all()
-
-        if not admins:
-            logger.warning(
-                "[Alert] 알림 수신 관리자 없음 | company_id=%s", question.company_id
-            )
-            return
+        db = SessionLocal()
+        try:
+            # 1. 질문 조회
+            question = db.query(UnansweredQuestion).get(question_id)
+            if not question or question.alert_count > 0:
+                return
+
+            # 2. 아파트(회사)명 조회
+            company = db.query(Company).filter(
+                Company.company_id == question.company_id
+            ).first()
+            apt_name = company.company_name if company else "관리자"
+
+            # 2-1. 시설관리 회사는 알림톡 발송 차단
+            if company and is_facility_management_company(company.company_name):
+                logger.info(
+                    "[Alert] 시설관리 회사 알림톡 차단 | company_id=%s | name=%s",
+                    question.company_id, company.company_name,
+                )
+                return
 
-        # 4. 각 관리자에게 알림톡 발송
-        admin_url = _build_admin_url(question.company_id, question.id)
-        success_count = 0
+            # 3. 알림 수신 관리자 목록 조회
+            admins = db.query(AdminUser).filter(
+                AdminUser.company_id == question.company_id,
+                AdminUser.receive_unanswered_alert == True,
+                AdminUser.is_active == True,
+            ).all()
 
-        for admin in admins:
-            if not admin.phone:
+            if not admins:
                 logger.warning(
-                    "[Alert] 전화번호 없음 | admin_id=%s → skip", admin.user_id
-                )
-                continue
-            try:
-                send_unanswered_alimtalk(
-                    to=admin.phone,
-                    apt_name=apt_name,
-                    question=question.question,
-                    time=_format_time(question.created_at),
-                    url=admin_url,
-                )
-                success_count += 1
-                logger.info(
-                    "[Alert] 알림톡 발송 성공 | admin=%s | phone=%s",
-                    admin.full_name or admin.email,
-                    admin.phone,
-                )
-            except Exception as e:
-                logger.error(
-                    "[Alert] 알림톡 발송 실패 | admin_id=%s | %s", admin.user_id, e
+                    "[Alert] 알림 수신 관리자 없음 | company_id=%s", question.company_id
                 )
+                return
+
+            recipients = _admin_recipients(admins, "[Alert]")
+            admin_url = _build_admin_url(question.company_id, question.id)
+            question_text = question.question
+            time_str = _format_time(question.created_at)
+        finally:
+            db.close()
+
+        # 4. 관리자 전원 분을 outbox 에 등록 (DB 세션 반환 후)
+        success_count = _fan_out(
+            "unanswered", "[Alert]", recipients,
+            lambda phone: unanswered_payload(
+                to=phone, apt_name=apt_name, question=question_text, time=time_str, url=admin_url,
+            ),
+        )
 
-        # 5. 발송 기록 업데이트 (1명이라도 성공 시)
+        # 5. 발송 기록 업데이트 (1명 이상 큐에 등록되면)
         if success_count > 0:
-            question.alert_count = 1
-            question.alert_sent_at = now_kst()
-            db.commit()
+            db = SessionLocal()
+            try:
+                db.query(UnansweredQuestion).filter(
+                    UnansweredQuestion.id == question_id,
+                    UnansweredQuestion.alert_count == 0,
+                ).update({"alert_count": 1, "alert_sent_at": now_kst()}, synchronize_session=False)
+                db.commit()
+            finally:
+                db.close()
 
     except Exception as e:
         logger.error(
             "[Alert] trigger_unanswered_alert 오류 | question_id=%s | %s",
             question_id, e,
         )
-    finally:
-        db.close()
 
 
 def trigger_complaint_alert(complaint_id: int) -> None:
     """민원 등록 알림톡 트리거 (BackgroundTasks에서 호출)"""
     from app.models.complaint import Complaint
 
-    db = SessionLocal()
     try:
-        complaint = db.query(Complaint).get(complaint_id)
-        if not complaint:
-            return
-
-        company = db.query(Company).filter(
-            Company.company_id == complaint.company_id
-        ).first()
-        apt_name = company.company_name if company else "관리자"
-
-        if company and is_facility_management_company(company.company_name):
-            logger.info(
-                "[ComplaintAlert] 시설관리 회사 알림톡 차단 | company_id=%s",
-                complaint.company_id,
-            )
-            return
-
-        admins = db.query(AdminUser).filter(
-            AdminUser.company_id == complaint.company_id,
-            AdminUser.receive_complaint_alert == True,
-            AdminUser.is_active == True,
-        ).all()
-
-        if not admins:
-            logger.warning(
-                "[ComplaintAlert] 알림 수신 관리자 없음 | company_id=%s", complaint.company_id
-            )
-            return
+        db = SessionLocal()
+        try:
+            complaint = db.query(Complaint).get(complaint_id)
+            if not complaint:
+                return
 
-        complaint_url = _build_complaint_url(complaint.company_id, complaint.id)
-        complaint_time = _format_time(complaint.created_at)
-        writer_display = f"{complaint.dong} {complaint.ho}"
+            company = db.query(Company).filter(
+                Company.company_id == complaint.company_id
+            ).first()
+            apt_name = company.company_name if company else "관리자"
 
-        for admin in admins:
-            if not admin.phone:
-                continue
-            try:
-                send_complaint_alimtalk(
-                    to=admin.phone,
-                    apt_name=apt_name,
-                    title=complaint.title,
-                    writer=writer_display,
-                    time=complaint_time,
-                    url=complaint_url,
-                )
+            if company and is_facility_management_company(company.company_name):
                 logger.info(
-                    "[ComplaintAlert] 알림톡 발송 성공 | admin=%s | complaint_id=%d",
-                    admin.full_name or admin.email,
-                    complaint.id,
+                    "[ComplaintAlert] 시설관리 회사 알림톡 차단 | company_id=%s",
+                    complaint.company_id,
                 )
-            except Exception as e:
-                logger.error(
-                    "[ComplaintAlert] 알림톡 발송 실패 | admin_id=%s | %s", admin.user_id, e
+                return
+
+            admins = db.query(AdminUser).filter(
+                AdminUser.company_id == complaint.company_id,
+                AdminUser.receive_complaint_alert == True,
+                AdminUser.is_active == True,
+            ).all()
+
+            if not admins:
+                logger.warning(
+                    "[ComplaintAlert] 알림 수신 관리자 없음 | company_id=%s", complaint.company_id
                 )
+                return
+
+            recipients = _admin_recipients(admins, "[ComplaintAlert]")
+            complaint_url = _build_complaint_url(complaint.company_id, complaint.id)
+            complaint_time = _format_time(complaint.created_at)
+            writer_display = f"{complaint.dong} {complaint.ho}"
+            title = complaint.title
+        finally:
+            db.close()
+
+        _fan_out(
+            "complaint", "[ComplaintAlert]", recipients,
+            lambda phone: complaint_payload(
+                to=phone, apt_name=apt_name, title=title, writer=writer_display,
+                time=complaint_time, url=complaint_url,
+            ),
+        )
 
     except Exception as e:
         logger.error(
             "[ComplaintAlert] trigger_complaint_alert 오류 | complaint_id=%s | %s",
             complaint_id, e,
         )
-    finally:
-        db.close()
 
 
 def trigger_complaint_reply_alert(complaint_id: int) -> None:
@@ -241,16 +255,16 @@ def trigger_complaint_reply_alert(complaint_id: int) -> None:
         url = _build_complaint_url(complaint.company_id, complaint.id)
 
         try:
-            send_complaint_reply_alimtalk(
+            if send_complaint_reply_alimtalk(
                 to=complaint.writer_phone,
                 apt_name=apt_name,
                 title=complaint.title,
                 url=url,
-            )
-            logger.info(
-                "[ComplaintReplyAlert] 알림톡 발송 성공 | complaint_id=%d | to=%s",
-                complaint.id, complaint.writer_phone,
-            )
+            ):
+                logger.info(
+                    "[ComplaintReplyAlert] 알림톡 발송 예약 | complaint_id=%d | to=%s",
+                    complaint.id, complaint.writer_phone,
+                )
         except Exception as e:
             logger.error(
                 "[ComplaintReplyAlert] 알림톡 발송 실패 | complaint_id=%s | %s", complaint_id, e
@@ -293,17 +307,17 @@ def trigger_market_comment_alert(post_id: int, comment_content: str, commenter_u
 
         unit_str = post.writer_unit if post.writer_unit.endswith('호') else post.writer_unit + '호'
         unit_display = f"{post.writer_building} {unit_str}"
-        send_market_comment_alimtalk(
+        if send_market_comment_alimtalk(
             to=resident.resident_phone,
             name=resident.resident_name,
             unit=unit_display,
             title=post.title,
             comment=comment_content,
-        )
-        logger.info(
-            "[MarketAlert] 알림톡 발송 성공 | post_id=%d | to=%s",
-            post_id, resident.resident_phone,
-        )
+        ):
+            logger.info(
+                "[MarketAlert] 알림톡 발송 예약 | post_id=%d | to=%s",
+                post_id, resident.resident_phone,
+            )
 
     except Exception as e:
         logger.error(
@@ -318,82 +332,73 @@ def trigger_chat_talk_admin_alert(thread_id: int) -> None:
     """입주민이 스레드에 처음 메시지를 보냈을 때만(재문의부터는 제외) 관리자 전원에게 알림톡 발송."""
     from app.models.chat_thread import ChatThread, ChatMessage
 
-    db = SessionLocal()
     try:
-        thread = db.query(ChatThread).get(thread_id)
-        if not thread:
-            return
-
-        company = db.query(Company).filter(
-            Company.company_id == thread.company_id
-        ).first()
-        apt_name = company.company_name if company else "관리자"
-
-        if company and is_facility_management_company(company.company_name):
-            logger.info(
-                "[ChatTalkAdminAlert] 시설관리 회사 알림톡 차단 | company_id=%s",
-                thread.company_id,
-            )
-            return
+        db = SessionLocal()
+        try:
+            thread = db.query(ChatThread).get(thread_id)
+            if not thread:
+                return
 
-        admins = db.query(AdminUser).filter(
-            AdminUser.company_id == thread.company_id,
-            AdminUser.is_active == True,
-        ).all()
-        if not admins:
-            logger.warning(
-                "[ChatTalkAdminAlert] 알림 수신 관리자 없음 | company_id=%s", thread.company_id
-            )
-            return
+            company = db.query(Company).filter(
+                Company.company_id == thread.company_id
+            ).first()
+            apt_name = company.company_name if company else "관리자"
 
-        last_msg = (
-            db.query(ChatMessage)
-            .filter(ChatMessage.thread_id == thread_id, ChatMessage.sender_type == "resident")
-            .order_by(ChatMessage.created_at.desc())
-            .first()
-        )
-        content = last_msg.content if last_msg else ""
-        time_str = _format_time(last_msg.created_at) if last_msg else _format_time(now_kst())
-        unit_display = f"{thread.dong} {thread.ho}"
-        url = _build_chat_talk_admin_url(thread.company_id, thread.id)
+            if company and is_facility_management_company(company.company_name):
+                logger.info(
+                    "[ChatTalkAdminAlert] 시설관리 회사 알림톡 차단 | company_id=%s",
+                    thread.company_id,
+                )
+                return
 
-        sent_ok = False
-        for admin in admins:
-            if not admin.phone:
+            admins = db.query(AdminUser).filter(
+                AdminUser.company_id == thread.company_id,
+                AdminUser.is_active == True,
+            ).all()
+            if not admins:
                 logger.warning(
-                    "[ChatTalkAdminAlert] 전화번호 없음 | admin_id=%s → skip", admin.user_id
+                    "[ChatTalkAdminAlert] 알림 수신 관리자 없음 | company_id=%s", thread.company_id
                 )
-                continue
+                return
+
+            last_msg = (
+                db.query(ChatMessage)
+                .filter(ChatMessage.thread_id == thread_id, ChatMessage.sender_type == "resident")
+                .order_by(ChatMessage.created_at.desc())
+                .first()
+            )
+            last_msg_id = last_msg.id if last_msg else None
+            content = last_msg.content if last_msg else ""
+            time_str = _format_time(last_msg.created_at) if last_msg else _format_time(now_kst())
+            unit_display = f"{thread.dong} {thread.ho}"
+            url = _build_chat_talk_admin_url(thread.company_id, thread.id)
+            recipients = _admin_recipients(admins, "[ChatTalkAdminAlert]")
+        finally:
+            db.close()
+
+        sent_ok = _fan_out(
+            "chat_talk_admin", "[ChatTalkAdminAlert]", recipients,
+            lambda phone: chat_talk_admin_payload(
+                to=phone, apt_name=apt_name, unit=unit_display,
+                content=content, time=time_str, url=url,
+            ),
+        ) > 0
+
+        if last_msg_id is not None:
+            db = SessionLocal()
             try:
-                if send_chat_talk_admin_alimtalk(
-                    to=admin.phone,
-                    apt_name=apt_name,
-                    unit=unit_display,
-                    content=content,
-                    time=time_str,
-                    url=url,
-                ):
-                    sent_ok = True
-                logger.info(
-                    "[ChatTalkAdminAlert] 알림톡 발송 성공 | admin=%s | thread_id=%d",
-                    admin.full_name or admin.email, thread_id,
+                db.query(ChatMessage).filter(ChatMessage.id == last_msg_id).update(
+                    {"alimtalk_sent": sent_ok}, synchronize_session=False
                 )
-            except Exception as e:
-                logger.error(
-                    "[ChatTalkAdminAlert] 알림톡 발송 실패 | admin_id=%s | %s", admin.user_id, e
-                )
-
-        if last_msg:
-            last_msg.alimtalk_sent = sent_ok
-            db.commit()
+                db.commit()
+            finally:
+                db.close()
 
     except Exception as e:
         logger.error(
             "[ChatTalkAdminAlert] trigger_chat_talk_admin_alert 오류 | thread_id=%s | %s",
             thread_id, e,
         )
-    finally:
-        db.close()
 
 
 def trigger_chat_talk_reply_alert(thread_id: int) -> None:
@@ -447,10 +452,11 @@ def trigger_chat_talk_reply_alert(thread_id: int) -> None:
                 apt_name=apt_name,
                 url=url,
             )
-            logger.info(
-                "[ChatTalkReplyAlert] 알림톡 발송 성공 | thread_id=%d | to=%s",
-                thread_id, thread.resident_phone,
-            )
+            if sent_ok:
+                logger.info(
+                    "[ChatTalkReplyAlert] 알림톡 발송 예약 | thread_id=%d | to=%s",
+                    thread_id, thread.resident_phone,
+                )
         except Exception as e:
             logger.error(
                 "[ChatTalkReplyAlert] 알림톡 발송 실패 | thread_id=%s | %s", thread_id, e
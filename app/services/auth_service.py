@@ -1,17 +1,121 @@
+"""Password hashing and masking helpers.
+
+bcrypt 연산(100~300ms CPU)은 요청 threadpool 대신 전용 스레드 풀에서 실행한다.
+bcrypt 는 해싱 중 GIL 을 놓으므로 스레드로도 코어를 나눠 쓸 수 있다.
+실행 중 + 대기 중 작업 수가 PASSWORD_HASH_MAX_PENDING 을 넘으면 즉시
+PasswordHasherBusy 를 던져(→ 503) 로그인 폭주가 챗봇 등 다른 요청의
+threadpool 워커를 잡아먹지 않게 한다.
+"""
+
 import secrets
 import string
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 
 import bcrypt
 
+from app import metrics
+from app.config import BCRYPT_ROUNDS, PASSWORD_HASH_MAX_PENDING, PASSWORD_HASH_WORKERS
+
+
+class PasswordHasherBusy(RuntimeError):
+    """Raised when the password hashing pool is saturated."""
+
+
+class _PasswordHasher:
+    def __init__(self, workers: int, max_pending: int):
+        self.workers = workers
+        self.max_pending = max_pending
+        self._slots = threading.BoundedSemaphore(max_pending)
+        self._pending = 0
+        self._lock = threading.Lock()
+        self._pool: ThreadPoolExecutor | None = None
+
+    def _get_pool(self) -> ThreadPoolExecutor:
+        with self._lock:
+            if self._pool is None:
+                self._pool = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="bcrypt")
+            return self._pool
+
+    def run(self, op: str, fn, *args):
+        if not self._slots.acquire(blocking=False):
+            metrics.inc("password_hash_rejected_total", op=op)
+            raise PasswordHasherBusy("password hashing pool saturated")
+        with self._lock:
+            self._pending += 1
+        start = time.perf_counter()
+        try:
+            return self._get_pool().submit(fn, *args).result()
+        finally:
+            with self._lock:
+                self._pending -= 1
+            self._slots.release()
+            metrics.observe("password_hash_duration_seconds", time.perf_counter() - start, op=op)
+
+    def pending(self) -> int:
+        return self._pending
+
+    def shutdown(self) -> None:
+        with self._lock:
+            pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.shutdown(wait=False, cancel_futures=True)
+
+
+_hasher = _PasswordHasher(PASSWORD_HASH_WORKERS, PASSWORD_HASH_MAX_PENDING)
+metrics.registry.register_gauge(
+    "password_hash_pending",
+    "bcrypt jobs running or queued in the password hashing pool",
+    lambda: [({}, float(_hasher.pending()))],
+)
+
+
+def shutdown_password_pool() -> None:
+    _hasher.shutdown()
+
+
+def _hashpw(password: str) -> str:
+    return bcrypt.hashpw(password.encode("utf-8"), bcrypt.gensalt(BCRYPT_ROUNDS)).decode("utf-8")
+
+
+def _checkpw(plain_password: str, hashed_password: str) -> bool:
+    return bcrypt.checkpw(plain_password.encode("utf-8"), hashed_password.encode("utf-8"))
+
 
 def hash_password(password: str) -> str:
-    return bcrypt.hashpw(password.encode("utf-8"), bcrypt.gensalt()).decode("utf-8")
+    """Hash in the bounded bcrypt pool. Raises PasswordHasherBusy when saturated."""
+    return _hasher.run("hash", _hashpw, password)
 
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
-    return bcrypt.checkpw(
-        plain_password.encode("utf-8"), hashed_password.encode("utf-8")
-    )
+    """Verify in the bounded bcrypt pool. Raises PasswordHasherBusy when saturated."""
+    return _hasher.run("verify", _checkpw, plain_password, hashed_password)
+
+
+def password_needs_rehash(hashed_password: str) -> bool:
+    """True when the stored hash uses a different bcrypt cost than BCRYPT_ROUNDS."""
+    # $2b$12$<salt+hash>
+    parts = hashed_password.split("$")
+    if len(parts) < 4 or not parts[2].isdigit():
+        return False
+    return int(parts[2]) != BCRYPT_ROUNDS
+
+
+def verify_and_upgrade(user, plain_password: str) -> bool:
+    """Verify a login and transparently re-hash when BCRYPT_ROUNDS changed.
+
+    The new hash is assigned to user.password_hash; the caller's commit persists it.
+    """
+    if not verify_password(plain_password, user.password_hash):
+        return False
+    if password_needs_rehash(user.password_hash):
+        try:
+            user.password_hash = hash_password(plain_password)
+            metrics.inc("password_rehash_total")
+        except PasswordHasherBusy:
+            pass  # 다음 로그인 때 다시 시도
+    return True
 
 
 def mask_email(email: str) -> str:
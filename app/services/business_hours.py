@@ -3,21 +3,23 @@
 평일 09:00~18:00, 점심시간(12:00~13:30) 제외, 주말/법정공휴일 제외.
 공휴일은 공공데이터포털(data.go.kr) "한국천문연구원_특일 정보" API 중
 getRestDeInfo(공휴일 정보, 대체공휴일 포함 실제 휴일 여부 isHoliday=Y 기준)를
-연 단위로 캐싱해서 사용한다.
+연 단위로 public_holidays 테이블과 프로세스 메모리(HolidayCalendar)에 캐싱해서 사용한다.
+영업시간 판정 자체는 메모리만 보는 순수 계산이다.
 
 주의: API 응답 포맷(JSON 구조, 단일 결과 시 dict vs list)은 실제
 HOLIDAY_API_SERVICE_KEY 발급 후 라이브 호출로 검증이 필요한 1차 초안이다.
 """
 
+import asyncio
 import logging
+import threading
 import time
 from datetime import datetime
 
-import httpx
-from sqlalchemy import text
-from sqlalchemy.orm import Session
-
-from app.config import HOLIDAY_API_SERVICE_KEY
+from app.config import HOLIDAY_API_SERVICE_KEY, HOLIDAY_REFRESH_INTERVAL_SEC
+from app.database import SessionLocal
+from app.models.public_holiday import PublicHoliday
+from app.profiling import HTTPX_ASYNC_EVENT_HOOKS
 from app.utils import now_kst
 
 logger = logging.getLogger("acchelper")
@@ -34,92 +36,177 @@ UNAVAILABLE_MESSAGE = (
 
 HOLIDAY_API_URL = "http://apis.data.go.kr/B090041/openapi/service/SpcdeInfoService/getRestDeInfo"
 
-# 공휴일 API 장애 시 매 요청마다 재호출하지 않도록 프로세스 내 쿨다운(초)
+# 공휴일 API 장애 시 매번 재호출하지 않도록 실패 후 재시도 간격(초)
 _HOLIDAY_FETCH_COOLDOWN_SEC = 3600
-_last_fetch_attempt: dict[int, float] = {}  # {year: epoch_seconds}
-
 
-def _fetch_holidays_from_api(year: int) -> list[dict]:
-    """공공데이터포털에서 해당 연도의 법정공휴일 목록을 가져온다.
 
-    실패 시(키 미설정, 네트워크 오류, 응답 파싱 실패 등) 빈 리스트를 반환한다
-    (fail-open — 상위 호출부가 "평일로 간주"하고 톡을 계속 허용하도록).
+async def _fetch_month(client, year: int, month: int) -> list[dict]:
+    resp = await client.get(
+        HOLIDAY_API_URL,
+        params={
+            "serviceKey": HOLIDAY_API_SERVICE_KEY,
+            "solYear": str(year),
+            "solMonth": f"{month:02d}",
+            "numOfRows": "100",
+            "_type": "json",
+        },
+    )
+    resp.raise_for_status()
+    body = resp.json().get("response", {}).get("body", {})
+    items = (body.get("items") or {}).get("item") or []
+    if isinstance(items, dict):
+        items = [items]
+    return [
+        {"locdate": str(item.get("locdate", "")), "name": item.get("dateName", "")}
+        for item in items
+        if item.get("isHoliday") == "Y"
+    ]
+
+
+async def _fetch_holidays_from_api(year: int) -> list[dict] | None:
+    """공공데이터포털에서 해당 연도의 법정공휴일 목록을 가져온다 (12개월 동시 요청).
+
+    실패 시(키 미설정, 네트워크 오류, 응답 파싱 실패 등) None 을 반환한다.
+    한 달이라도 실패하면 불완전한 목록으로 덮어쓰지 않도록 연도 전체를 실패로 본다.
     """
     if not HOLIDAY_API_SERVICE_KEY:
-        return []
+        return None
+
+    import httpx  # lazy: only the background refresher needs it
 
-    holidays: list[dict] = []
     try:
-        with httpx.Client(timeout=10) as client:
-            for month in range(1, 13):
-                resp = client.get(
-                    HOLIDAY_API_URL,
-                    params={
-                        "serviceKey": HOLIDAY_API_SERVICE_KEY,
-                        "solYear": str(year),
-                        "solMonth": f"{month:02d}",
-                        "numOfRows": "100",
-                        "_type": "json",
-                    },
-                )
-                resp.raise_for_status()
-                body = resp.json().get("response", {}).get("body", {})
-                items = (body.get("items") or {}).get("item") or []
-                if isinstance(items, dict):
-                    items = [items]
-                for item in items:
-                    if item.get("isHoliday") != "Y":
-                        continue
-                    holidays.append({
-                        "locdate": str(item.get("locdate", "")),
-                        "name": item.get("dateName", ""),
-                    })
+        async with httpx.AsyncClient(timeout=10, event_hooks=HTTPX_ASYNC_EVENT_HOOKS) as client:
+            months = await asyncio.gather(*(_fetch_month(client, year, m) for m in range(1, 13)))
     except Exception as e:
         logger.warning("[BusinessHours] 공휴일 API 호출 실패 (year=%s): %s", year, e)
-        return []
-
-    return holidays
+        return None
+    return [h for month in months for h in month]
 
 
-def get_holidays_for_year(db: Session, year: int) -> set[str]:
-    """해당 연도의 공휴일(YYYYMMDD) 집합을 반환. DB 캐시 우선, 없으면 API 조회 후 캐싱."""
-    rows = db.execute(
-        text("SELECT holiday_date FROM public_holidays WHERE year = :year"),
-        {"year": year},
-    ).fetchall()
-    if rows:
-        return {r[0] for r in rows}
+class HolidayCalendar:
+    """프로세스 메모리의 공휴일 달력.
 
-    now = time.time()
-    last_attempt = _last_fetch_attempt.get(year, 0)
-    if now - last_attempt < _HOLIDAY_FETCH_COOLDOWN_SEC:
-        return set()  # 최근에 실패했음 — 쿨다운 중, fail-open
-    _last_fetch_attempt[year] = now
-
-    holidays = _fetch_holidays_from_api(year)
-    if not holidays:
-        return set()
+    시작 시 public_holidays 테이블 전체를 읽어 두고, 백그라운드 태스크가
+    올해/내년을 주기적으로 API 에서 갱신해 DB 와 메모리에 반영한다.
+    조회(holidays_for_year)는 메모리만 본다 — DB/네트워크 I/O 없음.
+    아직 없는 연도는 빈 집합(fail-open, 평일로 간주)을 돌려주고 갱신을 앞당긴다.
+    """
 
-    try:
-        for h in holidays:
-            db.execute(
-                text(
-                    "INSERT INTO public_holidays (year, holiday_date, name) "
-                    "VALUES (:year, :date, :name) "
-                    "ON CONFLICT (year, holiday_date) DO NOTHING"
-                ),
-                {"year": year, "date": h["locdate"], "name": h["name"]},
-            )
-        db.commit()
-    except Exception:
-        # SQLite는 ON CONFLICT 대상 지정이 다를 수 있어 실패해도 캐싱 실패일 뿐
-        # 판정 자체(fail-open)에는 영향 없도록 조용히 롤백
-        db.rollback()
-
-    return {h["locdate"] for h in holidays}
-
-
-def is_business_hours(db: Session, dt: datetime | None = None) -> tuple[bool, str]:
+    def __init__(self):
+        self._years: dict[int, frozenset[str]] = {}
+        self._lock = threading.Lock()
+        self._last_attempt: dict[int, float] = {}
+        self._task: asyncio.Task | None = None
+        self._wake: asyncio.Event | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+
+    def holidays_for_year(self, year: int) -> frozenset[str]:
+        dates = self._years.get(year)
+        if dates is None:
+            self._request_refresh()
+            return frozenset()
+        return dates
+
+    def load_from_db(self) -> None:
+        db = SessionLocal()
+        try:
+            rows = db.query(PublicHoliday.year, PublicHoliday.holiday_date).all()
+        finally:
+            db.close()
+        years: dict[int, set[str]] = {}
+        for year, date in rows:
+            years.setdefault(year, set()).add(date)
+        with self._lock:
+            self._years.update({y: frozenset(d) for y, d in years.items()})
+        logger.info("[BusinessHours] holiday calendar loaded: %s", sorted(years))
+
+    @staticmethod
+    def _store(year: int, holidays: list[dict]) -> None:
+        db = SessionLocal()
+        try:
+            existing = {
+                r[0] for r in db.query(PublicHoliday.holiday_date).filter(PublicHoliday.year == year)
+            }
+            new_rows = [
+                PublicHoliday(year=year, holiday_date=h["locdate"], name=h["name"])
+                for h in holidays
+                if h["locdate"] not in existing
+            ]
+            if new_rows:
+                db.add_all(new_rows)
+                db.commit()
+        except Exception as e:
+            logger.warning("[BusinessHours] 공휴일 DB 저장 실패 (year=%s): %s", year, e)
+            db.rollback()
+        finally:
+            db.close()
+
+    async def refresh_year(self, year: int) -> bool:
+        self._last_attempt[year] = time.monotonic()
+        holidays = await _fetch_holidays_from_api(year)
+        if holidays is None:
+            return False
+        await asyncio.to_thread(self._store, year, holidays)
+        with self._lock:
+            self._years[year] = frozenset(h["locdate"] for h in holidays) | self._years.get(year, frozenset())
+        return True
+
+    async def refresh(self) -> None:
+        year = now_kst().year
+        await asyncio.gather(*(self.refresh_year(y) for y in (year, year + 1)))
+
+    def _request_refresh(self) -> None:
+        if self._loop is None or self._wake is None:
+            return
+        year = now_kst().year
+        if time.monotonic() - self._last_attempt.get(year, 0) < _HOLIDAY_FETCH_COOLDOWN_SEC:
+            return
+        self._loop.call_soon_threadsafe(self._wake.set)
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await self.refresh()
+            except Exception as e:
+                logger.warning("[BusinessHours] 공휴일 갱신 실패: %s", e)
+            year = now_kst().year
+            # 아직 못 받은 연도가 있으면 쿨다운 후 재시도, 아니면 정기 갱신 주기
+            missing = any(y not in self._years for y in (year, year + 1))
+            interval = _HOLIDAY_FETCH_COOLDOWN_SEC if missing else HOLIDAY_REFRESH_INTERVAL_SEC
+            try:
+                await asyncio.wait_for(self._wake.wait(), timeout=interval)
+            except asyncio.TimeoutError:
+                pass
+            self._wake.clear()
+
+    def start(self) -> None:
+        """Start the background refresher on the running event loop."""
+        if self._task is not None or not HOLIDAY_API_SERVICE_KEY:
+            return
+        self._loop = asyncio.get_running_loop()
+        self._wake = asyncio.Event()
+        self._task = self._loop.create_task(self._run(), name="holiday-calendar-refresh")
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+
+holiday_calendar = HolidayCalendar()
+
+
+def get_holidays_for_year(year: int) -> frozenset[str]:
+    """해당 연도의 공휴일(YYYYMMDD) 집합 — 메모리 달력 조회."""
+    return holiday_calendar.holidays_for_year(year)
+
+
+def is_business_hours(dt: datetime | None = None) -> tuple[bool, str]:
     """영업시간(1:1 톡 가능 시간) 여부와 사유를 반환한다.
 
     reason: "ok" | "weekend" | "outside_hours" | "lunch" | "holiday"
@@ -136,16 +223,16 @@ def is_business_hours(db: Session, dt: datetime | None = None) -> tuple[bool, st
     if LUNCH_START <= t < LUNCH_END:
         return False, "lunch"
 
-    holidays = get_holidays_for_year(db, dt.year)
+    holidays = get_holidays_for_year(dt.year)
     if dt.strftime("%Y%m%d") in holidays:
         return False, "holiday"
 
     return True, "ok"
 
 
-def get_availability(db: Session, dt: datetime | None = None) -> dict:
+def get_availability(dt: datetime | None = None) -> dict:
     """1:1 톡 / 관리실 문자 링크가 공유하는 가용성 응답."""
-    available, reason = is_business_hours(db, dt)
+    available, reason = is_business_hours(dt)
     return {
         "available": available,
         "reason": reason,
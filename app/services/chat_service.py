@@ -3,16 +3,18 @@
 import json
 import logging
 import re
+import time
 from dataclasses import dataclass, field
 from difflib import SequenceMatcher
 
 from sqlalchemy import text
 from sqlalchemy.orm import Session
 
+from app import metrics
 from app.config import CHAT_MODEL, OPENAI_API_KEY, RAG_MIN_SCORE, RAG_TOP_K
-from app.models.prompt_template import PromptTemplate
 from app.models.qa_knowledge import QaKnowledge
 from app.services.embedding_service import generate_embedding
+from app.services.prompt_cache import prompt_cache
 
 logger = logging.getLogger("acchelper")
 
@@ -46,16 +48,6 @@ GREETING_SYSTEM_PROMPT = (
     "답변은 1~2문장으로 간결하게 작성하세요."
 )
 
-DEFAULT_SYSTEM_PROMPT = """당신은 아파트 관리 도우미 챗봇입니다. 아래 규칙을 반드시 따르세요:
-
-1. 제공된 근거(Evidence) 내용만을 기반으로 답변하세요.
-2. 근거에서 답을 찾을 수 없으면 "해당 내용은 확인이 필요합니다. 관리사무소에 문의해 주세요."라고 답하세요.
-3. 친절하고 간결한 한국어로 답변하세요.
-4. 답변에 근거 번호를 포함하지 마세요.
-5. 근거에서 질문에 대한 답을 찾았다면 확신 있게 그 답변만 하세요. 답을 이미 찾았는데도
-   "해당 내용은 확인이 필요합니다. 관리사무소에 문의해 주세요."를 덧붙이지 마세요 —
-   이 문구는 근거에서 답을 전혀 찾지 못했을 때만 사용하세요."""
-
 
 # 최상위 근거의 질문이 사용자 질문과 이 이상 문자적으로 일치하면, GPT의 "찾았는지" 판단을
 # 거치지 않고 DB 원본 답변을 그대로 반환한다. (GPT가 근거 안에 답이 명확히 있어도
@@ -165,22 +157,27 @@ def search_qa(
 # ─── RAG search (vector + LLM) ───
 
 
-def _get_system_prompt(db: Session, company_id: int) -> str:
-    """Get company-specific system prompt or default."""
+def _chat_completion(client, kind: str, **kwargs):
+    """chat.completions.create with latency/token metrics per model."""
+    start = time.perf_counter()
     try:
-        template = (
-            db.query(PromptTemplate)
-            .filter(
-                PromptTemplate.company_id == company_id,
-                PromptTemplate.is_active == True,
-            )
-            .first()
-        )
-        if template:
-            return template.system_prompt
+        response = client.chat.completions.create(model=CHAT_MODEL, **kwargs)
     except Exception:
-        pass
-    return DEFAULT_SYSTEM_PROMPT
+        metrics.record_openai(CHAT_MODEL, kind, time.perf_counter() - start, ok=False)
+        raise
+    tokens = response.usage.total_tokens if response.usage else 0
+    metrics.record_openai(CHAT_MODEL, kind, time.perf_counter() - start, tokens)
+    return response
+
+
+def _keyword_fallback(db: Session, question: str, company_id: int) -> RAGResult:
+    with metrics.timer("rag_stage_duration_seconds", stage="fallback"):
+        answer, category, qa_id, confidence = search_qa(db, question, None, company_id)
+    return RAGResult(
+        answer=answer,
+        used_rag=False,
+        evidence_ids=[qa_id] if qa_id else [],
+    )
 
 
 def _handle_greeting(question: str) -> RAGResult | None:
@@ -195,8 +192,9 @@ def _handle_greeting(question: str) -> RAGResult | None:
         from openai import OpenAI
         client = OpenAI(api_key=OPENAI_API_KEY)
 
-        response = client.chat.completions.create(
-            model=CHAT_MODEL,
+        response = _chat_completion(
+            client,
+            kind="greeting",
             messages=[
                 {"role": "system", "content": GREETING_SYSTEM_PROMPT},
                 {"role": "user", "content": question},
@@ -219,28 +217,20 @@ def search_qa_rag(db: Session, question: str, company_id: int) -> RAGResult:
     """RAG-based search: embed question → vector similarity → LLM generation."""
 
     # 0. Handle greetings/thanks without RAG
-    greeting_result = _handle_greeting(question)
+    with metrics.timer("rag_stage_duration_seconds", stage="greeting"):
+        greeting_result = _handle_greeting(question)
     if greeting_result is not None:
         return greeting_result
 
     # If no OpenAI key, fall back to keyword search
     if not OPENAI_API_KEY:
-        answer, category, qa_id, confidence = search_qa(db, question, None, company_id)
-        return RAGResult(
-            answer=answer,
-            used_rag=False,
-            evidence_ids=[qa_id] if qa_id else [],
-        )
+        return _keyword_fallback(db, question, company_id)
 
     # 1. Generate question embedding
-    q_embedding = generate_embedding(question)
+    with metrics.timer("rag_stage_duration_seconds", stage="embed"):
+        q_embedding = generate_embedding(question)
     if q_embedding is None:
-        answer, category, qa_id, confidence = search_qa(db, question, None, company_id)
-        return RAGResult(
-            answer=answer,
-            used_rag=False,
-            evidence_ids=[qa_id] if qa_id else [],
-        )
+        return _keyword_fallback(db, question, company_id)
 
     # 2. Vector similarity search via pgvector
     try:
@@ -259,30 +249,21 @@ def search_qa_rag(db: Session, question: str, company_id: int) -> RAGResult:
             LIMIT :top_k
         """)
 
-        results = db.execute(sql, {
-            "embedding": embedding_str,
-            "company_id": company_id,
-            "min_score": RAG_MIN_SCORE,
-            "top_k": RAG_TOP_K,
-        }).fetchall()
+        with metrics.timer("rag_stage_duration_seconds", stage="vector_search"):
+            results = db.execute(sql, {
+                "embedding": embedding_str,
+                "company_id": company_id,
+                "min_score": RAG_MIN_SCORE,
+                "top_k": RAG_TOP_K,
+            }).fetchall()
 
     except Exception as e:
         logger.warning("Vector search failed, falling back to keyword: %s", e)
-        answer, category, qa_id, confidence = search_qa(db, question, None, company_id)
-        return RAGResult(
-            answer=answer,
-            used_rag=False,
-            evidence_ids=[qa_id] if qa_id else [],
-        )
+        return _keyword_fallback(db, question, company_id)
 
     if not results:
         # No similar results found — try keyword fallback
-        answer, category, qa_id, confidence = search_qa(db, question, None, company_id)
-        return RAGResult(
-            answer=answer,
-            used_rag=False,
-            evidence_ids=[qa_id] if qa_id else [],
-        )
+        return _keyword_fallback(db, question, company_id)
 
     # 3. Build context from evidence
     evidence_ids = [row[0] for row in results]
@@ -325,26 +306,20 @@ def search_qa_rag(db: Session, question: str, company_id: int) -> RAGResult:
     context = "\n\n".join(evidence_texts)
 
     # 4. Generate answer with LLM
-    system_prompt = _get_system_prompt(db, company_id)
-
-    user_message = f"""질문: {question}
-
-근거:
-{context}"""
+    prompt = prompt_cache.get(db, company_id)
 
     try:
         from openai import OpenAI
         client = OpenAI(api_key=OPENAI_API_KEY)
 
-        response = client.chat.completions.create(
-            model=CHAT_MODEL,
-            messages=[
-                {"role": "system", "content": system_prompt},
-                {"role": "user", "content": user_message},
-            ],
-            temperature=0.2,
-            max_tokens=1000,
-        )
+        with metrics.timer("rag_stage_duration_seconds", stage="llm"):
+            response = _chat_completion(
+                client,
+                kind="rag",
+                messages=prompt.messages(question, context),
+                temperature=0.2,
+                max_tokens=1000,
+            )
 
         answer = response.choices[0].message.content.strip()
         tokens_used = response.usage.total_tokens if response.usage else 0
@@ -0,0 +1,167 @@
+"""In-memory catalog of public company info for the resident chatbot.
+
+/api/companies/public 와 /api/companies/public/{id} 는 챗봇 페이지를 열 때마다
+호출되지만 내용은 거의 바뀌지 않는다. 삭제되지 않은 회사 전체를 한 번 읽어
+직렬화된 JSON 본문과 강한 ETag 를 메모리에 두고 서빙한다.
+
+무효화:
+- Company 행을 바꾸는 ORM flush / 벌크 UPDATE·DELETE 가 커밋되면 세션 이벤트로
+  버전을 올린다 (update_my_company, update_company, 승인/구독 변경, 삭제/복구 등 전부).
+- raw SQL 로 companies 를 바꾸는 곳은 mark_dirty(db) 를 호출한다.
+- 다른 워커 프로세스의 변경은 COMPANY_CATALOG_TTL 초 안에 반영된다.
+"""
+
+import hashlib
+import json
+import logging
+import threading
+import time
+from dataclasses import dataclass
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from app import metrics
+from app.config import COMPANY_CATALOG_TTL
+from app.database import SessionLocal
+from app.models.company import Company
+from app.schemas.company import CompanyPublicResponse
+
+logger = logging.getLogger("acchelper")
+
+
+@dataclass(frozen=True)
+class CatalogEntry:
+    body: bytes
+    etag: str
+    is_active: bool
+    approved: bool
+
+
+@dataclass(frozen=True)
+class _Snapshot:
+    version: int
+    built_at: float
+    companies: dict[int, CatalogEntry]
+    list_body: bytes
+    list_etag: str
+
+
+def _etag(body: bytes) -> str:
+    return '"' + hashlib.sha256(body).hexdigest()[:20] + '"'
+
+
+def _dumps(data) -> bytes:
+    return json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+class CompanyCatalog:
+    def __init__(self, ttl: float):
+        self.ttl = ttl
+        self._version = 0
+        self._snapshot: _Snapshot | None = None
+        self._lock = threading.Lock()
+
+    def invalidate(self) -> None:
+        with self._lock:
+            self._version += 1
+
+    def _build(self, version: int) -> _Snapshot:
+        db = SessionLocal()
+        try:
+            rows = (
+                db.query(Company)
+                .filter(Company.deleted_at == None)
+                .order_by(Company.company_id)
+                .all()
+            )
+            public = [
+                (c, CompanyPublicResponse.model_validate(c).model_dump(mode="json")) for c in rows
+            ]
+        finally:
+            db.close()
+
+        companies: dict[int, CatalogEntry] = {}
+        approved_list = []
+        for company, data in public:
+            body = _dumps(data)
+            approved = company.approval_status == "approved"
+            companies[company.company_id] = CatalogEntry(
+                body=body, etag=_etag(body), is_active=bool(company.is_active), approved=approved,
+            )
+            if approved:
+                approved_list.append(data)
+        list_body = _dumps(approved_list)
+        return _Snapshot(
+            version=version,
+            built_at=time.monotonic(),
+            companies=companies,
+            list_body=list_body,
+            list_etag=_etag(list_body),
+        )
+
+    def snapshot(self) -> _Snapshot:
+        snap = self._snapshot
+        if snap is not None and snap.version == self._version and time.monotonic() - snap.built_at < self.ttl:
+            metrics.record_cache("company_catalog", hit=True)
+            return snap
+        with self._lock:
+            snap = self._snapshot
+            version = self._version
+            if snap is not None and snap.version == version and time.monotonic() - snap.built_at < self.ttl:
+                metrics.record_cache("company_catalog", hit=True)
+                return snap
+            metrics.record_cache("company_catalog", hit=False)
+            snap = self._build(version)
+            self._snapshot = snap
+            return snap
+
+    def public_list(self) -> tuple[bytes, str]:
+        snap = self.snapshot()
+        return snap.list_body, snap.list_etag
+
+    def get(self, company_id: int) -> CatalogEntry | None:
+        return self.snapshot().companies.get(company_id)
+
+
+catalog = CompanyCatalog(COMPANY_CATALOG_TTL)
+
+
+# ── invalidation hooks ──
+
+_DIRTY_KEY = "company_catalog_dirty"
+
+
+def mark_dirty(session: Session) -> None:
+    """Invalidate on the session's next commit (for raw SQL writes to companies)."""
+    session.info[_DIRTY_KEY] = True
+
+
+def _mark_dirty(mapper, connection, target) -> None:
+    session = Session.object_session(target)
+    if session is not None:
+        session.info[_DIRTY_KEY] = True
+
+
+for _evt in ("after_insert", "after_update", "after_delete"):
+    event.listen(Company, _evt, _mark_dirty)
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _bulk_company_write(orm_execute_state) -> None:
+    if (orm_execute_state.is_update or orm_execute_state.is_delete) and (
+        orm_execute_state.bind_mapper is not None
+        and orm_execute_state.bind_mapper.class_ is Company
+    ):
+        orm_execute_state.session.info[_DIRTY_KEY] = True
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_on_commit(session) -> None:
+    if session.info.pop(_DIRTY_KEY, False):
+        catalog.invalidate()
+
+
+@event.listens_for(Session, "after_rollback")
+def _clear_on_rollback(session) -> None:
+    session.info.pop(_DIRTY_KEY, None)
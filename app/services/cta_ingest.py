@@ -0,0 +1,130 @@
+"""Buffered ingestion of CTA funnel events.
+
+랜딩 페이지는 방문자마다 impression/click/modal_open/kakao_redirect 이벤트를 보낸다.
+이벤트마다 INSERT + COMMIT 하지 않고 메모리 버퍼에 넣은 뒤, 백그라운드 스레드가
+CTA_FLUSH_BATCH 건이 차거나 CTA_FLUSH_INTERVAL 초가 지나면 multi-row INSERT 한 번으로
+저장·커밋한 뒤, 별도 트랜잭션에서 퍼널 롤업(funnel_analytics.apply_events)을 갱신한다.
+롤업이 실패해도 원본 이벤트는 남으므로 /api/funnel/rebuild 로 다시 계산할 수 있다.
+
+버퍼는 CTA_BUFFER_MAX 건으로 제한되며, 가득 차면 새 이벤트는 버리고
+cta_events_total{result="dropped"} 로 센다 — 요청 처리 비용은 항상 O(1).
+프로세스가 비정상 종료되면 아직 플러시되지 않은 이벤트(최대 몇 초 분량)는 유실된다.
+"""
+
+import logging
+import threading
+import time
+import uuid
+from collections import deque
+
+from sqlalchemy import insert
+
+from app import metrics
+from app.config import CTA_BUFFER_MAX, CTA_FLUSH_BATCH, CTA_FLUSH_INTERVAL
+from app.database import SessionLocal
+from app.models.cta_click_log import CtaClickLog
+from app.services.funnel_analytics import apply_events
+from app.utils import now_kst
+
+logger = logging.getLogger("acchelper")
+
+
+class CtaEventBuffer:
+    def __init__(self, max_size: int, batch_size: int, interval: float):
+        self.max_size = max_size
+        self.batch_size = batch_size
+        self.interval = interval
+        self._events: deque[dict] = deque()
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def __len__(self) -> int:
+        return len(self._events)
+
+    def add(self, event: dict) -> str | None:
+        """Buffer one validated event. Returns its id, or None when dropped."""
+        with self._lock:
+            if len(self._events) >= self.max_size:
+                metrics.inc("cta_events_total", result="dropped")
+                return None
+            event_id = str(uuid.uuid4())
+            self._events.append({**event, "id": event_id, "created_at": now_kst()})
+            size = len(self._events)
+        metrics.inc("cta_events_total", result="accepted")
+        if size >= self.batch_size:
+            self._wake.set()
+        return event_id
+
+    def _take(self) -> list[dict]:
+        with self._lock:
+            n = min(len(self._events), self.batch_size)
+            return [self._events.popleft() for _ in range(n)]
+
+    def flush(self) -> int:
+        """Write everything buffered right now. Returns the number of rows written."""
+        written = 0
+        while True:
+            batch = self._take()
+            if not batch:
+                return written
+            start = time.perf_counter()
+            db = SessionLocal()
+            try:
+                try:
+                    db.execute(insert(CtaClickLog), batch)
+                    db.commit()
+                    written += len(batch)
+                except Exception as exc:
+                    db.rollback()
+                    metrics.inc("cta_events_total", len(batch), result="flush_failed")
+                    logger.warning("CTA event flush failed (%d events dropped): %s", len(batch), exc)
+                    continue
+                # 원본 로그는 이미 커밋됨 — 롤업 실패는 원본을 잃지 않고 /api/funnel/rebuild 로 복구
+                try:
+                    apply_events(db, batch)
+                    db.commit()
+                except Exception as exc:
+                    db.rollback()
+                    metrics.inc("cta_events_total", len(batch), result="rollup_failed")
+                    logger.warning(
+                        "CTA funnel rollup failed for %d stored events (run /api/funnel/rebuild): %s",
+                        len(batch), exc,
+                    )
+            finally:
+                db.close()
+                metrics.observe("cta_flush_duration_seconds", time.perf_counter() - start)
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            self._wake.wait(self.interval)
+            self._wake.clear()
+            try:
+                self.flush()
+            except Exception as exc:
+                logger.error("CTA flusher error: %s", exc)
+
+    def start(self) -> None:
+        if self._thread is not None:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="cta-flusher", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop the flusher and write whatever is still buffered."""
+        self._stop.set()
+        self._wake.set()
+        if self._thread is not None:
+            self._thread.join(timeout=10)
+            self._thread = None
+        self.flush()
+
+
+buffer = CtaEventBuffer(CTA_BUFFER_MAX, CTA_FLUSH_BATCH, CTA_FLUSH_INTERVAL)
+metrics.registry.register_gauge(
+    "cta_buffer_events",
+    "CTA funnel events waiting in the in-memory buffer",
+    lambda: [({}, float(len(buffer)))],
+)
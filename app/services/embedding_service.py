@@ -1,9 +1,11 @@
 """OpenAI embedding generation and QA embedding management."""
 
 import logging
+import time
 
 from sqlalchemy.orm import Session
 
+from app import metrics
 from app.config import EMBEDDING_MODEL, OPENAI_API_KEY
 from app.models.qa_embedding import QaEmbedding
 from app.models.qa_knowledge import QaKnowledge
@@ -34,15 +36,43 @@ def generate_embedding(text: str) -> list[float] | None:
         logger.debug("OpenAI API key not configured, skipping embedding generation")
         return None
 
+    start = time.perf_counter()
     try:
         response = client.embeddings.create(
             model=EMBEDDING_MODEL,
             input=text,
         )
-        return response.data[0].embedding
     except Exception as e:
+        metrics.record_openai(EMBEDDING_MODEL, "embedding", time.perf_counter() - start, ok=False)
         logger.error("Embedding generation failed: %s", e)
         return None
+    tokens = response.usage.total_tokens if getattr(response, "usage", None) else 0
+    metrics.record_openai(EMBEDDING_MODEL, "embedding", time.perf_counter() - start, tokens)
+    return response.data[0].embedding
+
+
+def generate_embeddings(texts: list[str]) -> list[list[float]] | None:
+    """Embed a batch of texts in one API call (input order preserved).
+
+    Returns None if the API key is missing or the call fails.
+    """
+    client = _get_openai_client()
+    if not client or not texts:
+        return None
+
+    start = time.perf_counter()
+    try:
+        response = client.embeddings.create(
+            model=EMBEDDING_MODEL,
+            input=texts,
+        )
+    except Exception as e:
+        metrics.record_openai(EMBEDDING_MODEL, "embedding", time.perf_counter() - start, ok=False)
+        logger.error("Batch embedding generation failed (%d texts): %s", len(texts), e)
+        return None
+    tokens = response.usage.total_tokens if getattr(response, "usage", None) else 0
+    metrics.record_openai(EMBEDDING_MODEL, "embedding", time.perf_counter() - start, tokens)
+    return [item.embedding for item in sorted(response.data, key=lambda d: d.index)]
 
 
 def build_embedding_text(qa: QaKnowledge) -> str:
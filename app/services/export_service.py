@@ -0,0 +1,265 @@
+"""Streaming tenant data export (xlsx / csv / ndjson).
+
+회사 데이터(QA, 관리비 명부, 민원, 상담 로그)를 메모리에 모두 올리지 않고 내보낸다.
+- DB: yield_per 로 EXPORT_BATCH 건씩 읽는 청크 커서 (PostgreSQL 은 서버 사이드 커서)
+- xlsx: openpyxl write-only 워크북 — 행을 임시 파일로 바로 흘려 쓰므로 메모리 일정.
+  압축(zip)까지 끝난 파일을 응답으로 스트리밍하고 전송 후 삭제한다.
+- csv: 제너레이터로 배치마다 청크를 바로 응답에 쓴다 (UTF-8 BOM, 수식 주입 방지).
+- ndjson: 컬럼 이름을 키로 한 원본 값 (상담 로그 /admin/chat-logs/export 도 이 경로를 쓴다).
+워크북 생성은 스레드풀에서 실행하고, xlsx 만 행 수를 EXPORT_MAX_ROWS 로 제한한다
+(임시 파일·시트 행 한도). csv/ndjson 은 COUNT 나 LIMIT 없이 끝까지 스트리밍한다.
+"""
+
+import csv
+import io
+import json
+import logging
+import os
+import tempfile
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Callable
+
+from sqlalchemy import func, select
+from sqlalchemy.sql import ColumnElement, Select
+
+from app.config import EXPORT_MAX_ROWS
+from app.database import get_read_db
+from app.models.chat_log import ChatLog
+from app.models.complaint import Complaint
+from app.models.fee_data import FeeEntry
+from app.models.qa_knowledge import QaKnowledge
+from app.utils import now_kst
+
+logger = logging.getLogger("acchelper")
+
+EXPORT_BATCH = 1000
+XLSX_MAX_ROWS = 1_048_575  # 시트 최대 행 - 헤더
+_FORMULA_PREFIXES = ("=", "+", "-", "@", "\t", "\r")
+
+
+class ExportTooLarge(Exception):
+    def __init__(self, rows: int, limit: int):
+        super().__init__(f"내보낼 행이 너무 많습니다 ({rows:,}건, 최대 {limit:,}건). 기간/조건을 좁혀주세요.")
+        self.rows = rows
+        self.limit = limit
+
+
+@dataclass(frozen=True)
+class Dataset:
+    title: str
+    columns: tuple[tuple[str, str, int], ...]  # (ndjson key, csv/xlsx header, xlsx column width)
+    select: Callable[[], Select]  # raw columns in `columns` order, ordered, unfiltered
+    company_col: ColumnElement
+    row: Callable[[tuple], list]  # display formatting for csv/xlsx
+
+
+def _fmt_dt(dt) -> str:
+    if dt is None:
+        return ""
+    if isinstance(dt, str):
+        return dt[:19]
+    return dt.strftime("%Y-%m-%d %H:%M:%S")
+
+
+def _fee_items(fee_json: str | None) -> str:
+    try:
+        items = json.loads(fee_json or "{}")
+    except ValueError:
+        return ""
+    return ", ".join(f"{k}: {v}" for k, v in items.items()) if isinstance(items, dict) else ""
+
+
+DATASETS: dict[str, Dataset] = {
+    "qa": Dataset(
+        title="Q&A 데이터",
+        columns=(
+            ("qa_id", "QA ID", 8), ("category", "카테고리", 15), ("question", "질문", 50),
+            ("answer", "답변", 70), ("keywords", "키워드", 20), ("aliases", "별칭", 20),
+            ("tags", "태그", 15), ("is_active", "활성상태", 10), ("view_count", "조회수", 10),
+            ("used_count", "사용수", 10), ("created_at", "생성일시", 20), ("updated_at", "수정일시", 20),
+        ),
+        select=lambda: select(
+            QaKnowledge.qa_id, QaKnowledge.category, QaKnowledge.question, QaKnowledge.answer,
+            QaKnowledge.keywords, QaKnowledge.aliases, QaKnowledge.tags, QaKnowledge.is_active,
+            QaKnowledge.view_count, QaKnowledge.used_count, QaKnowledge.created_at, QaKnowledge.updated_at,
+        ).order_by(QaKnowledge.qa_id),
+        company_col=QaKnowledge.company_id,
+        row=lambda r: [
+            r[0], r[1], r[2], r[3], r[4], r[5], r[6], "활성" if r[7] else "비활성",
+            r[8] or 0, r[9] or 0, _fmt_dt(r[10]), _fmt_dt(r[11]),
+        ],
+    ),
+    "fee_roster": Dataset(
+        title="관리비 명부",
+        columns=(
+            ("year_month", "부과월", 10), ("dong", "동", 8), ("ho", "호", 8), ("name", "성명", 12),
+            ("phone", "전화번호", 16), ("fee_json", "관리비 항목", 80), ("uploaded_at", "업로드일시", 20),
+        ),
+        select=lambda: select(
+            FeeEntry.year_month, FeeEntry.dong, FeeEntry.ho, FeeEntry.name, FeeEntry.phone,
+            FeeEntry.fee_json, FeeEntry.uploaded_at,
+        ).order_by(FeeEntry.year_month, FeeEntry.dong, FeeEntry.ho, FeeEntry.id),
+        company_col=FeeEntry.company_id,
+        row=lambda r: [r[0], r[1], r[2], r[3], r[4], _fee_items(r[5]), _fmt_dt(r[6])],
+    ),
+    "complaints": Dataset(
+        title="민원",
+        columns=(
+            ("id", "ID", 8), ("dong", "동", 8), ("ho", "호", 8), ("writer_name", "작성자", 12),
+            ("writer_phone", "연락처", 16), ("title", "제목", 30), ("content", "내용", 60),
+            ("created_at", "접수일시", 20), ("reply_content", "답변", 60), ("replied_at", "답변일시", 20),
+            ("is_deleted", "삭제", 8),
+        ),
+        select=lambda: select(
+            Complaint.id, Complaint.dong, Complaint.ho, Complaint.writer_name, Complaint.writer_phone,
+            Complaint.title, Complaint.content, Complaint.created_at, Complaint.reply_content,
+            Complaint.replied_at, Complaint.is_deleted,
+        ).order_by(Complaint.id),
+        company_col=Complaint.company_id,
+        row=lambda r: [
+            r[0], r[1], r[2], r[3], r[4] or "", r[5], r[6], _fmt_dt(r[7]), r[8] or "",
+            _fmt_dt(r[9]), "삭제" if r[10] else "",
+        ],
+    ),
+    "chat_logs": Dataset(
+        title="상담 로그",
+        columns=(
+            ("log_id", "로그 ID", 10), ("company_id", "회사", 8), ("timestamp", "일시", 20),
+            ("session_id", "세션", 20), ("user_question", "질문", 50), ("bot_answer", "답변", 70),
+            ("qa_id", "QA ID", 8), ("category", "카테고리", 15), ("confidence_score", "신뢰도", 8),
+            ("response_time_ms", "응답(ms)", 10), ("used_rag", "RAG", 6), ("user_feedback", "피드백", 8),
+            ("evidence_ids", "근거 QA", 15),
+        ),
+        select=lambda: select(
+            ChatLog.log_id, ChatLog.company_id, ChatLog.timestamp, ChatLog.session_id, ChatLog.user_question,
+            ChatLog.bot_answer, ChatLog.qa_id, ChatLog.category, ChatLog.confidence_score,
+            ChatLog.response_time_ms, ChatLog.used_rag, ChatLog.user_feedback, ChatLog.evidence_ids,
+        ).order_by(ChatLog.timestamp, ChatLog.log_id),
+        company_col=ChatLog.company_id,
+        row=lambda r: [
+            r[0], r[1], _fmt_dt(r[2]), r[3], r[4], r[5], r[6], r[7] or "", r[8], r[9],
+            "Y" if r[10] else "N", r[11] or "", r[12] or "",
+        ],
+    ),
+}
+
+
+XLSX_ROW_LIMIT = min(EXPORT_MAX_ROWS, XLSX_MAX_ROWS)
+
+
+def check_xlsx_size(db, dataset: Dataset, filters: list) -> int:
+    """COUNT an xlsx export; raises ExportTooLarge over XLSX_ROW_LIMIT.
+
+    csv/ndjson 은 상수 메모리로 스트리밍하므로 검사하지 않는다.
+    """
+    stmt = dataset.select().where(*filters).order_by(None)
+    rows = db.execute(select(func.count()).select_from(stmt.subquery())).scalar() or 0
+    limit = XLSX_ROW_LIMIT
+    if rows > limit:
+        raise ExportTooLarge(rows, limit)
+    return rows
+
+
+def _batches(dataset: Dataset, filters: list, limit: int | None = None):
+    """Yield lists of raw result rows, EXPORT_BATCH at a time, on a dedicated read session.
+
+    응답이 끝나거나 클라이언트가 끊겨 제너레이터가 닫히면 세션도 닫는다.
+    """
+    sessions = get_read_db()
+    db = next(sessions)
+    try:
+        stmt = dataset.select().where(*filters)
+        if limit is not None:
+            stmt = stmt.limit(limit)
+        result = db.execute(stmt.execution_options(yield_per=EXPORT_BATCH))
+        for batch in result.partitions():
+            yield batch
+    finally:
+        sessions.close()
+
+
+def _csv_safe(value):
+    if isinstance(value, str) and value.startswith(_FORMULA_PREFIXES):
+        return "'" + value
+    return value
+
+
+def _json_value(value):
+    return value.isoformat() if isinstance(value, datetime) else value
+
+
+def iter_csv(dataset: Dataset, filters: list):
+    """Generator of CSV text chunks (UTF-8 BOM first, for Excel)."""
+    buf = io.StringIO()
+    writer = csv.writer(buf)
+    writer.writerow([header for _, header, _ in dataset.columns])
+    yield "\ufeff" + buf.getvalue()  # BOM: Excel 한글 인코딩
+    for batch in _batches(dataset, filters):
+        buf = io.StringIO()
+        writer = csv.writer(buf)
+        writer.writerows([_csv_safe(v) for v in dataset.row(r)] for r in batch)
+        yield buf.getvalue()
+
+
+def iter_ndjson(dataset: Dataset, filters: list):
+    """Generator of NDJSON chunks: one object per row keyed by column name, raw values."""
+    keys = [key for key, _, _ in dataset.columns]
+    for batch in _batches(dataset, filters):
+        yield "".join(
+            json.dumps({k: _json_value(v) for k, v in zip(keys, r)}, ensure_ascii=False) + "\n"
+            for r in batch
+        )
+
+
+def build_xlsx(dataset: Dataset, filters: list, sheet_title: str) -> tuple[str, int]:
+    """Write the dataset to a temporary .xlsx with a write-only workbook.
+
+    Returns (path, data rows). Blocking — call from a worker thread. Caller deletes the file.
+    """
+    from openpyxl import Workbook
+    from openpyxl.cell import WriteOnlyCell
+    from openpyxl.styles import Alignment, Font, PatternFill
+    from openpyxl.utils import get_column_letter
+
+    wb = Workbook(write_only=True)
+    ws = wb.create_sheet(sheet_title[:31])
+    for idx, (_, _, width) in enumerate(dataset.columns, 1):
+        ws.column_dimensions[get_column_letter(idx)].width = width
+    ws.freeze_panes = "A2"
+
+    header_font = Font(name="맑은 고딕", bold=True, size=11, color="FFFFFF")
+    header_fill = PatternFill(start_color="2E75B6", end_color="2E75B6", fill_type="solid")
+    header_align = Alignment(horizontal="center", vertical="center")
+    header = []
+    for _, name, _ in dataset.columns:
+        cell = WriteOnlyCell(ws, value=name)
+        cell.font, cell.fill, cell.alignment = header_font, header_fill, header_align
+        header.append(cell)
+    ws.append(header)
+
+    def text_cell(value):
+        # write-only 모드는 '=' 로 시작하는 문자열을 수식으로 저장하므로 문자열로 고정
+        cell = WriteOnlyCell(ws, value=value)
+        cell.data_type = "s"
+        return cell
+
+    count = 0
+    for batch in _batches(dataset, filters, XLSX_ROW_LIMIT):
+        for r in batch:
+            ws.append([text_cell(v) if isinstance(v, str) and v.startswith("=") else v for v in dataset.row(r)])
+        count += len(batch)
+    ws.auto_filter.ref = f"A1:{get_column_letter(len(dataset.columns))}{count + 1}"
+
+    fd, path = tempfile.mkstemp(prefix="export_", suffix=".xlsx")
+    os.close(fd)
+    try:
+        wb.save(path)
+    except Exception:
+        os.unlink(path)
+        raise
+    return path, count
+
+
+def export_filename(name: str, company_id: int | str, fmt: str) -> str:
+    return f"{name}_{company_id}_{now_kst().strftime('%Y%m%d_%H%M%S')}.{fmt}"
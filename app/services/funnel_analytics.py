@@ -0,0 +1,188 @@
+"""CTA funnel analytics over hourly rollups.
+
+cta_ingest 가 원본 이벤트를 INSERT·커밋한 뒤, 별도 트랜잭션에서 apply_events() 로
+cta_funnel_hourly 롤업과 세션 단계 상태(cta_funnel_session_steps)를 갱신한다.
+롤업 트랜잭션이 실패하면 원본만 남으므로 rebuild() 로 다시 계산한다.
+리포트(conversion)는 롤업만 SUM 하므로 기간이 길어도 원본 로그를 스캔하지 않는다.
+
+세션 전환율: (session_id, cta_type) 이 각 단계에 처음 도달한 시간 버킷에서만
+sessions 를 1 올린다. 임의 기간의 SUM(sessions) 은 그 기간에 해당 단계에 처음 도달한
+세션 수이고, 단계 간 비율이 세션 기준 전환율이 된다.
+"""
+
+from collections import defaultdict
+from datetime import datetime
+
+from sqlalchemy import delete, func
+from sqlalchemy.orm import Session
+
+from app.models.cta_click_log import CtaClickLog
+from app.models.cta_funnel import CtaFunnelHourly, CtaFunnelSessionStep
+
+FUNNEL_STEPS = ("impression", "click", "modal_open", "kakao_redirect")
+
+DIMENSIONS = (
+    "page_path", "cta_type", "visitor_type", "device_type",
+    "utm_source", "utm_medium", "utm_campaign",
+)
+
+_CHUNK = 400  # rows per multi-VALUES statement (bind parameter limit)
+
+
+def _insert(db: Session):
+    if db.get_bind().dialect.name == "postgresql":
+        from sqlalchemy.dialects.postgresql import insert
+    else:
+        from sqlalchemy.dialects.sqlite import insert
+    return insert
+
+
+def _bucket(ts: datetime) -> datetime:
+    return ts.replace(minute=0, second=0, microsecond=0)
+
+
+def _dims(row: dict) -> tuple:
+    return tuple(row.get(d) or "" for d in DIMENSIONS)
+
+
+def apply_events(db: Session, rows: list[dict]) -> None:
+    """Fold raw CTA events into the rollups. Caller commits.
+
+    rows: dicts with the CtaClickLog columns (created_at, session_id, funnel_step, ...).
+    """
+    if not rows:
+        return
+    insert = _insert(db)
+    rows = sorted(rows, key=lambda r: r["created_at"])
+
+    # 1. 이번 배치에서 처음 보는 (session, cta_type, step) 만 상태 테이블에 넣고,
+    #    실제로 INSERT 된 키(= 최초 도달)만 RETURNING 으로 돌려받는다.
+    first_rows: dict[tuple, dict] = {}
+    for r in rows:
+        first_rows.setdefault((r["session_id"], r["cta_type"], r["funnel_step"]), r)
+    keys = list(first_rows)
+    newly_reached: set[tuple] = set()
+    for i in range(0, len(keys), _CHUNK):
+        chunk = keys[i:i + _CHUNK]
+        stmt = (
+            insert(CtaFunnelSessionStep)
+            .values([
+                {"session_id": s, "cta_type": c, "funnel_step": f, "first_at": first_rows[(s, c, f)]["created_at"]}
+                for s, c, f in chunk
+            ])
+            .on_conflict_do_nothing()
+            .returning(
+                CtaFunnelSessionStep.session_id,
+                CtaFunnelSessionStep.cta_type,
+                CtaFunnelSessionStep.funnel_step,
+            )
+        )
+        newly_reached.update(tuple(r) for r in db.execute(stmt))
+
+    # 2. 시간·차원별 이벤트 수 / 최초 도달 세션 수 집계
+    counts: dict[tuple, list[int]] = defaultdict(lambda: [0, 0])
+    for r in rows:
+        counts[(_bucket(r["created_at"]), _dims(r), r["funnel_step"])][0] += 1
+    for key in newly_reached:
+        r = first_rows[key]
+        counts[(_bucket(r["created_at"]), _dims(r), r["funnel_step"])][1] += 1
+
+    # 3. 롤업 UPSERT (events/sessions 누적)
+    values = [
+        {"bucket_start": bucket, **dict(zip(DIMENSIONS, dims)), "funnel_step": step,
+         "events": events, "sessions": sessions}
+        for (bucket, dims, step), (events, sessions) in counts.items()
+    ]
+    for i in range(0, len(values), _CHUNK):
+        stmt = insert(CtaFunnelHourly).values(values[i:i + _CHUNK])
+        stmt = stmt.on_conflict_do_update(
+            index_elements=["bucket_start", *DIMENSIONS, "funnel_step"],
+            set_={
+                "events": CtaFunnelHourly.events + stmt.excluded.events,
+                "sessions": CtaFunnelHourly.sessions + stmt.excluded.sessions,
+            },
+        )
+        db.execute(stmt)
+
+
+def rebuild(db: Session, batch_size: int = 5000) -> int:
+    """Recompute all rollups from cta_click_logs (backfill / repair). Commits."""
+    db.execute(delete(CtaFunnelHourly))
+    db.execute(delete(CtaFunnelSessionStep))
+    columns = [CtaClickLog.created_at, CtaClickLog.session_id, CtaClickLog.funnel_step, *(
+        getattr(CtaClickLog, d) for d in DIMENSIONS
+    )]
+    total = 0
+    last = None
+    while True:
+        # (created_at, id) 키셋 페이지네이션 — 큰 테이블도 OFFSET 없이 순회
+        q = db.query(*columns, CtaClickLog.id).order_by(CtaClickLog.created_at, CtaClickLog.id)
+        if last is not None:
+            q = q.filter(
+                (CtaClickLog.created_at > last[0])
+                | ((CtaClickLog.created_at == last[0]) & (CtaClickLog.id > last[1]))
+            )
+        batch = q.limit(batch_size).all()
+        if not batch:
+            break
+        apply_events(db, [r._asdict() for r in batch])
+        total += len(batch)
+        last = (batch[-1].created_at, batch[-1].id)
+    db.commit()
+    return total
+
+
+def conversion(
+    db: Session,
+    start: datetime,
+    end: datetime,
+    filters: dict[str, str] | None = None,
+    group_by: str | None = None,
+) -> list[dict]:
+    """Step-to-step conversion for [start, end) from the hourly rollups.
+
+    Returns one entry per group (a single entry with key None when not grouped):
+        {"key": ..., "steps": [{"step", "events", "sessions",
+                                "step_conversion", "overall_conversion"}, ...]}
+    """
+    if group_by is not None and group_by not in DIMENSIONS:
+        raise ValueError(f"group_by must be one of {', '.join(DIMENSIONS)}")
+
+    group_col = getattr(CtaFunnelHourly, group_by) if group_by else None
+    cols = [CtaFunnelHourly.funnel_step, func.sum(CtaFunnelHourly.events), func.sum(CtaFunnelHourly.sessions)]
+    if group_col is not None:
+        cols.insert(0, group_col)
+    q = db.query(*cols).filter(CtaFunnelHourly.bucket_start >= start, CtaFunnelHourly.bucket_start < end)
+    for name, value in (filters or {}).items():
+        if name not in DIMENSIONS:
+            raise ValueError(f"unknown filter: {name}")
+        q = q.filter(getattr(CtaFunnelHourly, name) == value)
+    q = q.group_by(*([group_col] if group_col is not None else []), CtaFunnelHourly.funnel_step)
+
+    grouped: dict = defaultdict(dict)
+    for row in q.all():
+        key, step, events, sessions = (row if group_col is not None else (None, *row))
+        grouped[key][step] = (int(events or 0), int(sessions or 0))
+
+    result = []
+    for key in sorted(grouped, key=lambda k: (k is None, k or "")):
+        steps_data = grouped[key]
+        first_sessions = steps_data.get(FUNNEL_STEPS[0], (0, 0))[1]
+        prev_sessions = None
+        steps = []
+        for step in FUNNEL_STEPS:
+            events, sessions = steps_data.get(step, (0, 0))
+            steps.append({
+                "step": step,
+                "events": events,
+                "sessions": sessions,
+                "step_conversion": (
+                    round(sessions / prev_sessions, 4) if prev_sessions else None
+                ),
+                "overall_conversion": (
+                    round(sessions / first_sessions, 4) if first_sessions else None
+                ),
+            })
+            prev_sessions = sessions
+        result.append({"key": key, "steps": steps})
+    return result
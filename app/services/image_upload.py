@@ -1,23 +1,72 @@
-"""Image upload service using local filesystem."""
+"""Image upload service using local filesystem.
 
-import uuid
-from pathlib import PurePosixPath
+업로드된 이미지는 실제 파일 헤더로 형식을 검증하고, 내용 해시(sha256)로
+파일명을 정해 동일 이미지는 한 번만 저장한다. Pillow가 설치되어 있으면
+EXIF를 제거한 원본과 함께 썸네일/중간 크기 WebP 변형을 프로세스 풀에서
+생성한다 (요청 스레드/이벤트 루프를 막지 않음).
 
-from app.config import UPLOAD_DIR
+    {digest}.{ext}        EXIF 제거 원본
+    {digest}_thumb.webp   목록용 썸네일 (최대 320px)
+    {digest}_md.webp      상세 화면용 (최대 1280px)
+"""
+
+import asyncio
+import hashlib
+import importlib.util
+import logging
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor
+from io import BytesIO
+from pathlib import Path, PurePosixPath
+
+from app import metrics
+from app.config import IMAGE_PROCESS_WORKERS, UPLOAD_DIR
+
+logger = logging.getLogger("acchelper")
 
 ALLOWED_EXTENSIONS = {"jpg", "jpeg", "png", "gif", "webp"}
 MAX_FILE_SIZE = 5 * 1024 * 1024  # 5MB
+MAX_IMAGE_PIXELS = 40_000_000  # decompression bomb guard
+
+# variant name -> (max edge px, webp quality)
+VARIANTS = {
+    "thumb": (320, 70),
+    "md": (1280, 80),
+}
+
+# Content-addressed stem: sha256 hexdigest[:32]. Legacy uploads used
+# uuid4().hex — also 32 hex chars, but always with version nibble "4" and
+# variant nibble 8/9/a/b; digests only match that shape 1 time in 64.
+_DIGEST_RE = re.compile(r"[0-9a-f]{32}")
+_UUID4_HEX_RE = re.compile(r"[0-9a-f]{12}4[0-9a-f]{3}[89ab][0-9a-f]{15}")
+
+# Checked with find_spec only: PIL itself is imported lazily in the worker process.
+_HAS_PIL = importlib.util.find_spec("PIL") is not None
+
+_pool: ProcessPoolExecutor | None = None
 
 
 def _get_extension(filename: str) -> str:
     return PurePosixPath(filename).suffix.lstrip(".").lower()
 
 
-def save_image(file_bytes: bytes, original_filename: str) -> str:
-    """Save image to local disk and return the relative path.
+def _sniff_format(file_bytes: bytes) -> str | None:
+    """Return the canonical extension from the file's magic bytes."""
+    head = file_bytes[:16]
+    if head.startswith(b"\xff\xd8\xff"):
+        return "jpg"
+    if head.startswith(b"\x89PNG\r\n\x1a\n"):
+        return "png"
+    if head[:6] in (b"GIF87a", b"GIF89a"):
+        return "gif"
+    if head[:4] == b"RIFF" and head[8:12] == b"WEBP":
+        return "webp"
+    return None
 
-    Raises ValueError on validation failure.
-    """
+
+def _validate(file_bytes: bytes, original_filename: str) -> str:
+    """Validate extension, size and real image header. Returns canonical extension."""
     ext = _get_extension(original_filename)
     if ext not in ALLOWED_EXTENSIONS:
         raise ValueError(f"허용되지 않는 파일 형식입니다. ({', '.join(ALLOWED_EXTENSIONS)})")
@@ -25,9 +74,169 @@ def save_image(file_bytes: bytes, original_filename: str) -> str:
     if len(file_bytes) > MAX_FILE_SIZE:
         raise ValueError("파일 크기는 5MB 이하만 가능합니다.")
 
-    unique_name = f"{uuid.uuid4().hex}.{ext}"
-    dest = UPLOAD_DIR / unique_name
-    dest.write_bytes(file_bytes)
+    real_ext = _sniff_format(file_bytes)
+    if real_ext is None:
+        raise ValueError("올바른 이미지 파일이 아닙니다.")
+    return real_ext
+
+
+def _variant_name(digest: str, variant: str) -> str:
+    return f"{digest}_{variant}.webp"
+
+
+def _write_atomic(dest: Path, data: bytes) -> None:
+    tmp = dest.with_name(f".{dest.name}.{os.getpid()}.tmp")
+    tmp.write_bytes(data)
+    os.replace(tmp, dest)
+
+
+def _process_image(file_bytes: bytes, ext: str, digest: str, upload_dir: str) -> list[str]:
+    """Strip EXIF and build WebP variants. Runs inside a worker process.
+
+    Returns the list of variant names that were written. Raises ValueError
+    when Pillow cannot decode the image.
+    """
+    try:
+        from PIL import Image, ImageOps
+    except ImportError:
+        _write_atomic(Path(upload_dir) / f"{digest}.{ext}", file_bytes)
+        return []
+
+    Image.MAX_IMAGE_PIXELS = MAX_IMAGE_PIXELS
+    base = Path(upload_dir)
+    try:
+        with Image.open(BytesIO(file_bytes)) as probe:
+            probe.verify()
+        img = Image.open(BytesIO(file_bytes))
+        img.load()
+    except Exception as exc:
+        raise ValueError("올바른 이미지 파일이 아닙니다.") from exc
+
+    # Original: re-encode without metadata. Animated GIFs are kept as-is
+    # (GIF carries no EXIF) so animation is not lost.
+    if ext == "gif":
+        _write_atomic(base / f"{digest}.{ext}", file_bytes)
+    else:
+        oriented = ImageOps.exif_transpose(img)
+        buf = BytesIO()
+        if ext == "jpg":
+            oriented.convert("RGB").save(buf, format="JPEG", quality=90, optimize=True)
+        elif ext == "png":
+            oriented.save(buf, format="PNG", optimize=True)
+        else:
+            oriented.save(buf, format="WEBP", quality=90)
+        _write_atomic(base / f"{digest}.{ext}", buf.getvalue())
+        img = oriented
+
+    if img.mode not in ("RGB", "RGBA"):
+        img = img.convert("RGBA" if "transparency" in img.info or img.mode in ("LA", "P") else "RGB")
+
+    written = []
+    for variant, (max_edge, quality) in VARIANTS.items():
+        copy = img.copy()
+        copy.thumbnail((max_edge, max_edge))
+        buf = BytesIO()
+        copy.save(buf, format="WEBP", quality=quality, method=4)
+        _write_atomic(base / _variant_name(digest, variant), buf.getvalue())
+        written.append(variant)
+    return written
+
 
-    # Return path segment used in URL: /uploads/{filename}
-    return unique_name
+def _get_pool() -> ProcessPoolExecutor:
+    global _pool
+    if _pool is None:
+        _pool = ProcessPoolExecutor(max_workers=IMAGE_PROCESS_WORKERS)
+    return _pool
+
+
+def shutdown_image_pool() -> None:
+    global _pool
+    if _pool is not None:
+        _pool.shutdown(wait=False, cancel_futures=True)
+        _pool = None
+
+
+def _build_result(digest: str, ext: str) -> dict:
+    filename = f"{digest}.{ext}"
+    result = {"filename": filename, "url": f"/uploads/{filename}"}
+    for variant in VARIANTS:
+        name = _variant_name(digest, variant)
+        if (UPLOAD_DIR / name).exists():
+            result[f"{variant}_url"] = f"/uploads/{name}"
+    return result
+
+
+def _is_processed(digest: str, ext: str) -> bool:
+    if not (UPLOAD_DIR / f"{digest}.{ext}").exists():
+        return False
+    return all((UPLOAD_DIR / _variant_name(digest, v)).exists() for v in VARIANTS)
+
+
+async def process_upload(file_bytes: bytes, original_filename: str) -> dict:
+    """Validate, dedupe and store an upload; returns relative URLs.
+
+    {"filename", "url", "thumb_url"?, "md_url"?} — variant keys are present
+    only when the variant exists (Pillow available).
+    Raises ValueError on validation failure.
+    """
+    ext = _validate(file_bytes, original_filename)
+    digest = hashlib.sha256(file_bytes).hexdigest()[:32]
+
+    if _is_processed(digest, ext):
+        metrics.record_cache("image_dedupe", hit=True)
+        return _build_result(digest, ext)
+    metrics.record_cache("image_dedupe", hit=False)
+
+    loop = asyncio.get_running_loop()
+    try:
+        await loop.run_in_executor(
+            _get_pool(), _process_image, file_bytes, ext, digest, str(UPLOAD_DIR)
+        )
+    except ValueError:
+        raise
+    except Exception as exc:
+        # Broken pool etc. — fall back to in-thread processing.
+        logger.warning("Image process pool failed, processing inline: %s", exc)
+        shutdown_image_pool()
+        await asyncio.to_thread(_process_image, file_bytes, ext, digest, str(UPLOAD_DIR))
+
+    return _build_result(digest, ext)
+
+
+_VARIANT_HITS_MAX = 4096
+_variant_hits: set[str] = set()
+
+
+def _has_variants(digest: str) -> bool:
+    # Only hits are remembered: a variant never disappears once written, but a
+    # miss may just mean the upload is still being processed.
+    if digest in _variant_hits:
+        return True
+    if not (UPLOAD_DIR / _variant_name(digest, next(iter(VARIANTS)))).exists():
+        return False
+    if len(_variant_hits) >= _VARIANT_HITS_MAX:
+        _variant_hits.clear()
+    _variant_hits.add(digest)
+    return True
+
+
+def variant_url(image_url: str | None, variant: str) -> str | None:
+    """Map a stored /uploads URL to its variant URL, falling back to the original.
+
+    The variant name is derived from the content-addressed filename — no
+    filesystem check per call, since this runs for every image on list
+    pages. Legacy uploads (uuid filenames) have no variants and are returned
+    unchanged, as are all URLs when Pillow is not installed. Only a name
+    that could be either (uuid4-shaped digest) is checked on disk.
+    """
+    if not image_url or not _HAS_PIL:
+        return image_url
+    prefix, _, filename = image_url.rpartition("/uploads/")
+    if not filename:
+        return image_url
+    digest = PurePosixPath(filename).stem
+    if not _DIGEST_RE.fullmatch(digest):
+        return image_url
+    if _UUID4_HEX_RE.fullmatch(digest) and not _has_variants(digest):
+        return image_url
+    return f"{prefix}/uploads/{_variant_name(digest, variant)}"
@@ -1,10 +1,18 @@
 """JWT token creation and verification."""
 
+import threading
+import time
+from collections import OrderedDict
 from datetime import datetime, timedelta
 
 import jwt
 
-from app.config import JWT_ALGORITHM, JWT_EXPIRE_HOURS, JWT_SECRET_KEY
+from app import metrics
+from app.config import JWT_ALGORITHM, JWT_CACHE_SIZE, JWT_EXPIRE_HOURS, JWT_SECRET_KEY
+
+# token -> (payload, exp epoch seconds). 서명 검증에 성공한 토큰만 저장한다.
+_verified: "OrderedDict[str, tuple[dict, float]]" = OrderedDict()
+_verified_lock = threading.Lock()
 
 
 def create_access_token(data: dict, expire_hours: int | None = None, expire_minutes: int | None = None) -> str:
@@ -29,3 +37,36 @@ def decode_token(token: str) -> dict | None:
         return None
     except jwt.InvalidTokenError:
         return None
+
+
+def decode_token_cached(token: str) -> dict | None:
+    """decode_token backed by a bounded LRU of recently verified tokens.
+
+    Cached entries are dropped once their `exp` passes, so expiry is still enforced.
+    Returns a copy so callers cannot mutate the cached payload.
+    """
+    now = time.time()
+    with _verified_lock:
+        entry = _verified.get(token)
+        if entry is not None:
+            payload, exp = entry
+            if exp > now:
+                _verified.move_to_end(token)
+                metrics.record_cache("jwt", hit=True)
+                return dict(payload)
+            del _verified[token]
+
+    metrics.record_cache("jwt", hit=False)
+    payload = decode_token(token)
+    if payload is None or JWT_CACHE_SIZE <= 0:
+        return payload
+
+    exp = payload.get("exp")
+    if not isinstance(exp, (int, float)):
+        return payload
+    with _verified_lock:
+        _verified[token] = (dict(payload), float(exp))
+        _verified.move_to_end(token)
+        while len(_verified) > JWT_CACHE_SIZE:
+            _verified.popitem(last=False)
+    return payload
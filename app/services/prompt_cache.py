@@ -0,0 +1,168 @@
+"""Per-company system prompt cache for the RAG LLM call.
+
+챗 요청마다 prompt_templates 를 조회하지 않도록 회사별 활성 템플릿을 처음 사용할 때
+읽어 메모리에 둔다. 시스템 메시지는 미리 만들어 두고 요청마다 사용자 메시지만 붙인다.
+
+무효화 / 워커 간 동기화:
+- PromptTemplate 행이 flush 될 때(생성·수정·삭제) 같은 트랜잭션에서
+  companies.prompt_version 을 1 올리고, 커밋되면 이 프로세스의 캐시를 바로 비운다.
+- 다른 워커는 PROMPT_CACHE_CHECK_INTERVAL 초마다 prompt_version 하나만(PK 조회)
+  확인해 바뀌었을 때만 템플릿을 다시 읽는다.
+- 갱신 중 DB 오류가 나면 캐시된 프롬프트를 계속 쓰고 경고를 남긴다. 캐시가 없으면
+  오류를 그대로 올린다 (기본 프롬프트로 조용히 바뀌지 않도록).
+"""
+
+import logging
+import threading
+import time
+from dataclasses import dataclass, field, replace
+
+from sqlalchemy import event, text
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import Session
+
+from app import metrics
+from app.config import PROMPT_CACHE_CHECK_INTERVAL
+from app.models.prompt_template import PromptTemplate
+
+logger = logging.getLogger("acchelper")
+
+DEFAULT_SYSTEM_PROMPT = """당신은 아파트 관리 도우미 챗봇입니다. 아래 규칙을 반드시 따르세요:
+
+1. 제공된 근거(Evidence) 내용만을 기반으로 답변하세요.
+2. 근거에서 답을 찾을 수 없으면 "해당 내용은 확인이 필요합니다. 관리사무소에 문의해 주세요."라고 답하세요.
+3. 친절하고 간결한 한국어로 답변하세요.
+4. 답변에 근거 번호를 포함하지 마세요.
+5. 근거에서 질문에 대한 답을 찾았다면 확신 있게 그 답변만 하세요. 답을 이미 찾았는데도
+   "해당 내용은 확인이 필요합니다. 관리사무소에 문의해 주세요."를 덧붙이지 마세요 —
+   이 문구는 근거에서 답을 전혀 찾지 못했을 때만 사용하세요."""
+
+_USER_QUESTION = "질문: "
+_USER_EVIDENCE = "\n\n근거:\n"
+
+
+@dataclass(frozen=True)
+class PromptEntry:
+    system_prompt: str
+    version: int
+    checked_at: float
+    system_message: dict = field(init=False)
+
+    def __post_init__(self):
+        object.__setattr__(self, "system_message", {"role": "system", "content": self.system_prompt})
+
+    def messages(self, question: str, context: str) -> list[dict]:
+        """Chat messages for one RAG call: cached system message + user question/evidence."""
+        return [
+            self.system_message,
+            {"role": "user", "content": _USER_QUESTION + question + _USER_EVIDENCE + context},
+        ]
+
+
+def _current_version(db: Session, company_id: int) -> int:
+    version = db.execute(
+        text("SELECT prompt_version FROM companies WHERE company_id = :c"), {"c": company_id}
+    ).scalar()
+    return version or 0
+
+
+def _active_prompt(db: Session, company_id: int) -> str:
+    prompt = (
+        db.query(PromptTemplate.system_prompt)
+        .filter(
+            PromptTemplate.company_id == company_id,
+            PromptTemplate.is_active == True,
+        )
+        .order_by(PromptTemplate.id)
+        .limit(1)
+        .scalar()
+    )
+    return prompt or DEFAULT_SYSTEM_PROMPT
+
+
+class PromptCache:
+    def __init__(self, check_interval: float):
+        self.check_interval = check_interval
+        self._entries: dict[int, PromptEntry] = {}
+        self._epoch = 0
+        self._lock = threading.Lock()
+
+    def invalidate(self, company_ids=None) -> None:
+        with self._lock:
+            self._epoch += 1
+            if company_ids is None:
+                self._entries.clear()
+            else:
+                for company_id in company_ids:
+                    self._entries.pop(company_id, None)
+
+    def _store(self, company_id: int, entry: PromptEntry, epoch: int) -> None:
+        with self._lock:
+            # 조회 도중 무효화되었으면 저장하지 않는다 (다음 요청이 다시 읽음)
+            if self._epoch == epoch:
+                self._entries[company_id] = entry
+
+    def get(self, db: Session, company_id: int) -> PromptEntry:
+        entry = self._entries.get(company_id)
+        now = time.monotonic()
+        if entry is not None and now - entry.checked_at < self.check_interval:
+            metrics.record_cache("prompt_template", hit=True)
+            return entry
+
+        epoch = self._epoch
+        try:
+            # SAVEPOINT 안에서 조회: 실패해도 호출자 세션의 트랜잭션은 abort 되지 않으므로
+            # 캐시된 프롬프트로 계속 진행한 뒤 ChatLog 등을 정상적으로 INSERT 할 수 있다.
+            with db.begin_nested():
+                version = _current_version(db, company_id)
+                if entry is not None and entry.version == version:
+                    metrics.record_cache("prompt_template", hit=True)
+                    entry = replace(entry, checked_at=now)
+                else:
+                    metrics.record_cache("prompt_template", hit=False)
+                    entry = PromptEntry(_active_prompt(db, company_id), version, now)
+        except SQLAlchemyError as exc:
+            if entry is None:
+                raise
+            logger.warning(
+                "Prompt template refresh failed, serving cached v%d | company_id=%s | %s",
+                entry.version, company_id, exc,
+            )
+            entry = replace(entry, checked_at=now)
+        self._store(company_id, entry, epoch)
+        return entry
+
+
+prompt_cache = PromptCache(PROMPT_CACHE_CHECK_INTERVAL)
+
+
+# ── invalidation hooks ──
+
+_CHANGED_KEY = "prompt_cache_changed"
+
+
+def _bump_version(mapper, connection, target) -> None:
+    # prompt_version 은 공개 회사 카탈로그에 포함되지 않으므로 catalog 무효화는 필요 없다.
+    connection.execute(
+        text("UPDATE companies SET prompt_version = COALESCE(prompt_version, 0) + 1 WHERE company_id = :c"),
+        {"c": target.company_id},
+    )
+    session = Session.object_session(target)
+    if session is not None:
+        session.info.setdefault(_CHANGED_KEY, set()).add(target.company_id)
+
+
+for _evt in ("after_insert", "after_update", "after_delete"):
+    event.listen(PromptTemplate, _evt, _bump_version)
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_on_commit(session) -> None:
+    changed = session.info.pop(_CHANGED_KEY, None)
+    if changed:
+        prompt_cache.invalidate(changed)
+
+
+@event.listens_for(Session, "after_rollback")
+def _clear_on_rollback(session) -> None:
+    session.info.pop(_CHANGED_KEY, None)
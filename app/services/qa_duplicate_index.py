@@ -0,0 +1,243 @@
+"""Per-tenant character bigram index for QA duplicate detection.
+
+관리자 편집기는 질문을 입력할 때마다 /api/qa/check-duplicate 를 호출한다.
+회사별로 질문의 문자 bigram 역색인을 메모리에 두고, Dice 계수
+(2·|A∩B| / (|A|+|B|)) 가 임계값 이상인 질문만 찾는다.
+
+후보 생성은 prefix filtering: Dice ≥ t 이려면 최소 k = ceil(t·|Q| / (2 - t)) 개의
+bigram 을 공유해야 하므로, 질의 bigram 을 문서 빈도 오름차순으로 정렬해 앞의
+|Q| - k + 1 개의 posting 만 훑는다. 흔한 bigram("관리", "리비")은 대부분 건너뛴다.
+
+유지:
+- QaKnowledge ORM insert/update(question 변경)/delete 는 커밋 시 해당 항목만 갱신
+- 벌크 UPDATE/DELETE 는 커밋 시 전체 인덱스 무효화 (다음 조회에서 재구성)
+- 다른 워커의 변경은 QA_DUPLICATE_INDEX_TTL 초 안에 반영
+"""
+
+import logging
+import math
+import re
+import threading
+import time
+
+from sqlalchemy import event, inspect, text
+from sqlalchemy.orm import Session
+
+from app import metrics
+from app.config import QA_DUPLICATE_INDEX_TTL
+from app.database import SessionLocal
+from app.models.qa_knowledge import QaKnowledge
+
+logger = logging.getLogger("acchelper")
+
+ALL_COMPANIES = 0  # super_admin: 전체 회사 대상
+
+_NON_WORD = re.compile(r"[\W_]+")
+
+
+def bigrams(text: str) -> frozenset[str]:
+    norm = _NON_WORD.sub("", text.lower())
+    if len(norm) < 2:
+        return frozenset([norm]) if norm else frozenset()
+    return frozenset(norm[i:i + 2] for i in range(len(norm) - 1))
+
+
+class _TenantIndex:
+    def __init__(self, rows):
+        self.built_at = time.monotonic()
+        self.docs: dict[int, tuple[str, frozenset[str]]] = {}
+        self.postings: dict[str, set[int]] = {}
+        for qa_id, question in rows:
+            self.put(qa_id, question)
+
+    def put(self, qa_id: int, question: str) -> None:
+        self.remove(qa_id)
+        grams = bigrams(question or "")
+        self.docs[qa_id] = (question, grams)
+        for g in grams:
+            self.postings.setdefault(g, set()).add(qa_id)
+
+    def remove(self, qa_id: int) -> None:
+        old = self.docs.pop(qa_id, None)
+        if old is None:
+            return
+        for g in old[1]:
+            ids = self.postings.get(g)
+            if ids is not None:
+                ids.discard(qa_id)
+                if not ids:
+                    del self.postings[g]
+
+    def search(self, grams: frozenset[str], threshold: float, limit: int, exclude_id: int | None) -> list[dict]:
+        if not grams:
+            return []
+        need = math.ceil(threshold * len(grams) / (2 - threshold))
+        ordered = sorted(grams, key=lambda g: len(self.postings.get(g, ())))
+        candidates: set[int] = set()
+        for g in ordered[: len(ordered) - need + 1]:
+            candidates.update(self.postings.get(g, ()))
+        candidates.discard(exclude_id)
+
+        results = []
+        for qa_id in candidates:
+            question, doc_grams = self.docs[qa_id]
+            similarity = 2 * len(grams & doc_grams) / (len(grams) + len(doc_grams))
+            if similarity >= threshold:
+                results.append({"qa_id": qa_id, "question": question, "similarity": similarity})
+        results.sort(key=lambda r: (-r["similarity"], r["qa_id"]))
+        return results[:limit]
+
+
+class QaDuplicateIndex:
+    def __init__(self, ttl: float):
+        self.ttl = ttl
+        self._tenants: dict[int, _TenantIndex] = {}
+        self._lock = threading.Lock()
+
+    def invalidate(self) -> None:
+        with self._lock:
+            self._tenants.clear()
+
+    def _load(self, company_id: int) -> _TenantIndex:
+        db = SessionLocal()
+        try:
+            q = db.query(QaKnowledge.qa_id, QaKnowledge.question)
+            if company_id != ALL_COMPANIES:
+                q = q.filter(QaKnowledge.company_id == company_id)
+            return _TenantIndex(q.all())
+        finally:
+            db.close()
+
+    def _tenant(self, company_id: int) -> _TenantIndex:
+        idx = self._tenants.get(company_id)
+        if idx is not None and time.monotonic() - idx.built_at < self.ttl:
+            metrics.record_cache("qa_duplicate_index", hit=True)
+            return idx
+        with self._lock:
+            idx = self._tenants.get(company_id)
+            if idx is not None and time.monotonic() - idx.built_at < self.ttl:
+                metrics.record_cache("qa_duplicate_index", hit=True)
+                return idx
+            metrics.record_cache("qa_duplicate_index", hit=False)
+            idx = self._load(company_id)
+            self._tenants[company_id] = idx
+            return idx
+
+    def search(
+        self,
+        company_id: int,
+        question: str,
+        threshold: float,
+        limit: int = 5,
+        exclude_id: int | None = None,
+    ) -> list[dict]:
+        """Top `limit` questions with Dice similarity ≥ threshold (0..1), best first."""
+        idx = self._tenant(company_id)
+        with self._lock:
+            return idx.search(bigrams(question), threshold, limit, exclude_id)
+
+    def apply(self, changes: list[tuple[str, int, int, str | None]]) -> None:
+        """Apply committed ("put"|"remove", company_id, qa_id, question) changes."""
+        with self._lock:
+            for op, company_id, qa_id, question in changes:
+                for key in (company_id, ALL_COMPANIES):
+                    idx = self._tenants.get(key)
+                    if idx is None:
+                        continue
+                    if op == "put":
+                        idx.put(qa_id, question)
+                    else:
+                        idx.remove(qa_id)
+
+
+duplicate_index = QaDuplicateIndex(QA_DUPLICATE_INDEX_TTL)
+
+
+def rerank_by_embedding(db: Session, question: str, results: list[dict]) -> list[dict]:
+    """Blend bigram similarity with pgvector cosine similarity (PostgreSQL + OpenAI only).
+
+    Returns results unchanged when embeddings are unavailable.
+    """
+    if not results or db.get_bind().dialect.name != "postgresql":
+        return results
+    from app.services.embedding_service import generate_embedding
+
+    embedding = generate_embedding(question)
+    if embedding is None:
+        return results
+    try:
+        rows = db.execute(
+            text(
+                "SELECT qa_id, 1 - (embedding <=> CAST(:embedding AS vector)) "
+                "FROM qa_embeddings WHERE qa_id = ANY(:ids)"
+            ),
+            {
+                "embedding": "[" + ",".join(str(x) for x in embedding) + "]",
+                "ids": [r["qa_id"] for r in results],
+            },
+        ).fetchall()
+    except Exception as exc:
+        logger.warning("Duplicate rerank failed: %s", exc)
+        return results
+    cosine = {qa_id: float(sim) for qa_id, sim in rows}
+    for r in results:
+        if r["qa_id"] in cosine:
+            r["similarity"] = (r["similarity"] + cosine[r["qa_id"]]) / 2
+    results.sort(key=lambda r: (-r["similarity"], r["qa_id"]))
+    return results
+
+
+# ── maintenance hooks ──
+
+_CHANGES_KEY = "qa_duplicate_changes"
+_RESET_KEY = "qa_duplicate_reset"
+
+
+def _record(session: Session | None, change: tuple) -> None:
+    if session is not None:
+        session.info.setdefault(_CHANGES_KEY, []).append(change)
+
+
+@event.listens_for(QaKnowledge, "after_insert")
+def _on_insert(mapper, connection, target) -> None:
+    _record(Session.object_session(target), ("put", target.company_id, target.qa_id, target.question))
+
+
+@event.listens_for(QaKnowledge, "after_update")
+def _on_update(mapper, connection, target) -> None:
+    state = inspect(target)
+    if state.attrs.question.history.has_changes() or state.attrs.company_id.history.has_changes():
+        session = Session.object_session(target)
+        old_company = state.attrs.company_id.history.deleted
+        if old_company:
+            _record(session, ("remove", old_company[0], target.qa_id, None))
+        _record(session, ("put", target.company_id, target.qa_id, target.question))
+
+
+@event.listens_for(QaKnowledge, "after_delete")
+def _on_delete(mapper, connection, target) -> None:
+    _record(Session.object_session(target), ("remove", target.company_id, target.qa_id, None))
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _bulk_qa_write(orm_execute_state) -> None:
+    if (orm_execute_state.is_update or orm_execute_state.is_delete) and (
+        orm_execute_state.bind_mapper is not None
+        and orm_execute_state.bind_mapper.class_ is QaKnowledge
+    ):
+        orm_execute_state.session.info[_RESET_KEY] = True
+
+
+@event.listens_for(Session, "after_commit")
+def _apply_on_commit(session) -> None:
+    changes = session.info.pop(_CHANGES_KEY, None)
+    if session.info.pop(_RESET_KEY, False):
+        duplicate_index.invalidate()
+    elif changes:
+        duplicate_index.apply(changes)
+
+
+@event.listens_for(Session, "after_rollback")
+def _clear_on_rollback(session) -> None:
+    session.info.pop(_CHANGES_KEY, None)
+    session.info.pop(_RESET_KEY, None)
@@ -0,0 +1,339 @@
+"""Pipelined Q&A Excel bulk import, run as a tracked background job.
+
+업로드 파일은 임시 파일로 받아두고 요청은 job_id 만 돌려준다. 작업 스레드에서:
+1. read_only 워크북을 iter_rows 로 스트리밍하며 QA_IMPORT_BATCH 행씩 청크로 자른다
+2. 청크 단위로 numpy 배열 연산으로 검증한다 (카테고리/질문/답변 길이)
+3. 유효한 행을 INSERT ... RETURNING 한 번으로 넣고 커밋 (진행 중 끊겨도 앞 청크는 보존)
+4. 새 qa_id 들의 임베딩을 QA_IMPORT_EMBED_BATCH 개씩 묶어 스레드풀로 동시에 요청 —
+   임베딩 API 호출은 다음 청크의 읽기/INSERT 와 겹쳐서 진행되고, 끝난 배치부터 저장한다.
+진행 상황과 행별 오류는 GET /api/super/qa/upload/{job_id} 로 조회한다.
+작업 상태는 qa_import_jobs 테이블에 저장하므로(작업 스레드가 JOB_SAVE_INTERVAL 초마다 갱신)
+어느 워커가 조회를 받아도 같은 결과를 돌려준다. JOB_RETENTION_DAYS 일이 지난 작업은
+새 작업을 만들 때 지운다.
+"""
+
+import json
+import logging
+import os
+import time
+import uuid
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+
+from sqlalchemy import delete, insert
+from sqlalchemy.exc import SQLAlchemyError
+
+from app.config import QA_IMPORT_BATCH, QA_IMPORT_EMBED_BATCH, QA_IMPORT_EMBED_CONCURRENCY
+from app.database import SessionLocal
+from app.models.qa_embedding import QaEmbedding
+from app.models.qa_import_job import QaImportJob
+from app.models.qa_knowledge import QaKnowledge
+from app.services.embedding_service import build_embedding_text, generate_embeddings
+from app.services.qa_duplicate_index import duplicate_index
+from app.utils import now_kst
+
+logger = logging.getLogger("acchelper")
+
+VALID_CATEGORIES = {"세금", "급여", "비용처리", "회계처리", "기타"}
+COLUMNS = ("category", "question", "answer", "keywords", "aliases", "tags", "active")
+MIN_QUESTION_LEN = 5
+MIN_ANSWER_LEN = 10
+MAX_ERRORS = 1000
+JOB_SAVE_INTERVAL = 1.0  # seconds between progress writes
+JOB_STALE_SECONDS = 900  # queued/running with no progress write for this long → reported as failed
+JOB_RETENTION_DAYS = 7
+
+
+@dataclass
+class ImportJob:
+    company_id: int
+    filename: str
+    job_id: str = field(default_factory=lambda: uuid.uuid4().hex[:12])
+    status: str = "queued"  # queued → running → done | failed
+    estimated_rows: int | None = None
+    rows_read: int = 0
+    created: int = 0
+    skipped: int = 0
+    failed: int = 0
+    embedded: int = 0
+    embedding_failed: int = 0
+    errors: list[dict] = field(default_factory=list)
+    errors_truncated: int = 0
+    error: str | None = None
+    created_at: datetime = field(default_factory=now_kst)
+    started_at: datetime | None = None
+    finished_at: datetime | None = None
+    _saved_at: float = field(default=0.0, repr=False)
+
+    def add_error(self, row: int, message: str) -> None:
+        if len(self.errors) < MAX_ERRORS:
+            self.errors.append({"row": row, "message": message})
+        else:
+            self.errors_truncated += 1
+
+    def to_dict(self) -> dict:
+        return _job_dict(self, self.errors)
+
+    def save(self, force: bool = True) -> None:
+        """Write progress to qa_import_jobs (throttled to JOB_SAVE_INTERVAL unless forced)."""
+        now = time.monotonic()
+        if not force and now - self._saved_at < JOB_SAVE_INTERVAL:
+            return
+        self._saved_at = now
+        db = SessionLocal()
+        try:
+            db.merge(QaImportJob(
+                job_id=self.job_id,
+                company_id=self.company_id,
+                filename=self.filename,
+                status=self.status,
+                estimated_rows=self.estimated_rows,
+                rows_read=self.rows_read,
+                created=self.created,
+                skipped=self.skipped,
+                failed=self.failed,
+                embedded=self.embedded,
+                embedding_failed=self.embedding_failed,
+                errors=json.dumps(self.errors, ensure_ascii=False),
+                errors_truncated=self.errors_truncated,
+                error=self.error,
+                created_at=self.created_at,
+                updated_at=now_kst(),
+                started_at=self.started_at,
+                finished_at=self.finished_at,
+            ))
+            db.commit()
+        except SQLAlchemyError as exc:
+            db.rollback()
+            logger.warning("QA import progress save failed | job=%s | %s", self.job_id, exc)
+        finally:
+            db.close()
+
+
+def _iso(dt: datetime | None) -> str | None:
+    return dt.isoformat() if dt else None
+
+
+def _job_dict(job, errors: list[dict]) -> dict:
+    """Response body for an ImportJob or a QaImportJob row (same attribute names)."""
+    progress = None
+    if job.status == "done":
+        progress = 100.0
+    elif job.estimated_rows:
+        progress = round(min(job.rows_read / job.estimated_rows, 1.0) * 100, 1)
+    return {
+        "job_id": job.job_id,
+        "company_id": job.company_id,
+        "filename": job.filename,
+        "status": job.status,
+        "progress": progress,
+        "total_rows": job.rows_read,
+        "estimated_rows": job.estimated_rows,
+        "created": job.created,
+        "skipped": job.skipped,
+        "failed": job.failed,
+        "embedded": job.embedded,
+        "embedding_failed": job.embedding_failed,
+        "embedding_pending": max(job.created - job.embedded - job.embedding_failed, 0),
+        "errors": errors,
+        "errors_truncated": job.errors_truncated,
+        "error": job.error,
+        "started_at": _iso(job.started_at),
+        "finished_at": _iso(job.finished_at),
+        "duration_ms": round(((job.finished_at or now_kst()) - job.created_at).total_seconds() * 1000),
+    }
+
+
+def create_job(company_id: int, filename: str) -> ImportJob:
+    job = ImportJob(company_id=company_id, filename=filename)
+    db = SessionLocal()
+    try:
+        cutoff = now_kst() - timedelta(days=JOB_RETENTION_DAYS)
+        db.execute(delete(QaImportJob).where(QaImportJob.created_at < cutoff))
+        db.commit()
+    finally:
+        db.close()
+    job.save()
+    return job
+
+
+def get_job(job_id: str) -> dict | None:
+    db = SessionLocal()
+    try:
+        row = db.get(QaImportJob, job_id)
+        if row is None:
+            return None
+        result = _job_dict(row, json.loads(row.errors or "[]"))
+    finally:
+        db.close()
+    if result["status"] in ("queued", "running") and (
+        now_kst() - row.updated_at
+    ).total_seconds() > JOB_STALE_SECONDS:
+        # 진행 기록이 오래 멈춤 — 작업하던 워커가 재시작/종료된 경우
+        result["status"] = "failed"
+        result["error"] = result["error"] or "작업이 중단되었습니다. 다시 업로드해주세요."
+    return result
+
+
+# ── pipeline stages ──
+
+def _read_chunks(ws, size: int):
+    """Stream (excel_row_no, row) from the sheet in lists of `size`."""
+    chunk = []
+    for idx, row in enumerate(ws.iter_rows(min_row=2, values_only=True), start=2):
+        chunk.append((idx, row))
+        if len(chunk) >= size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def _validate_chunk(job: ImportJob, chunk: list[tuple[int, tuple]]) -> list[dict]:
+    """Normalize and validate a chunk column-wise; returns insert values for valid rows."""
+    import numpy as np
+
+    row_nos = []
+    cells = []
+    for idx, row in chunk:
+        if not row or all(v is None or str(v).strip() == "" for v in row):
+            job.skipped += 1
+            continue
+        values = [str(v).strip() if v is not None else "" for v in row[:len(COLUMNS)]]
+        values += [""] * (len(COLUMNS) - len(values))
+        row_nos.append(idx)
+        cells.append(values)
+    if not cells:
+        return []
+
+    cols = np.array(cells, dtype=object).T
+    category, question, answer = (cols[i].astype(str) for i in range(3))
+    bad_category = ~np.isin(category, list(VALID_CATEGORIES))
+    short_question = np.char.str_len(question) < MIN_QUESTION_LEN
+    short_answer = np.char.str_len(answer) < MIN_ANSWER_LEN
+    invalid = bad_category | short_question | short_answer
+
+    for i in np.flatnonzero(invalid):
+        messages = []
+        if bad_category[i]:
+            messages.append(f"카테고리가 유효하지 않습니다 ('{category[i]}')")
+        if short_question[i]:
+            messages.append("질문이 5자 미만입니다")
+        if short_answer[i]:
+            messages.append("답변이 10자 미만입니다")
+        job.add_error(row_nos[i], ", ".join(messages))
+    job.failed += int(invalid.sum())
+
+    return [
+        {
+            "company_id": job.company_id,
+            "category": cells[i][0],
+            "question": cells[i][1],
+            "answer": cells[i][2],
+            "keywords": cells[i][3],
+            "aliases": cells[i][4],
+            "tags": cells[i][5],
+            "is_active": (cells[i][6] or "활성") != "비활성",
+        }
+        for i in np.flatnonzero(~invalid)
+    ]
+
+
+def _insert_chunk(db, values: list[dict], user_id) -> list[int]:
+    """One multi-row INSERT ... RETURNING; qa_ids in input order."""
+    now = now_kst()
+    for v in values:
+        v.update(created_by=user_id, updated_by=user_id, created_at=now, updated_at=now)
+    result = db.execute(
+        insert(QaKnowledge).returning(QaKnowledge.qa_id, sort_by_parameter_order=True),
+        values,
+    )
+    return [r[0] for r in result]
+
+
+def _store_embeddings(db, job: ImportJob, batches: list[tuple[list[int], list[str], Future]]) -> None:
+    rows = []
+    for qa_ids, texts, future in batches:
+        vectors = future.result()
+        if vectors is None or len(vectors) != len(qa_ids):
+            job.embedding_failed += len(qa_ids)
+            continue
+        rows.extend(
+            {"qa_id": qa_id, "company_id": job.company_id, "embedding_text": text, "embedding": vector}
+            for qa_id, text, vector in zip(qa_ids, texts, vectors)
+        )
+    if rows:
+        db.execute(insert(QaEmbedding), rows)
+        db.commit()
+        job.embedded += len(rows)
+
+
+def _drain(db, job: ImportJob, pending: list, block: bool) -> list:
+    """Persist finished embedding batches; returns the ones still running."""
+    if block and pending:
+        wait([f for _, _, f in pending])
+    done = [p for p in pending if p[2].done()]
+    if done:
+        _store_embeddings(db, job, done)
+    return [p for p in pending if not p[2].done()]
+
+
+def run_import(job: ImportJob, path: str, user_id) -> None:
+    """Background job body (runs in the threadpool). Deletes `path` when finished."""
+    from openpyxl import load_workbook
+
+    job.status = "running"
+    job.started_at = now_kst()
+    job.save()
+    db = SessionLocal()
+    pool = ThreadPoolExecutor(max_workers=QA_IMPORT_EMBED_CONCURRENCY, thread_name_prefix="qa-import-embed")
+    pending: list[tuple[list[int], list[str], Future]] = []
+    try:
+        wb = load_workbook(filename=path, read_only=True)
+        try:
+            ws = wb.active
+            job.estimated_rows = max((ws.max_row or 1) - 1, 0) or None
+            for chunk in _read_chunks(ws, QA_IMPORT_BATCH):
+                job.rows_read += len(chunk)
+                values = _validate_chunk(job, chunk)
+                if values:
+                    qa_ids = _insert_chunk(db, values, user_id)
+                    db.commit()
+                    duplicate_index.apply([
+                        ("put", job.company_id, qa_id, v["question"]) for qa_id, v in zip(qa_ids, values)
+                    ])
+                    job.created += len(qa_ids)
+
+                    texts = [build_embedding_text(QaKnowledge(**v)) for v in values]
+                    for i in range(0, len(qa_ids), QA_IMPORT_EMBED_BATCH):
+                        batch_texts = texts[i:i + QA_IMPORT_EMBED_BATCH]
+                        pending.append((
+                            qa_ids[i:i + QA_IMPORT_EMBED_BATCH],
+                            batch_texts,
+                            pool.submit(generate_embeddings, batch_texts),
+                        ))
+                pending = _drain(db, job, pending, block=False)
+                job.save(force=False)
+            _drain(db, job, pending, block=True)
+        finally:
+            wb.close()
+        job.status = "done"
+    except Exception as e:
+        db.rollback()
+        job.status = "failed"
+        job.error = str(e)
+        logger.exception("QA import failed | job=%s company_id=%s", job.job_id, job.company_id)
+    finally:
+        pool.shutdown(wait=False, cancel_futures=True)
+        db.close()
+        job.finished_at = now_kst()
+        job.save()
+        try:
+            os.unlink(path)
+        except OSError:
+            pass
+    logger.info(
+        "QA import %s | job=%s company_id=%s rows=%d created=%d failed=%d embedded=%d",
+        job.status, job.job_id, job.company_id, job.rows_read, job.created, job.failed, job.embedded,
+    )
@@ -0,0 +1,162 @@
+"""Indexed full-text search for the QA admin list.
+
+백엔드는 DB 에 따라 고른다.
+- SQLite: FTS5 external-content 테이블(qa_knowledge_fts, trigram 토크나이저) +
+  INSERT/UPDATE/DELETE 트리거로 qa_knowledge 와 동기화. 랭킹은 bm25 (질문 > 키워드 > 답변).
+- PostgreSQL: pg_trgm GIN 인덱스(question/answer/keywords). ILIKE '%term%' 가 인덱스를 타고,
+  랭킹은 word_similarity 가중합.
+- 그 외 / 인덱스 없음 / 3자 미만 검색어(trigram 불가): 기존 LIKE 스캔.
+
+trigram 매칭은 부분 문자열 검색이라 결과 집합은 기존 LIKE '%term%' 와 같다.
+"""
+
+import html
+import logging
+import re
+
+from sqlalchemy import func, literal_column, or_, table, text
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Query, Session
+
+from app.models.qa_knowledge import QaKnowledge
+
+logger = logging.getLogger("acchelper")
+
+FTS_TABLE = "qa_knowledge_fts"
+MIN_INDEXED_TERM = 3  # trigram
+
+SQLITE_STATEMENTS = [
+    f"CREATE VIRTUAL TABLE IF NOT EXISTS {FTS_TABLE} USING fts5("
+    "question, answer, keywords, content='qa_knowledge', content_rowid='qa_id', tokenize='trigram')",
+    f"CREATE TRIGGER IF NOT EXISTS {FTS_TABLE}_ai AFTER INSERT ON qa_knowledge BEGIN "
+    f"INSERT INTO {FTS_TABLE}(rowid, question, answer, keywords) "
+    "VALUES (new.qa_id, new.question, new.answer, new.keywords); END",
+    f"CREATE TRIGGER IF NOT EXISTS {FTS_TABLE}_ad AFTER DELETE ON qa_knowledge BEGIN "
+    f"INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, question, answer, keywords) "
+    "VALUES ('delete', old.qa_id, old.question, old.answer, old.keywords); END",
+    f"CREATE TRIGGER IF NOT EXISTS {FTS_TABLE}_au AFTER UPDATE OF question, answer, keywords ON qa_knowledge BEGIN "
+    f"INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, question, answer, keywords) "
+    "VALUES ('delete', old.qa_id, old.question, old.answer, old.keywords); "
+    f"INSERT INTO {FTS_TABLE}(rowid, question, answer, keywords) "
+    "VALUES (new.qa_id, new.question, new.answer, new.keywords); END",
+]
+
+PG_STATEMENTS = [
+    "CREATE EXTENSION IF NOT EXISTS pg_trgm",
+    "CREATE INDEX IF NOT EXISTS ix_qa_knowledge_question_trgm ON qa_knowledge USING gin (question gin_trgm_ops)",
+    "CREATE INDEX IF NOT EXISTS ix_qa_knowledge_answer_trgm ON qa_knowledge USING gin (answer gin_trgm_ops)",
+    "CREATE INDEX IF NOT EXISTS ix_qa_knowledge_keywords_trgm ON qa_knowledge USING gin (keywords gin_trgm_ops)",
+]
+
+_backend: str | None = None
+
+
+def setup(engine: Engine) -> None:
+    """Create the search index for the current dialect (idempotent)."""
+    global _backend
+    dialect = engine.dialect.name
+    try:
+        if dialect == "sqlite":
+            with engine.begin() as conn:
+                existed = conn.execute(
+                    text("SELECT 1 FROM sqlite_master WHERE name = :t"), {"t": FTS_TABLE}
+                ).first() is not None
+                for stmt in SQLITE_STATEMENTS:
+                    conn.execute(text(stmt))
+                if not existed:
+                    conn.execute(text(f"INSERT INTO {FTS_TABLE}({FTS_TABLE}) VALUES ('rebuild')"))
+                    logger.info("QA search: built FTS5 index")
+        elif dialect == "postgresql":
+            with engine.begin() as conn:
+                for stmt in PG_STATEMENTS:
+                    conn.execute(text(stmt))
+    except Exception as exc:
+        logger.warning("QA search index setup failed, using LIKE scan: %s", exc)
+    _backend = None  # re-detect
+
+
+def _detect(db: Session) -> str:
+    global _backend
+    if _backend is None:
+        dialect = db.get_bind().dialect.name
+        backend = "like"
+        try:
+            if dialect == "sqlite" and db.execute(
+                text("SELECT 1 FROM sqlite_master WHERE name = :t"), {"t": FTS_TABLE}
+            ).first():
+                backend = "fts5"
+            elif dialect == "postgresql" and db.execute(
+                text("SELECT 1 FROM pg_extension WHERE extname = 'pg_trgm'")
+            ).first():
+                backend = "pg_trgm"
+        except Exception as exc:
+            logger.warning("QA search backend detection failed: %s", exc)
+        _backend = backend
+        logger.info("QA search backend: %s", backend)
+    return _backend
+
+
+def apply_search(db: Session, query: Query, term: str):
+    """Filter `query` to QA rows containing `term`.
+
+    Returns (query, score) where score is a higher-is-better relevance
+    expression, or None when only a LIKE scan is available.
+    """
+    backend = _detect(db) if len(term) >= MIN_INDEXED_TERM else "like"
+    if backend == "fts5":
+        fts = table(FTS_TABLE)
+        match = '"' + term.replace('"', '""') + '"'
+        query = query.join(fts, literal_column(f"{FTS_TABLE}.rowid") == QaKnowledge.qa_id).filter(
+            literal_column(FTS_TABLE).op("MATCH")(match)
+        )
+        score = -func.bm25(literal_column(FTS_TABLE), 10.0, 1.0, 5.0)
+        return query, score
+    if backend == "pg_trgm":
+        query = query.filter(or_(
+            QaKnowledge.question.icontains(term, autoescape=True),
+            QaKnowledge.answer.icontains(term, autoescape=True),
+            QaKnowledge.keywords.icontains(term, autoescape=True),
+        ))
+        score = (
+            func.word_similarity(term, QaKnowledge.question) * 2
+            + func.word_similarity(term, QaKnowledge.keywords)
+            + func.word_similarity(term, QaKnowledge.answer) * 0.5
+        )
+        return query, score
+    query = query.filter(or_(
+        QaKnowledge.question.contains(term, autoescape=True),
+        QaKnowledge.answer.contains(term, autoescape=True),
+        QaKnowledge.keywords.contains(term, autoescape=True),
+    ))
+    return query, None
+
+
+# ── highlighting ──
+
+SNIPPET_CHARS = 60
+
+
+def highlight(value: str, term: str, snippet: bool = False) -> str | None:
+    """HTML-escaped `value` with <mark> around occurrences of `term`.
+
+    snippet=True trims to a window around the first match. Returns None when
+    `term` does not occur.
+    """
+    if not value or not term:
+        return None
+    pattern = re.compile(re.escape(term), re.IGNORECASE)
+    first = pattern.search(value)
+    if first is None:
+        return None
+    if snippet and len(value) > SNIPPET_CHARS * 2:
+        start = max(0, first.start() - SNIPPET_CHARS // 2)
+        end = min(len(value), start + SNIPPET_CHARS * 2)
+        value = ("…" if start else "") + value[start:end] + ("…" if end < len(value) else "")
+    parts = []
+    pos = 0
+    for m in pattern.finditer(value):
+        parts.append(html.escape(value[pos:m.start()]))
+        parts.append(f"<mark>{html.escape(m.group(0))}</mark>")
+        pos = m.end()
+    parts.append(html.escape(value[pos:]))
+    return "".join(parts)
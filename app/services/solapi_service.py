@@ -1,22 +1,96 @@
 """
 솔라피(Solapi) 카카오 알림톡 발송 서비스
-- REST API 직접 호출 (httpx sync)
+- REST API 직접 호출 (httpx sync, 프로세스 공유 커넥션 풀 — 매 발송 TLS 핸드셰이크 없음)
 - HMAC-SHA256 인증 방식 사용
+- 모든 발송은 alimtalk_outbox 에 기록된다 (pending → sending → sent | failed)
+- 알림(댓글/민원/1:1톡/미답변 등)은 outbox 에 pending 으로 INSERT 하고 바로 반환한다 —
+  호출 스레드는 HTTP 를 기다리지 않는다. 디스패처 스레드가 깨어나 SOLAPI_SEND_CONCURRENCY
+  동시성 안에서 보내고, 5xx/429/타임아웃은 지수 백오프로 SOLAPI_OUTBOX_MAX_ATTEMPTS 번까지 재시도한다.
+- 인증번호(OTP)만 요청 스레드에서 SOLAPI_OTP_TIMEOUT 으로 한 번 시도하고, 일시 오류면 큐에 넘긴다.
+- 보존: 발송이 끝난 행의 payload 는 SOLAPI_OUTBOX_PAYLOAD_RETENTION_HOURS 뒤(인증번호는 즉시)
+  비우고, 행은 SOLAPI_OUTBOX_RETENTION_DAYS 뒤 삭제한다 (디스패처가 PURGE_INTERVAL 마다 정리).
+- sending 상태로 SOLAPI_OUTBOX_STALE_SECONDS 넘게 남은 행(발송 중 프로세스 종료, 결과 기록
+  실패 등)은 디스패처가 pending 으로 되돌려 다시 보낸다. 이미 전달된 메시지였다면 중복 발송될
+  수 있다 — 유실보다 중복을 택한 것 (at-least-once).
 """
 
 import hashlib
 import hmac
+import json
 import logging
+import random
+import threading
+import time
 import uuid
-from datetime import datetime, timezone
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
 
-import httpx
+from sqlalchemy import and_, delete, or_, update
 
-from app import config
+from app import config, metrics
+from app.database import SessionLocal
+from app.models.alimtalk_outbox import AlimtalkOutbox
+from app.profiling import HTTPX_EVENT_HOOKS
+from app.utils import now_kst
 
 logger = logging.getLogger(__name__)
 
 SOLAPI_SEND_URL = "https://api.solapi.com/messages/v4/send"
+TERMINAL_STATUSES = ("sent", "failed")
+SCRUBBED_PAYLOAD = "{}"  # 보존 기간이 지난 payload (전화번호·인증번호 제거)
+
+_client = None
+_client_lock = threading.Lock()
+_send_slots = threading.BoundedSemaphore(config.SOLAPI_SEND_CONCURRENCY)
+_pool: ThreadPoolExecutor | None = None
+
+
+class SolapiRetryableError(Exception):
+    """5xx / 429 / network error — safe to retry later."""
+
+
+def _http_client():
+    """Process-wide pooled client (keep-alive connections are reused across sends)."""
+    global _client
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                import httpx  # lazy: keeps worker import time down
+
+                _client = httpx.Client(
+                    timeout=config.SOLAPI_TIMEOUT,
+                    limits=httpx.Limits(
+                        max_connections=config.SOLAPI_SEND_CONCURRENCY * 2,
+                        max_keepalive_connections=config.SOLAPI_SEND_CONCURRENCY,
+                    ),
+                    event_hooks=HTTPX_EVENT_HOOKS,
+                )
+    return _client
+
+
+def _executor() -> ThreadPoolExecutor:
+    """Shared send pool for fan-out and the outbox dispatcher."""
+    global _pool
+    if _pool is None:
+        with _client_lock:
+            if _pool is None:
+                _pool = ThreadPoolExecutor(
+                    max_workers=config.SOLAPI_SEND_CONCURRENCY, thread_name_prefix="solapi-send"
+                )
+    return _pool
+
+
+def shutdown() -> None:
+    """Stop the dispatcher, drain the send pool and close pooled connections."""
+    global _client, _pool
+    dispatcher.stop()
+    with _client_lock:
+        client, _client = _client, None
+        pool, _pool = _pool, None
+    if pool is not None:
+        pool.shutdown(wait=True)
+    if client is not None:
+        client.close()
 
 
 def _make_auth_header() -> str:
@@ -34,18 +108,369 @@ def _make_auth_header() -> str:
     )
 
 
-def send_unanswered_alimtalk(
+def _post(payload: dict, timeout: float | None) -> str | None:
+    """One HTTP attempt. Returns the provider message id.
+
+    Raises SolapiRetryableError for transient failures and httpx.HTTPStatusError for
+    permanent 4xx errors.
+    """
+    import httpx
+
+    headers = {
+        "Content-Type": "application/json",
+        "Authorization": _make_auth_header(),
+    }
+    start = time.perf_counter()
+    outcome = "error"
+    try:
+        with _send_slots:
+            resp = _http_client().post(
+                SOLAPI_SEND_URL, json=payload, headers=headers,
+                timeout=timeout or config.SOLAPI_TIMEOUT,
+            )
+        if resp.status_code >= 500 or resp.status_code == 429:
+            logger.warning("[Solapi] %s %s (retryable)", resp.status_code, resp.text[:200])
+            raise SolapiRetryableError(f"HTTP {resp.status_code}")
+        if resp.status_code >= 400:
+            logger.error("[Solapi] %s %s | payload=%s", resp.status_code, resp.text, payload)
+        resp.raise_for_status()
+        outcome = "ok"
+        try:
+            return resp.json().get("messageId")
+        except ValueError:
+            return None
+    except (httpx.TimeoutException, httpx.TransportError) as exc:
+        raise SolapiRetryableError(f"{type(exc).__name__}: {exc}") from exc
+    finally:
+        metrics.observe("solapi_request_duration_seconds", time.perf_counter() - start)
+        metrics.inc("solapi_requests_total", outcome=outcome)
+
+
+# ── outbox ──
+
+def _outbox_insert(kind: str, payload: dict, status: str, expires_at: datetime | None) -> int | None:
+    db = SessionLocal()
+    try:
+        row = AlimtalkOutbox(
+            kind=kind,
+            recipient=payload["message"]["to"][:20],
+            payload=json.dumps(payload, ensure_ascii=False),
+            status=status,
+            next_attempt_at=now_kst(),  # sending 이면 점유 시각 (stale 판정 기준)
+            expires_at=expires_at,
+        )
+        db.add(row)
+        db.commit()
+        return row.id
+    except Exception as exc:
+        logger.error("[Solapi] outbox insert failed: %s", exc)
+        db.rollback()
+        return None
+    finally:
+        db.close()
+
+
+def _outbox_insert_many(kind: str, payloads: list[dict]) -> list[int | None]:
+    """Insert pending rows in one transaction; ids in input order (None on failure)."""
+    db = SessionLocal()
+    try:
+        now = now_kst()
+        rows = [
+            AlimtalkOutbox(
+                kind=kind,
+                recipient=payload["message"]["to"][:20],
+                payload=json.dumps(payload, ensure_ascii=False),
+                status="pending",
+                next_attempt_at=now,
+            )
+            for payload in payloads
+        ]
+        db.add_all(rows)
+        db.commit()
+        return [row.id for row in rows]
+    except Exception as exc:
+        logger.error("[Solapi] outbox bulk insert failed: %s", exc)
+        db.rollback()
+        return [None] * len(payloads)
+    finally:
+        db.close()
+
+
+def _outbox_update(outbox_id: int | None, **values) -> None:
+    if outbox_id is None:
+        return
+    db = SessionLocal()
+    try:
+        db.execute(update(AlimtalkOutbox).where(AlimtalkOutbox.id == outbox_id).values(**values))
+        db.commit()
+    except Exception as exc:
+        logger.error("[Solapi] outbox update failed (id=%s): %s", outbox_id, exc)
+        db.rollback()
+    finally:
+        db.close()
+
+
+def _backoff(attempt: int) -> float:
+    return config.SOLAPI_RETRY_BACKOFF * (2 ** attempt) * (0.5 + random.random())
+
+
+def enqueue(kind: str, payload: dict, expires_at: datetime | None = None) -> bool:
+    """Queue one message for the dispatcher and return immediately.
+
+    Returns True when the row was stored; delivery (and retries) happen on the
+    dispatcher thread, so the caller never waits on the Solapi API.
+    """
+    outbox_id = _outbox_insert(kind, payload, "pending", expires_at)
+    if outbox_id is None:
+        return False
+    dispatcher.wake()
+    return True
+
+
+def send_many(kind: str, payloads: list[dict]) -> list[bool]:
+    """Queue one alert for many recipients in a single INSERT and return immediately.
+
+    Returns one bool per payload (True = queued). The dispatcher delivers them
+    concurrently on the shared send pool.
+    """
+    if not payloads:
+        return []
+    outbox_ids = _outbox_insert_many(kind, payloads)
+    queued = [outbox_id is not None for outbox_id in outbox_ids]
+    if any(queued):
+        dispatcher.wake()
+    return queued
+
+
+def _send_now(kind: str, payload: dict, *, timeout: float, expires_at: datetime | None) -> bool:
+    """One inline attempt with a tight timeout (time-critical messages, i.e. OTP).
+
+    A transient failure leaves the row pending for the dispatcher and counts as
+    success; a permanent 4xx is re-raised. The payload is scrubbed as soon as the
+    send finishes.
+    """
+    outbox_id = _outbox_insert(kind, payload, "sending", expires_at)
+    try:
+        message_id = _post(payload, timeout)
+    except SolapiRetryableError as exc:
+        _outbox_update(
+            outbox_id, status="pending", attempts=1, last_error=str(exc)[:500],
+            next_attempt_at=now_kst() + timedelta(seconds=_backoff(1)),
+        )
+        if outbox_id is None:
+            raise
+        dispatcher.wake()
+        logger.warning("[Solapi] %s 발송 지연 — outbox(id=%s) 재시도 예약: %s", kind, outbox_id, exc)
+        return True
+    except Exception as exc:
+        _outbox_update(outbox_id, status="failed", attempts=1, last_error=str(exc)[:500], payload=SCRUBBED_PAYLOAD)
+        raise
+    _outbox_update(
+        outbox_id, status="sent", attempts=1, provider_message_id=message_id,
+        sent_at=now_kst(), last_error=None, payload=SCRUBBED_PAYLOAD,
+    )
+    return True
+
+
+class OutboxDispatcher:
+    """Background thread delivering pending outbox rows with bounded concurrency."""
+
+    BATCH = 50
+    PURGE_INTERVAL = 3600.0
+
+    def __init__(self):
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._purged_at = 0.0
+
+    def start(self) -> None:
+        if self._thread is not None:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="solapi-outbox", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        self._wake.set()
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+            self._thread = None
+
+    def wake(self) -> None:
+        self._wake.set()
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            claimed = 0
+            try:
+                claimed = self._drain_once()
+                if time.monotonic() - self._purged_at >= self.PURGE_INTERVAL:
+                    self._purged_at = time.monotonic()
+                    self._purge(now_kst())
+            except Exception as exc:
+                logger.error("[Solapi] outbox dispatcher error: %s", exc)
+            if claimed >= self.BATCH:
+                continue  # 밀린 행이 더 있다 — 대기 없이 다음 배치
+            self._wake.wait(config.SOLAPI_OUTBOX_POLL_SECONDS)
+            self._wake.clear()
+
+    @staticmethod
+    def _purge(now: datetime) -> None:
+        """Retention: scrub payloads of finished rows, then delete old rows.
+
+        payload 에는 전화번호와 인증번호가 들어 있으므로 재발송에 더 필요 없는 행은 비운다.
+        인증번호처럼 expires_at 이 있는 행은 만료 즉시, 나머지는 PAYLOAD_RETENTION_HOURS 뒤.
+        """
+        finished = AlimtalkOutbox.status.in_(TERMINAL_STATUSES)
+        db = SessionLocal()
+        try:
+            scrubbed = db.execute(
+                update(AlimtalkOutbox)
+                .where(
+                    finished,
+                    AlimtalkOutbox.payload != SCRUBBED_PAYLOAD,
+                    or_(
+                        AlimtalkOutbox.expires_at <= now,
+                        AlimtalkOutbox.created_at
+                        <= now - timedelta(hours=config.SOLAPI_OUTBOX_PAYLOAD_RETENTION_HOURS),
+                    ),
+                )
+                .values(payload=SCRUBBED_PAYLOAD)
+            ).rowcount
+            deleted = db.execute(
+                delete(AlimtalkOutbox).where(
+                    finished,
+                    AlimtalkOutbox.created_at <= now - timedelta(days=config.SOLAPI_OUTBOX_RETENTION_DAYS),
+                )
+            ).rowcount
+            db.commit()
+        except Exception:
+            db.rollback()
+            raise
+        finally:
+            db.close()
+        if scrubbed or deleted:
+            logger.info("[Solapi] outbox retention: scrubbed=%d deleted=%d", scrubbed, deleted)
+
+    @staticmethod
+    def _recover_stale(db, now: datetime) -> None:
+        """Return rows stuck in "sending" (lost worker / failed result write) to the queue.
+
+        sending 행의 next_attempt_at 은 점유 시각이다. 점유 후 STALE 초가 지나도 결과가
+        기록되지 않았으면 발송 결과를 알 수 없으므로 시도 1회로 세고 다시 보낸다
+        (이미 전달되었다면 중복 발송될 수 있음). 최대 시도 횟수를 넘으면 failed.
+        """
+        cutoff = now - timedelta(seconds=config.SOLAPI_OUTBOX_STALE_SECONDS)
+        stale = (
+            AlimtalkOutbox.status == "sending",
+            or_(
+                AlimtalkOutbox.next_attempt_at <= cutoff,
+                and_(AlimtalkOutbox.next_attempt_at == None, AlimtalkOutbox.created_at <= cutoff),
+            ),
+        )
+        failed = db.execute(
+            update(AlimtalkOutbox)
+            .where(*stale, AlimtalkOutbox.attempts + 1 >= config.SOLAPI_OUTBOX_MAX_ATTEMPTS)
+            .values(attempts=AlimtalkOutbox.attempts + 1, status="failed", last_error="stale in sending")
+        ).rowcount
+        requeued = db.execute(
+            update(AlimtalkOutbox)
+            .where(*stale)
+            .values(
+                attempts=AlimtalkOutbox.attempts + 1, status="pending",
+                last_error="stale in sending — redelivering", next_attempt_at=now,
+            )
+        ).rowcount
+        db.commit()
+        if failed or requeued:
+            logger.warning("[Solapi] stale outbox rows: requeued=%d failed=%d", requeued, failed)
+
+    def _drain_once(self) -> int:
+        """Claim up to BATCH due rows and deliver them; returns the number claimed."""
+        now = now_kst()
+        db = SessionLocal()
+        try:
+            self._recover_stale(db, now)
+            due = (
+                db.query(AlimtalkOutbox.id)
+                .filter(AlimtalkOutbox.status == "pending", AlimtalkOutbox.next_attempt_at <= now)
+                .order_by(AlimtalkOutbox.next_attempt_at)
+                .limit(self.BATCH)
+                .all()
+            )
+            claimed = []
+            for (outbox_id,) in due:
+                # 여러 워커 프로세스가 같은 행을 집지 않도록 조건부 UPDATE 로 점유
+                result = db.execute(
+                    update(AlimtalkOutbox)
+                    .where(AlimtalkOutbox.id == outbox_id, AlimtalkOutbox.status == "pending")
+                    .values(status="sending", next_attempt_at=now)
+                )
+                if result.rowcount:
+                    claimed.append(outbox_id)
+            db.commit()
+        finally:
+            db.close()
+
+        futures = [_executor().submit(self._deliver, outbox_id) for outbox_id in claimed]
+        for future in futures:
+            future.result()
+        return len(claimed)
+
+    @staticmethod
+    def _deliver(outbox_id: int) -> None:
+        db = SessionLocal()
+        try:
+            row = db.get(AlimtalkOutbox, outbox_id)
+            if row is None:
+                return
+            if row.expires_at and row.expires_at <= now_kst():
+                row.status = "failed"
+                row.last_error = "expired before delivery"
+                row.payload = SCRUBBED_PAYLOAD
+                db.commit()
+                return
+            payload = json.loads(row.payload)
+            attempts = row.attempts + 1
+            scrub = row.expires_at is not None  # 인증번호는 발송이 끝나면 바로 비운다
+            db.close()  # HTTP 호출 동안 커넥션을 잡지 않는다
+
+            values: dict = {"attempts": attempts}
+            try:
+                values["provider_message_id"] = _post(payload, None)
+                values.update(status="sent", sent_at=now_kst(), last_error=None)
+            except SolapiRetryableError as exc:
+                if attempts >= config.SOLAPI_OUTBOX_MAX_ATTEMPTS:
+                    values.update(status="failed", last_error=str(exc)[:500])
+                else:
+                    values.update(
+                        status="pending", last_error=str(exc)[:500],
+                        next_attempt_at=now_kst() + timedelta(seconds=_backoff(attempts)),
+                    )
+            except Exception as exc:
+                values.update(status="failed", last_error=str(exc)[:500])
+            if scrub and values["status"] in TERMINAL_STATUSES:
+                values["payload"] = SCRUBBED_PAYLOAD
+            _outbox_update(outbox_id, **values)
+            logger.info("[Solapi] outbox id=%s → %s (attempt %d)", outbox_id, values["status"], attempts)
+        finally:
+            db.close()
+
+
+dispatcher = OutboxDispatcher()
+
+
+def unanswered_payload(
     to: str,
     apt_name: str,
     question: str,
     time: str,
     url: str,
-) -> bool:
-    """
-    미답변 알림톡 발송
-    Returns True if success, False if failed
-    """
-    payload = {
+) -> dict:
+    """send_unanswered_alimtalk 의 요청 본문. send_many 팬아웃용."""
+    return {
         "message": {
             "to": to.replace("-", ""),
             "kakaoOptions": {
@@ -61,17 +486,20 @@ def send_unanswered_alimtalk(
         }
     }
 
-    headers = {
-        "Content-Type": "application/json",
-        "Authorization": _make_auth_header(),
-    }
 
-    with httpx.Client(timeout=10.0) as client:
-        resp = client.post(SOLAPI_SEND_URL, json=payload, headers=headers)
-        if resp.status_code >= 400:
-            logger.error("[Solapi] %s %s | payload=%s", resp.status_code, resp.text, payload)
-        resp.raise_for_status()
-        return True
+def send_unanswered_alimtalk(
+    to: str,
+    apt_name: str,
+    question: str,
+    time: str,
+    url: str,
+) -> bool:
+    """
+    미답변 알림톡 발송 (outbox 에 넣고 바로 반환)
+    Returns True if queued, False if the outbox insert failed
+    """
+    payload = unanswered_payload(to=to, apt_name=apt_name, question=question, time=time, url=url)
+    return enqueue("unanswered", payload)
 
 
 def send_market_comment_alimtalk(
@@ -105,17 +533,7 @@ def send_market_comment_alimtalk(
         }
     }
 
-    headers = {
-        "Content-Type": "application/json",
-        "Authorization": _make_auth_header(),
-    }
-
-    with httpx.Client(timeout=10.0) as client:
-        resp = client.post(SOLAPI_SEND_URL, json=payload, headers=headers)
-        if resp.status_code >= 400:
-            logger.error("[Solapi] %s %s | payload=%s", resp.status_code, resp.text, payload)
-        resp.raise_for_status()
-        return True
+    return enqueue("market_comment", payload)
 
 
 def send_fee_otp_alimtalk(
@@ -126,6 +544,8 @@ def send_fee_otp_alimtalk(
     """
     관리비 조회 인증번호 알림톡 발송
     템플릿 변수: #{인증번호}, #{유효시간}
+    요청 스레드에서 SOLAPI_OTP_TIMEOUT 으로 한 번만 시도하고, 일시 오류면 outbox 로 넘겨
+    유효시간 안에서 재시도한다.
     """
     if not config.SOLAPI_OTP_TEMPLATE_ID:
         logger.warning("[Solapi] SOLAPI_OTP_TEMPLATE_ID 미설정 — 관리비 인증번호 알림톡 생략")
@@ -146,36 +566,24 @@ def send_fee_otp_alimtalk(
         }
     }
 
-    headers = {
-        "Content-Type": "application/json",
-        "Authorization": _make_auth_header(),
-    }
+    expires_at = now_kst() + timedelta(minutes=valid_minutes)
+    return _send_now("fee_otp", payload, timeout=config.SOLAPI_OTP_TIMEOUT, expires_at=expires_at)
 
-    with httpx.Client(timeout=10.0) as client:
-        resp = client.post(SOLAPI_SEND_URL, json=payload, headers=headers)
-        if resp.status_code >= 400:
-            logger.error("[Solapi] %s %s | payload=%s", resp.status_code, resp.text, payload)
-        resp.raise_for_status()
-        return True
 
-
-def send_chat_talk_admin_alimtalk(
+def chat_talk_admin_payload(
     to: str,
     apt_name: str,
     unit: str,
     content: str,
     time: str,
     url: str,
-) -> bool:
-    """
-    1:1 톡 신규 메시지(입주민 → 관리자) 알림톡 발송
-    템플릿 변수: #{아파트명}, #{동호수}, #{내용}, #{시간}, #{링크}
-    """
+) -> dict | None:
+    """send_chat_talk_admin_alimtalk 의 요청 본문 (템플릿 미설정 시 None). send_many 팬아웃용."""
     if not config.SOLAPI_CHAT_TALK_ADMIN_TEMPLATE_ID:
         logger.warning("[Solapi] SOLAPI_CHAT_TALK_ADMIN_TEMPLATE_ID 미설정 — 1:1톡 관리자 알림톡 생략")
-        return False
+        return None
 
-    payload = {
+    return {
         "message": {
             "to": to.replace("-", ""),
             "kakaoOptions": {
@@ -192,17 +600,23 @@ def send_chat_talk_admin_alimtalk(
         }
     }
 
-    headers = {
-        "Content-Type": "application/json",
-        "Authorization": _make_auth_header(),
-    }
 
-    with httpx.Client(timeout=10.0) as client:
-        resp = client.post(SOLAPI_SEND_URL, json=payload, headers=headers)
-        if resp.status_code >= 400:
-            logger.error("[Solapi] %s %s | payload=%s", resp.status_code, resp.text, payload)
-        resp.raise_for_status()
-        return True
+def send_chat_talk_admin_alimtalk(
+    to: str,
+    apt_name: str,
+    unit: str,
+    content: str,
+    time: str,
+    url: str,
+) -> bool:
+    """
+    1:1 톡 신규 메시지(입주민 → 관리자) 알림톡 발송
+    템플릿 변수: #{아파트명}, #{동호수}, #{내용}, #{시간}, #{링크}
+    """
+    payload = chat_talk_admin_payload(to=to, apt_name=apt_name, unit=unit, content=content, time=time, url=url)
+    if payload is None:
+        return False
+    return enqueue("chat_talk_admin", payload)
 
 
 def send_chat_talk_reply_alimtalk(
@@ -232,17 +646,7 @@ def send_chat_talk_reply_alimtalk(
         }
     }
 
-    headers = {
-        "Content-Type": "application/json",
-        "Authorization": _make_auth_header(),
-    }
-
-    with httpx.Client(timeout=10.0) as client:
-        resp = client.post(SOLAPI_SEND_URL, json=payload, headers=headers)
-        if resp.status_code >= 400:
-            logger.error("[Solapi] %s %s | payload=%s", resp.status_code, resp.text, payload)
-        resp.raise_for_status()
-        return True
+    return enqueue("chat_talk_reply", payload)
 
 
 def send_complaint_reply_alimtalk(
@@ -274,36 +678,23 @@ def send_complaint_reply_alimtalk(
         }
     }
 
-    headers = {
-        "Content-Type": "application/json",
-        "Authorization": _make_auth_header(),
-    }
-
-    with httpx.Client(timeout=10.0) as client:
-        resp = client.post(SOLAPI_SEND_URL, json=payload, headers=headers)
-        if resp.status_code >= 400:
-            logger.error("[Solapi] %s %s | payload=%s", resp.status_code, resp.text, payload)
-        resp.raise_for_status()
-        return True
+    return enqueue("complaint_reply", payload)
 
 
-def send_complaint_alimtalk(
+def complaint_payload(
     to: str,
     apt_name: str,
     title: str,
     writer: str,
     time: str,
     url: str,
-) -> bool:
-    """
-    민원 등록 알림톡 발송
-    템플릿 변수: #{apt_name}, #{title}, #{writer}, #{time}, #{url}
-    """
+) -> dict | None:
+    """send_complaint_alimtalk 의 요청 본문 (템플릿 미설정 시 None). send_many 팬아웃용."""
     if not config.SOLAPI_COMPLAINT_TEMPLATE_ID:
         logger.warning("[Solapi] SOLAPI_COMPLAINT_TEMPLATE_ID 미설정 — 민원 알림톡 생략")
-        return False
+        return None
 
-    payload = {
+    return {
         "message": {
             "to": to.replace("-", ""),
             "kakaoOptions": {
@@ -320,14 +711,20 @@ def send_complaint_alimtalk(
         }
     }
 
-    headers = {
-        "Content-Type": "application/json",
-        "Authorization": _make_auth_header(),
-    }
 
-    with httpx.Client(timeout=10.0) as client:
-        resp = client.post(SOLAPI_SEND_URL, json=payload, headers=headers)
-        if resp.status_code >= 400:
-            logger.error("[Solapi] %s %s | payload=%s", resp.status_code, resp.text, payload)
-        resp.raise_for_status()
-        return True
+def send_complaint_alimtalk(
+    to: str,
+    apt_name: str,
+    title: str,
+    writer: str,
+    time: str,
+    url: str,
+) -> bool:
+    """
+    민원 등록 알림톡 발송
+    템플릿 변수: #{apt_name}, #{title}, #{writer}, #{time}, #{url}
+    """
+    payload = complaint_payload(to=to, apt_name=apt_name, title=title, writer=writer, time=time, url=url)
+    if payload is None:
+        return False
+    return enqueue("complaint", payload)
@@ -0,0 +1,222 @@
+"""In-memory static asset layer: content-hash ETags + precompressed variants.
+
+정적 파일(css/js/html)을 시작 시 한 번 읽어 sha256 해시로 ETag를 만들고,
+gzip/brotli 압축본을 미리 만들어 메모리에서 서빙한다. 압축은 시작 직후 백그라운드
+스레드에서 진행하며(부팅을 막지 않음), 끝나기 전의 요청은 비압축 본문으로 응답한다.
+요청 처리 중에는 절대 압축하지 않는다.
+
+- If-None-Match 가 일치하면 304
+- HTML 안의 /css, /js 참조는 ?v=<hash> 로 재작성 → 해당 URL은 immutable 캐시
+- 해시가 없는(또는 다른) URL은 STATIC_CACHE_MAX_AGE 동안 캐시 후 재검증
+- HTML 자체는 no-cache(매번 재검증) + ETag 로 변경 없으면 304
+"""
+
+import gzip
+import hashlib
+import logging
+import mimetypes
+import re
+import threading
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from starlette.datastructures import Headers
+from starlette.requests import Request
+from starlette.responses import PlainTextResponse, Response
+from starlette.types import Receive, Scope, Send
+
+from app import metrics
+from app.config import STATIC_CACHE_MAX_AGE
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+logger = logging.getLogger("acchelper")
+
+IMMUTABLE_CACHE = "public, max-age=31536000, immutable"
+HTML_CACHE = "no-cache"
+ASSET_DIRS = ("css", "js")
+MIN_COMPRESS_SIZE = 500
+
+_ASSET_REF_RE = re.compile(r'(?P<attr>(?:href|src)=")(?P<path>/(?:css|js)/[^"?#]+)(?:\?[^"#]*)?(?P<end>")')
+
+
+@dataclass
+class Asset:
+    body: bytes
+    media_type: str
+    etag: str
+    digest: str
+    encodings: dict[str, bytes] = field(default_factory=dict)
+
+
+def _digest(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()[:16]
+
+
+def _build_asset(body: bytes, media_type: str) -> Asset:
+    digest = _digest(body)
+    return Asset(body=body, media_type=media_type, etag=f'"{digest}"', digest=digest)
+
+
+def _precompress(asset: Asset) -> None:
+    if len(asset.body) < MIN_COMPRESS_SIZE:
+        return
+    if brotli is not None and "br" not in asset.encodings:
+        asset.encodings["br"] = brotli.compress(asset.body, quality=11)
+    if "gzip" not in asset.encodings:
+        asset.encodings["gzip"] = gzip.compress(asset.body, compresslevel=9, mtime=0)
+
+
+def _media_type(path: Path) -> str:
+    media_type = mimetypes.guess_type(path.name)[0] or "application/octet-stream"
+    if media_type.startswith("text/") or media_type in ("application/javascript",):
+        media_type += "; charset=utf-8"
+    return media_type
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    tags = [t.strip().removeprefix("W/") for t in if_none_match.split(",")]
+    return etag in tags
+
+
+def _pick_encoding(asset: Asset, accept_encoding: str) -> str | None:
+    accepted = {part.split(";")[0].strip().lower() for part in accept_encoding.split(",")}
+    for encoding in ("br", "gzip"):
+        if encoding in asset.encodings and encoding in accepted:
+            return encoding
+    return None
+
+
+def _asset_response(asset: Asset, headers: Headers, cache_control: str, head_only: bool = False) -> Response:
+    base_headers = {
+        "ETag": asset.etag,
+        "Cache-Control": cache_control,
+        "Vary": "Accept-Encoding",
+    }
+    if etag_matches(headers.get("if-none-match"), asset.etag):
+        metrics.record_cache("static_etag", hit=True)
+        return Response(status_code=304, headers=base_headers)
+    metrics.record_cache("static_etag", hit=False)
+
+    encoding = _pick_encoding(asset, headers.get("accept-encoding", ""))
+    body = asset.encodings[encoding] if encoding else asset.body
+    if encoding:
+        base_headers["Content-Encoding"] = encoding
+    response = Response(content=b"" if head_only else body, media_type=asset.media_type, headers=base_headers)
+    if head_only:
+        response.headers["Content-Length"] = str(len(body))
+    return response
+
+
+class StaticAssetStore:
+    """Holds hashed, precompressed copies of the static tree."""
+
+    def __init__(self, static_dir: Path):
+        self.static_dir = static_dir
+        self.assets: dict[str, Asset] = {}
+        self.pages: dict[str, Asset] = {}
+        self.loaded = False
+
+    def load(self) -> None:
+        """Read and hash the static tree. Compression is left to start_precompress()."""
+        assets: dict[str, Asset] = {}
+        for sub in ASSET_DIRS:
+            root = self.static_dir / sub
+            if not root.exists():
+                continue
+            for path in sorted(root.rglob("*")):
+                if path.is_file():
+                    url = "/" + path.relative_to(self.static_dir).as_posix()
+                    assets[url] = _build_asset(path.read_bytes(), _media_type(path))
+
+        pages: dict[str, Asset] = {}
+        if self.static_dir.exists():
+            for path in sorted(self.static_dir.glob("*.html")):
+                html = path.read_text(encoding="utf-8")
+                html = self._rewrite_refs(html, assets)
+                pages[path.name] = _build_asset(html.encode("utf-8"), "text/html; charset=utf-8")
+
+        self.assets = assets
+        self.pages = pages
+        self.loaded = True
+        logger.info(
+            "Static assets loaded: %d assets, %d pages (brotli=%s)",
+            len(assets), len(pages), brotli is not None,
+        )
+
+    def precompress(self) -> None:
+        t0 = time.perf_counter()
+        for asset in [*self.assets.values(), *self.pages.values()]:
+            _precompress(asset)
+        logger.info("Static assets precompressed in %.0fms", (time.perf_counter() - t0) * 1000)
+
+    def start_precompress(self) -> threading.Thread:
+        """Precompress in a daemon thread; until done, responses go out uncompressed."""
+        thread = threading.Thread(target=self.precompress, name="static-precompress", daemon=True)
+        thread.start()
+        return thread
+
+    def ensure_loaded(self) -> None:
+        if not self.loaded:
+            self.load()
+            self.start_precompress()
+
+    @staticmethod
+    def _rewrite_refs(html: str, assets: dict[str, Asset]) -> str:
+        def repl(m: re.Match) -> str:
+            asset = assets.get(m.group("path"))
+            if asset is None:
+                return m.group(0)
+            return f'{m.group("attr")}{m.group("path")}?v={asset.digest}{m.group("end")}'
+
+        return _ASSET_REF_RE.sub(repl, html)
+
+    def page_response(self, request: Request, name: str) -> Response:
+        self.ensure_loaded()
+        page = self.pages.get(name)
+        if page is None:
+            return PlainTextResponse("Not Found", status_code=404)
+        return _asset_response(page, request.headers, HTML_CACHE, request.method == "HEAD")
+
+    def mount(self, prefix: str) -> "StaticAssetApp":
+        return StaticAssetApp(self, prefix)
+
+
+class StaticAssetApp:
+    """ASGI app serving one asset directory (/css, /js) from the store."""
+
+    def __init__(self, store: StaticAssetStore, prefix: str):
+        self.store = store
+        self.prefix = prefix.rstrip("/")
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        self.store.ensure_loaded()
+        if scope["method"] not in ("GET", "HEAD"):
+            response: Response = PlainTextResponse("Method Not Allowed", status_code=405)
+            await response(scope, receive, send)
+            return
+
+        path = scope["path"]
+        url = path if path.startswith(self.prefix + "/") else self.prefix + path
+        asset = self.store.assets.get(url)
+        if asset is None:
+            response = PlainTextResponse("Not Found", status_code=404)
+            await response(scope, receive, send)
+            return
+
+        request = Request(scope)
+        version = request.query_params.get("v")
+        cache_control = (
+            IMMUTABLE_CACHE if version == asset.digest
+            else f"public, max-age={STATIC_CACHE_MAX_AGE}"
+        )
+        response = _asset_response(asset, request.headers, cache_control, scope["method"] == "HEAD")
+        await response(scope, receive, send)
@@ -0,0 +1,97 @@
+"""DB 엔진 프로파일 부하 벤치마크
+
+기본 create_engine 과 app.database.build_engine(풀/PRAGMA 튜닝)을 같은 부하로 비교한다.
+스레드 N개가 각각 INSERT+COMMIT 과 SELECT 를 섞어 반복하며,
+처리량·p99 지연·'database is locked'/풀 타임아웃 오류 수를 출력한다.
+
+    python bench_db_pool.py                       # 임시 SQLite 파일
+    python bench_db_pool.py postgresql://...      # PostgreSQL (풀 설정 비교)
+"""
+
+import os
+import sys
+import tempfile
+import threading
+import time
+
+sys.path.insert(0, os.path.dirname(__file__))
+
+from sqlalchemy import create_engine, text
+
+from app.database import build_engine, pool_status
+
+THREADS = int(os.getenv("BENCH_THREADS", "16"))
+OPS_PER_THREAD = int(os.getenv("BENCH_OPS", "200"))
+
+
+def run(engine, label: str) -> None:
+    with engine.begin() as conn:
+        conn.execute(text("DROP TABLE IF EXISTS bench_chat"))
+        conn.execute(text("CREATE TABLE bench_chat (id INTEGER PRIMARY KEY, body TEXT)"))
+
+    latencies: list[float] = []
+    errors: list[str] = []
+    lock = threading.Lock()
+
+    def worker(n: int) -> None:
+        local_lat, local_err = [], []
+        for i in range(OPS_PER_THREAD):
+            start = time.perf_counter()
+            try:
+                with engine.begin() as conn:
+                    if i % 4 == 0:
+                        conn.execute(text("SELECT COUNT(*) FROM bench_chat")).scalar()
+                    else:
+                        conn.execute(
+                            text("INSERT INTO bench_chat (body) VALUES (:b)"),
+                            {"b": f"thread{n}-msg{i}" * 4},
+                        )
+            except Exception as exc:
+                local_err.append(type(exc).__name__ + ": " + str(exc).splitlines()[0][:60])
+            local_lat.append(time.perf_counter() - start)
+        with lock:
+            latencies.extend(local_lat)
+            errors.extend(local_err)
+
+    threads = [threading.Thread(target=worker, args=(n,)) for n in range(THREADS)]
+    start = time.perf_counter()
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    elapsed = time.perf_counter() - start
+
+    latencies.sort()
+    p50 = latencies[len(latencies) // 2] * 1000
+    p99 = latencies[int(len(latencies) * 0.99) - 1] * 1000
+    total = THREADS * OPS_PER_THREAD
+    print(
+        f"{label:10s} ops={total} {total / elapsed:8.0f} ops/s  "
+        f"p50={p50:6.1f}ms p99={p99:7.1f}ms errors={len(errors)}  pool={pool_status(engine)}"
+    )
+    for msg in sorted(set(errors))[:3]:
+        print(f"           e.g. {msg}")
+
+    with engine.begin() as conn:
+        conn.execute(text("DROP TABLE IF EXISTS bench_chat"))
+    engine.dispose()
+
+
+def main():
+    if len(sys.argv) > 1:
+        url = sys.argv[1]
+        run(create_engine(url), "default")
+        run(build_engine(url), "tuned")
+        return
+
+    with tempfile.TemporaryDirectory() as tmp:
+        # 기본값: sqlite3 의 5초 lock 대기 → 오류를 드러내기 위해 0.1초로 맞춤
+        run(
+            create_engine(f"sqlite:///{tmp}/default.db", connect_args={"check_same_thread": False, "timeout": 0.1}),
+            "default",
+        )
+        run(build_engine(f"sqlite:///{tmp}/tuned.db"), "tuned")
+
+
+if __name__ == "__main__":
+    main()
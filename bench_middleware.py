@@ -0,0 +1,104 @@
+"""미들웨어 per-request 오버헤드 마이크로벤치마크
+
+기존 BaseHTTPMiddleware 구현과 pure ASGI 구현(app.middleware)을
+동일한 최소 Starlette 앱에 씌워 ASGI 호출을 직접 반복하고 요청당 평균 시간을 비교한다.
+
+    python bench_middleware.py [반복 횟수]
+"""
+
+import asyncio
+import logging
+import os
+import sys
+import time
+import uuid
+
+sys.path.insert(0, os.path.dirname(__file__))
+
+from starlette.applications import Starlette
+from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.responses import PlainTextResponse
+from starlette.routing import Route
+
+from app.middleware import RequestLoggingMiddleware, SecurityHeadersMiddleware
+
+
+class LegacySecurityHeadersMiddleware(BaseHTTPMiddleware):
+    async def dispatch(self, request, call_next):
+        response = await call_next(request)
+        response.headers["X-Content-Type-Options"] = "nosniff"
+        response.headers["X-Frame-Options"] = "DENY"
+        response.headers["X-XSS-Protection"] = "1; mode=block"
+        response.headers["Referrer-Policy"] = "strict-origin-when-cross-origin"
+        response.headers["Permissions-Policy"] = "camera=(), microphone=(), geolocation=()"
+        return response
+
+
+class LegacyRequestLoggingMiddleware(BaseHTTPMiddleware):
+    async def dispatch(self, request, call_next):
+        request_id = str(uuid.uuid4())[:8]
+        start = time.perf_counter()
+        response = await call_next(request)
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        response.headers["X-Request-ID"] = request_id
+        logging.getLogger("acchelper").info(
+            "req_id=%s method=%s path=%s status=%d duration=%.1fms",
+            request_id, request.method, request.url.path, response.status_code, elapsed_ms,
+        )
+        return response
+
+
+async def ping(request):
+    return PlainTextResponse("pong")
+
+
+def build_app_bare():
+    return Starlette(routes=[Route("/ping", ping)])
+
+
+def build_app(logging_cls, security_cls):
+    app = Starlette(routes=[Route("/ping", ping)])
+    app.add_middleware(logging_cls)
+    app.add_middleware(security_cls)
+    return app
+
+
+async def run(app, iterations: int) -> float:
+    scope = {
+        "type": "http", "asgi": {"version": "3.0"}, "http_version": "1.1",
+        "method": "GET", "scheme": "http", "path": "/ping", "raw_path": b"/ping",
+        "query_string": b"", "root_path": "", "headers": [(b"host", b"bench")],
+        "client": ("127.0.0.1", 1234), "server": ("bench", 80),
+    }
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        pass
+
+    for _ in range(200):  # warm-up
+        await app(dict(scope), receive, send)
+
+    start = time.perf_counter()
+    for _ in range(iterations):
+        await app(dict(scope), receive, send)
+    return (time.perf_counter() - start) / iterations * 1_000_000
+
+
+def main():
+    iterations = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+    logging.disable(logging.CRITICAL)  # 로그 I/O 는 측정에서 제외
+
+    bare = asyncio.run(run(build_app_bare(), iterations))
+    legacy = asyncio.run(run(build_app(LegacyRequestLoggingMiddleware, LegacySecurityHeadersMiddleware), iterations))
+    asgi = asyncio.run(run(build_app(RequestLoggingMiddleware, SecurityHeadersMiddleware), iterations))
+
+    print(f"iterations={iterations}")
+    print(f"no middleware        : {bare:8.1f} us/req")
+    print(f"BaseHTTPMiddleware   : {legacy:8.1f} us/req (overhead {legacy - bare:6.1f} us)")
+    print(f"pure ASGI middleware : {asgi:8.1f} us/req (overhead {asgi - bare:6.1f} us)")
+
+
+if __name__ == "__main__":
+    main()
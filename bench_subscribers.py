@@ -0,0 +1,107 @@
+"""구독 현황(list_subscribers) 쿼리 수 벤치마크
+
+회사 N개(관리자·빌링키·결제 내역 포함)를 임시 SQLite 에 만들고,
+회사마다 3개 쿼리를 날리던 기존 방식과 GROUP BY 서브쿼리 조인 방식의
+쿼리 수·소요 시간을 비교한다. 새 방식은 N 과 무관하게 쿼리 2개(COUNT + 페이지).
+
+    python bench_subscribers.py [회사 수 ...]      # 기본: 50 200 1000
+"""
+
+import os
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.dirname(__file__))
+os.environ.setdefault("APP_ENV", "development")
+
+from sqlalchemy import event, func
+from sqlalchemy.orm import sessionmaker
+
+from app.database import Base, build_engine
+from app.models.admin_user import AdminUser
+from app.models.billing import BillingKey, PaymentHistory
+from app.models.company import Company
+from app.routers.admin_dashboard import list_subscribers
+
+TABLES = [Company.__table__, AdminUser.__table__, BillingKey.__table__, PaymentHistory.__table__]
+
+
+def seed(db, n: int) -> None:
+    now = datetime(2026, 1, 1)
+    db.add_all(Company(company_id=i, company_name=f"아파트{i}", subscription_plan="enterprise") for i in range(1, n + 1))
+    db.add_all(
+        AdminUser(company_id=i, email=f"a{i}_{k}@x.kr", password_hash="-")
+        for i in range(1, n + 1) for k in range(3)
+    )
+    db.add_all(BillingKey(id=i, company_id=i, customer_key=f"c{i}", billing_key=f"b{i}") for i in range(1, n + 1))
+    db.add_all(
+        PaymentHistory(
+            company_id=i, billing_key_id=i, order_id=f"o{i}_{m}", order_name="구독",
+            amount=53900, status="success", paid_at=now - timedelta(days=30 * m),
+        )
+        for i in range(1, n + 1) for m in range(6)
+    )
+    db.commit()
+
+
+def legacy(db) -> int:
+    """회사마다 빌링키 / 관리자 수 / 결제 합계를 따로 조회하던 기존 구현."""
+    companies = db.query(Company).filter(Company.deleted_at == None).order_by(Company.company_id).all()
+    for c in companies:
+        db.query(BillingKey).filter(BillingKey.company_id == c.company_id, BillingKey.is_active == True).first()
+        db.query(func.count(AdminUser.user_id)).filter(AdminUser.company_id == c.company_id).scalar()
+        db.query(
+            func.coalesce(func.sum(PaymentHistory.amount), 0),
+            func.count(PaymentHistory.id),
+            func.max(PaymentHistory.paid_at),
+        ).filter(PaymentHistory.company_id == c.company_id, PaymentHistory.status == "success").first()
+    return len(companies)
+
+
+def current(db) -> int:
+    resp = list_subscribers(
+        page=1, size=50, plan=None, approval_status=None, q=None,
+        sort="total_paid", order="desc", db=db, user={},
+    )
+    return resp.total
+
+
+def measure(engine, fn) -> tuple[int, float]:
+    queries = 0
+
+    def count(*args):
+        nonlocal queries
+        queries += 1
+
+    event.listen(engine, "before_cursor_execute", count)
+    db = sessionmaker(bind=engine)()
+    try:
+        start = time.perf_counter()
+        fn(db)
+        return queries, (time.perf_counter() - start) * 1000
+    finally:
+        db.close()
+        event.remove(engine, "before_cursor_execute", count)
+
+
+def main():
+    sizes = [int(a) for a in sys.argv[1:]] or [50, 200, 1000]
+    with tempfile.TemporaryDirectory() as tmp:
+        for n in sizes:
+            engine = build_engine(f"sqlite:///{tmp}/bench_{n}.db")
+            Base.metadata.create_all(engine, tables=TABLES)
+            with sessionmaker(bind=engine)() as db:
+                seed(db, n)
+            lq, lms = measure(engine, legacy)
+            cq, cms = measure(engine, current)
+            print(
+                f"companies={n:5d}  per-company: {lq:5d} queries {lms:8.1f}ms   "
+                f"set-based(page 50): {cq:2d} queries {cms:7.1f}ms"
+            )
+            engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
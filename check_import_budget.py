@@ -0,0 +1,66 @@
+"""워커 import-time 예산 검사
+
+`python -X importtime -c "import app.main"` 을 새 프로세스로 실행해
+1) 누적 import 시간이 예산(IMPORT_BUDGET_MS, 기본 1500ms) 이하인지,
+2) 무거운 선택 의존성(openpyxl, openai, pgvector, numpy, httpx, PIL)이
+   부팅 시 로드되지 않는지 확인한다. 위반 시 종료 코드 1.
+
+    python check_import_budget.py
+"""
+
+import os
+import re
+import subprocess
+import sys
+
+BUDGET_MS = float(os.getenv("IMPORT_BUDGET_MS", "1500"))
+LAZY_MODULES = ("openpyxl", "openai", "pgvector", "numpy", "httpx", "PIL")
+
+_LINE_RE = re.compile(r"import time:\s+(\d+) \|\s+(\d+) \|(\s*)(\S+)")
+
+
+def main() -> int:
+    env = {**os.environ, "APP_ENV": os.getenv("APP_ENV", "development")}
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import app.main"],
+        cwd=os.path.dirname(os.path.abspath(__file__)),
+        env=env,
+        capture_output=True,
+        text=True,
+    )
+    if proc.returncode != 0:
+        print(proc.stderr[-2000:])
+        return 1
+
+    total_us = 0
+    modules: set[str] = set()
+    direct: dict[str, int] = {}  # direct imports of app.main → cumulative us
+    for line in proc.stderr.splitlines():
+        m = _LINE_RE.match(line)
+        if not m:
+            continue
+        self_us, cum_us, indent, name = int(m.group(1)), int(m.group(2)), m.group(3), m.group(4)
+        total_us += self_us
+        modules.add(name.split(".")[0])
+        if len(indent) == 3:
+            direct[name] = cum_us
+
+    failures = []
+    loaded = sorted(modules & set(LAZY_MODULES))
+    if loaded:
+        failures.append(f"eagerly imported: {', '.join(loaded)}")
+    total_ms = total_us / 1000
+    if total_ms > BUDGET_MS:
+        failures.append(f"import time {total_ms:.0f}ms > budget {BUDGET_MS:.0f}ms")
+
+    print(f"import app.main: {total_ms:.0f}ms (budget {BUDGET_MS:.0f}ms)")
+    for name, us in sorted(direct.items(), key=lambda x: x[1], reverse=True)[:10]:
+        print(f"  {us / 1000:8.1f}ms  {name}")
+
+    for f in failures:
+        print(f"FAIL: {f}")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -105,6 +105,13 @@ function getOrCreateSessionId() {
    ============================================================ */
 
 var CTA_LOG_QUEUE_KEY = 'kakao_cta_failed_logs';
+var CTA_BATCH_URL = '/api/cta-logs/batch';
+var CTA_FLUSH_DELAY_MS = 1000;
+
+// Events are batched in memory and sent together (one request per ~1s),
+// flushed immediately on kakao_redirect and when the page is hidden.
+var _ctaPending = [];
+var _ctaFlushTimer = null;
 
 function logCtaClick(ctaType, pagePath, visitorType, funnelStep, sessionId) {
     var payload = {
@@ -124,16 +131,51 @@ function logCtaClick(ctaType, pagePath, visitorType, funnelStep, sessionId) {
     if (utm.utm_campaign) payload.utm_campaign = utm.utm_campaign;
 
     // Fire-and-forget: never block navigation
-    return fetch('/api/cta-logs', {
+    _ctaPending.push(payload);
+    if (funnelStep === 'kakao_redirect') {
+        flushCtaLogs();
+    } else if (!_ctaFlushTimer) {
+        _ctaFlushTimer = setTimeout(flushCtaLogs, CTA_FLUSH_DELAY_MS);
+    }
+}
+
+function _sendCtaBatch(events) {
+    var body = JSON.stringify(events);
+    // sendBeacon survives page unload; text/plain avoids a CORS preflight
+    if (navigator.sendBeacon) {
+        try {
+            if (navigator.sendBeacon(CTA_BATCH_URL, new Blob([body], { type: 'text/plain' }))) return;
+        } catch (e) {
+            // fall through to fetch
+        }
+    }
+    fetch(CTA_BATCH_URL, {
         method: 'POST',
         headers: { 'Content-Type': 'application/json' },
-        body: JSON.stringify(payload)
+        body: body,
+        keepalive: true
     }).catch(function () {
         // On failure, queue for retry in localStorage
-        _enqueueFailedLog(payload);
+        events.forEach(_enqueueFailedLog);
     });
 }
 
+function flushCtaLogs() {
+    if (_ctaFlushTimer) {
+        clearTimeout(_ctaFlushTimer);
+        _ctaFlushTimer = null;
+    }
+    if (_ctaPending.length === 0) return;
+    var events = _ctaPending;
+    _ctaPending = [];
+    _sendCtaBatch(events);
+}
+
+document.addEventListener('visibilitychange', function () {
+    if (document.visibilityState === 'hidden') flushCtaLogs();
+});
+window.addEventListener('pagehide', flushCtaLogs);
+
 function _enqueueFailedLog(payload) {
     try {
         var queue = JSON.parse(localStorage.getItem(CTA_LOG_QUEUE_KEY) || '[]');
@@ -167,15 +209,8 @@ function retryFailedLogs() {
     // Clear immediately so concurrent loads don't double-send
     localStorage.removeItem(CTA_LOG_QUEUE_KEY);
 
-    queue.forEach(function (payload) {
-        fetch('/api/cta-logs', {
-            method: 'POST',
-            headers: { 'Content-Type': 'application/json' },
-            body: JSON.stringify(payload)
-        }).catch(function () {
-            _enqueueFailedLog(payload);
-        });
-    });
+    // One batch request for the whole retry queue
+    _sendCtaBatch(queue);
 }
 
 /* ============================================================
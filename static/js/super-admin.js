@@ -95,9 +95,14 @@ async function loadSubscribers() {
     loading.classList.add('show');
 
     try {
-        const data = await apiGet('/admin-dashboard/subscribers');
-        const items = data.subscribers || data.items || data;
-        const list = Array.isArray(items) ? items : [];
+        // 서버 페이지네이션 — 회사 필터 드롭다운용으로 전체 페이지를 이어 받는다
+        let items = [];
+        for (let page = 1; ; page++) {
+            const data = await apiGet(`/admin-dashboard/subscribers?page=${page}&size=500`);
+            items = items.concat(data.items || []);
+            if (page >= (data.pages || 1)) break;
+        }
+        const list = items;
 
         // Build cache for modal lookup
         subscriberCache = {};
@@ -589,6 +594,31 @@ async function downloadTemplate() {
     }
 }
 
+function renderUploadResult(result) {
+    const resultDiv = document.getElementById('uploadResult');
+    resultDiv.style.display = 'block';
+
+    const running = result.status === 'queued' || result.status === 'running';
+    const progress = running && result.progress != null ? ` (${result.progress}%)` : '';
+    document.getElementById('uploadResultStats').innerHTML = `
+        <div class="upload-stat-item total"><span class="upload-stat-label">${running ? '처리 중' + progress : '전체 행'}</span><span class="upload-stat-value">${result.total_rows || 0}</span></div>
+        <div class="upload-stat-item success"><span class="upload-stat-label">등록 성공</span><span class="upload-stat-value">${result.created || 0}</span></div>
+        <div class="upload-stat-item skipped"><span class="upload-stat-label">건너뜀</span><span class="upload-stat-value">${result.skipped || 0}</span></div>
+        <div class="upload-stat-item failed"><span class="upload-stat-label">실패</span><span class="upload-stat-value">${result.failed || 0}</span></div>
+    `;
+
+    const errorsDiv = document.getElementById('uploadResultErrors');
+    if (result.errors && result.errors.length > 0) {
+        errorsDiv.style.display = 'block';
+        errorsDiv.innerHTML = '<h5>오류 상세</h5><ul>' +
+            result.errors.map(e => `<li>${escapeHtml(typeof e === 'string' ? e : (e.row ? '행 ' + e.row + ': ' : '') + (e.message || e.error || JSON.stringify(e)))}</li>`).join('') +
+            (result.errors_truncated ? `<li>외 ${result.errors_truncated}건</li>` : '') +
+            '</ul>';
+    } else {
+        errorsDiv.style.display = 'none';
+    }
+}
+
 async function uploadExcel() {
     const companyId = document.getElementById('uploadCompany').value;
     if (!companyId) { showToast('회사를 선택해 주세요.', 'error'); return; }
@@ -604,32 +634,22 @@ async function uploadExcel() {
     formData.append('file', fileInput.files[0]);
 
     try {
-        const result = await apiFetch('/super/qa/upload?company_id=' + companyId, {
+        let result = await apiFetch('/super/qa/upload?company_id=' + companyId, {
             method: 'POST',
             body: formData,
         });
 
-        const resultDiv = document.getElementById('uploadResult');
-        resultDiv.style.display = 'block';
-
-        document.getElementById('uploadResultStats').innerHTML = `
-            <div class="upload-stat-item total"><span class="upload-stat-label">전체 행</span><span class="upload-stat-value">${result.total_rows || 0}</span></div>
-            <div class="upload-stat-item success"><span class="upload-stat-label">등록 성공</span><span class="upload-stat-value">${result.created || 0}</span></div>
-            <div class="upload-stat-item skipped"><span class="upload-stat-label">건너뜀</span><span class="upload-stat-value">${result.skipped || 0}</span></div>
-            <div class="upload-stat-item failed"><span class="upload-stat-label">실패</span><span class="upload-stat-value">${result.failed || 0}</span></div>
-        `;
-
-        const errorsDiv = document.getElementById('uploadResultErrors');
-        if (result.errors && result.errors.length > 0) {
-            errorsDiv.style.display = 'block';
-            errorsDiv.innerHTML = '<h5>오류 상세</h5><ul>' +
-                result.errors.map(e => `<li>${escapeHtml(typeof e === 'string' ? e : (e.row ? '행 ' + e.row + ': ' : '') + (e.message || e.error || JSON.stringify(e)))}</li>`).join('') +
-                '</ul>';
-        } else {
-            errorsDiv.style.display = 'none';
+        // 백그라운드 작업 — 끝날 때까지 진행 상황을 폴링
+        renderUploadResult(result);
+        while (result.status === 'queued' || result.status === 'running') {
+            await new Promise(resolve => setTimeout(resolve, 1000));
+            result = await apiFetch('/super/qa/upload/' + result.job_id);
+            renderUploadResult(result);
         }
 
-        if ((result.created || 0) > 0) {
+        if (result.status === 'failed') {
+            showToast('업로드 처리 중 오류가 발생했습니다: ' + (result.error || ''), 'error');
+        } else if ((result.created || 0) > 0) {
             showToast(`${result.created}건의 Q&A가 등록되었습니다.`, 'success');
         }
     } catch (e) {